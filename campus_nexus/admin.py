@@ -4,8 +4,8 @@ from django.contrib import admin, messages
 from django import forms
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
-from django.db.models import Count, Q, Sum
-from django.http import HttpResponseForbidden, HttpResponseRedirect
+from django.db.models import Q, Sum
+from django.http import HttpResponseForbidden, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import redirect, render
 from django.template.response import TemplateResponse
 from django.urls import path, resolve
@@ -14,19 +14,20 @@ from django.utils.html import format_html
 from django.views.decorators.http import require_http_methods
 
 from campus_nexus.models import (
-    Announcement, Association, AssociationAdmin, AuditLog,
+    Announcement, Association, AssociationAdmin, AssociationMonthlyLedger, AuditLog,
     Bill, BillableItem, BillMembership,
     Cabinet, CabinetMember, Charge, Course,
-    Dean, Event, Expense, Faculty, Fee, Feedback,
+    Dean, EmailOutbox, Event, Expense, Faculty, Fee, Feedback,
     Guild, GuildCabinet, GuildExecutive,
-    Member, Membership, Payment,
+    Member, MemberImportRun, Membership, Payment, SyncTombstone,
 )
+from campus_nexus.services.billing import annotate_bill_membership_paid, annotate_bill_totals
 from campus_nexus.services.charges import get_or_create_charge_for_fee, create_charge_custom
-from .notifications.email_utils import send_payment_recorded_email
-from campus_nexus.services.subscriptions import ensure_current_subscription_charge, recompute_overdue_flags_for_association
 from campus_nexus.services.subscription_emails import send_subscription_reminder_email
 from campus_nexus.services.audit import record_audit_event
+from campus_nexus.services.member_export import csv_lines, export_member_rows
 from campus_nexus.services.onboarding import send_onboarding_invitation_email
+from campus_nexus.services.payments import post_payment
 
 # ---------------------------------------------------------------------
 # Mixins
@@ -283,7 +284,7 @@ class AssociationAdminAdmin(SuperuserOnlyMixin, admin.ModelAdmin):
             return
 
         if sent:
-            messages.success(request, f"Invitation email sent to {obj.user.email}.")
+            messages.success(request, f"Invitation email queued for {obj.user.email}.")
             return
 
         messages.warning(
@@ -570,6 +571,7 @@ class MemberAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
     readonly_fields = ("photo_preview", "created_at", "created_by", "created_in_association")
     ordering = ("first_name", "last_name")
     list_filter = ("member_type", "faculty", "course")
+    actions = ("export_selected_to_csv",)
     fieldsets = (
         ("Profile Photo", {"fields": ("photo_preview", "photo")}),
         ("Personal Details", {"fields": ("first_name", "last_name", "email", "phone", "nationality", "member_type")}),
@@ -618,6 +620,24 @@ class MemberAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
             return base_readonly
         return [f.name for f in self.model._meta.fields] + base_readonly
 
+    def _exportable_associations(self, request):
+        # Association names the export may list: all of them for roles that can view every
+        # association, only their own for an association admin.
+        if request.user.is_superuser or self.is_guild_admin(request) or self.is_dean(request):
+            return None
+        assoc_admin = self.get_association_admin(request)
+        if assoc_admin is not None:
+            return Association.objects.filter(pk=assoc_admin.association_id)
+        return Association.objects.none()
+
+    @admin.action(description="Export selected members to CSV")
+    def export_selected_to_csv(self, request, queryset):
+        # Streamed in the import_members_csv layout, so the file can be edited and imported back.
+        rows = export_member_rows(queryset, associations=self._exportable_associations(request))
+        response = StreamingHttpResponse(csv_lines(rows), content_type="text/csv")
+        response["Content-Disposition"] = f'attachment; filename="members-{timezone.localdate():%Y%m%d}.csv"'
+        return response
+
     def photo_thumb(self, obj):
         if obj and obj.photo:
             return format_html(
@@ -1261,6 +1281,8 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
         "title",
         "description",
         "amount_due",
+        "amount_paid",
+        "balance",
         "due_date",
         "period_start",
         "period_end",
@@ -1317,21 +1339,13 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
         today = timezone.localdate()
         due_soon_cutoff = today + timedelta(days=3)
 
-        qs = Charge.objects.select_related("membership__member", "association", "fee").annotate(
-            paid_total=Sum("payments__amount_paid")
-        )
+        qs = Charge.objects.select_related("membership__member", "association", "fee")
 
         # scope data to association admin
+        # (current-cycle charges and overdue flags are maintained by `roll_subscription_cycles`)
         assoc_admin = getattr(request.user, "association_admin", None)
         if assoc_admin and not request.user.is_superuser:
-            assoc_id = assoc_admin.association_id
-
-            # keep status/overdue fresh & ensure current cycle exists (your existing behavior)
-            recompute_overdue_flags_for_association(assoc_id)
-            for m in assoc_admin.association.memberships.all().select_related("association"):
-                ensure_current_subscription_charge(m)
-
-            qs = qs.filter(association_id=assoc_id)
+            qs = qs.filter(association_id=assoc_admin.association_id)
 
         # only subscription charges that are not cleared
         qs = qs.filter(
@@ -1369,7 +1383,7 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
 
         self.message_user(
             request,
-            f"Reminder run complete ({title}). Emails sent: {sent}. Missing member email: {missing}.",
+            f"Reminder run complete ({title}). Emails queued: {sent}. Missing member email or already queued today: {missing}.",
             level=messages.SUCCESS,
         )
         return redirect("..")
@@ -1382,7 +1396,6 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
             super()
             .get_queryset(request)
             .select_related("membership", "membership__member", "association", "fee")
-            .annotate(paid_total=Sum("payments__amount_paid"))
         )
 
         if request.user.is_superuser:
@@ -1390,13 +1403,7 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
 
         assoc_admin = getattr(request.user, "association_admin", None)
         if assoc_admin:
-            # Keep fresh for their association
-            recompute_overdue_flags_for_association(assoc_admin.association_id)
-
-            # Ensure current cycle exists (you already do this)
-            for m in assoc_admin.association.memberships.all().select_related("association"):
-                ensure_current_subscription_charge(m)
-
+            # Read-only: current cycles are created by the scheduled `roll_subscription_cycles` run.
             return qs.filter(association=assoc_admin.association)
 
         return qs.none()
@@ -1415,8 +1422,9 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
     period.short_description = "Period"
 
     def amount_paid_col(self, obj):
-        return f"{obj.amount_paid_total}"
+        return f"{obj.amount_paid}"
     amount_paid_col.short_description = "Paid"
+    amount_paid_col.admin_order_field = "amount_paid"
 
     def balance_col(self, obj):
         bal = obj.balance
@@ -1424,6 +1432,7 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
             return format_html("<b style='color:green;'>0</b>")
         return format_html("<b style='color:#b45309;'>{}</b>", bal)
     balance_col.short_description = "Balance"
+    balance_col.admin_order_field = "balance"
 
     def bill_link(self, obj):
         if obj.bill_membership:
@@ -1463,7 +1472,7 @@ class ChargeAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
 
         self.message_user(
             request,
-            f"Selected reminders sent: {sent}. Members missing email: {missing}.",
+            f"Selected reminders queued: {sent}. Missing member email or already queued today: {missing}.",
             level=messages.SUCCESS,
         )
 class PaymentAdminForm(forms.ModelForm):
@@ -1699,20 +1708,8 @@ class PaymentAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
                 )
             obj.charge = charge
 
-        super().save_model(request, obj, form, change)
-
-        # Recompute charge status after saving payment
-        if obj.charge_id:
-            obj.charge.recompute_status()
-            obj.charge.save(update_fields=["status"])
-
-        # Email notification after commit
-        transaction.on_commit(lambda: send_payment_recorded_email(
-            member=obj.membership.member,
-            association=obj.membership.association,
-            payment=obj,
-            charge=obj.charge,
-        ))
+        # Locks the charge, refreshes charge/bill totals once and queues the receipt email.
+        post_payment(obj)
         record_audit_event(
             actor=request.user,
             action="payment_recorded" if not change else "payment_updated",
@@ -2027,6 +2024,135 @@ class AuditLogAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
         return False
 
 
+@admin.register(AssociationMonthlyLedger)
+class AssociationMonthlyLedgerAdmin(admin.ModelAdmin):
+    list_display = ("association", "month", "income", "expenses", "payment_count", "expense_count", "updated_at")
+    list_filter = ("association", "month")
+    search_fields = ("association__name",)
+    readonly_fields = (
+        "association",
+        "month",
+        "income",
+        "expenses",
+        "payment_count",
+        "expense_count",
+        "updated_at",
+    )
+    ordering = ("association", "-month")
+
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return self.has_module_permission(request)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ("created_at", "to_email", "subject", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("status", "created_at")
+    search_fields = ("to_email", "subject", "dedup_key")
+    readonly_fields = (
+        "to_email",
+        "from_email",
+        "subject",
+        "body",
+        "dedup_key",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "last_error",
+        "created_at",
+        "sent_at",
+    )
+    ordering = ("-created_at",)
+    actions = ("retry_now",)
+
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return self.has_module_permission(request)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return request.user.is_superuser
+
+    @admin.action(description="Retry selected emails now")
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status="sent").update(
+            status="pending",
+            attempts=0,
+            next_attempt_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} email(s) re-queued.", level=messages.SUCCESS)
+
+
+@admin.register(SyncTombstone)
+class SyncTombstoneAdmin(admin.ModelAdmin):
+    list_display = ("deleted_at", "association", "kind", "object_id")
+    list_filter = ("kind", "deleted_at")
+    search_fields = ("object_id",)
+    readonly_fields = ("association", "kind", "object_id", "deleted_at")
+    ordering = ("-deleted_at",)
+
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return self.has_module_permission(request)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(MemberImportRun)
+class MemberImportRunAdmin(admin.ModelAdmin):
+    list_display = ("started_at", "csv_path", "status", "last_line", "created_count", "updated_count", "skipped_count")
+    list_filter = ("status", "started_at")
+    search_fields = ("csv_path", "file_hash")
+    readonly_fields = (
+        "csv_path", "file_hash", "status", "last_line", "byte_offset", "created_count", "updated_count",
+        "skipped_count", "error", "started_at", "updated_at",
+    )
+    ordering = ("-started_at",)
+
+    def has_module_permission(self, request):
+        return request.user.is_superuser
+
+    def has_view_permission(self, request, obj=None):
+        return self.has_module_permission(request)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(Feedback)
 class FeedbackAdmin(admin.ModelAdmin):
     list_display = ("subject", "association", "member", "submitted_by", "submitted_at")
@@ -2397,13 +2523,7 @@ class BillAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
     total_balance_formatted.short_description = "Total Balance"
     
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        qs = qs.annotate(
-            members_count=Count('memberships', filter=~Q(memberships__status='cancelled'), distinct=True),
-            total_due=Sum('memberships__amount_due', filter=~Q(memberships__status='cancelled')),
-            total_collected=Sum('memberships__charges__payments__amount_paid', filter=Q(memberships__charges__payments__status='recorded')),
-            total_waived=Sum('memberships__amount_waived', filter=~Q(memberships__status='cancelled'))
-        )
+        qs = annotate_bill_totals(super().get_queryset(request))
         if request.user.is_superuser or self.is_guild_admin(request) or self.is_dean(request):
             return qs
         assoc_admin = getattr(request.user, "association_admin", None)
@@ -2545,10 +2665,7 @@ class BillMembershipAdmin(CheckUserIdentityMixin, admin.ModelAdmin):
     balance_formatted.short_description = "Balance"
     
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        qs = qs.annotate(
-            paid_total=Sum('charges__payments__amount_paid', filter=Q(charges__payments__status='recorded'))
-        )
+        qs = annotate_bill_membership_paid(super().get_queryset(request))
         if request.user.is_superuser or self.is_guild_admin(request) or self.is_dean(request):
             return qs
         assoc_admin = getattr(request.user, "association_admin", None)
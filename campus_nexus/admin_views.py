@@ -4,8 +4,8 @@ from django.http import HttpResponseForbidden, JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib import admin as dj_admin, messages
 from django.utils import timezone
-from django.db.models import Sum, Count, Q
 from .models import Bill, BillMembership, Membership, Association, BillableItem
+from .services.billing import annotate_bill_totals, outstanding_bill_memberships, parse_outstanding_cursor
 
 def _admin_ctx(request):
     """Return the full Django admin context needed to render the sidebar/navigation."""
@@ -138,57 +138,38 @@ def billing_dashboard(request, association_id=None):
             'no_association': True,
          })
     
-    # Get statistics using annotations to fix N+1
-    bills = Bill.objects.filter(association=association, status='active').annotate(
-        members_count=Count('memberships', filter=~Q(memberships__status='cancelled'), distinct=True),
-        total_due=Sum('memberships__amount_due', filter=~Q(memberships__status='cancelled')),
-        total_collected=Sum('memberships__charges__payments__amount_paid', filter=Q(memberships__charges__payments__status='recorded')),
-        total_waived=Sum('memberships__amount_waived', filter=~Q(memberships__status='cancelled'))
-    )
+    # Per-bill correlated subqueries: no membership x charge x payment fan-out.
+    bills = list(annotate_bill_totals(Bill.objects.filter(association=association, status='active')))
     
-    total_billed = sum(b.total_due or 0 for b in bills)
-    total_collected = sum(b.total_collected or 0 for b in bills)
-    total_waived = sum(b.total_waived or 0 for b in bills)
+    total_billed = sum(b.total_due for b in bills)
+    total_collected = sum(b.total_collected for b in bills)
+    total_waived = sum(b.total_waived for b in bills)
     total_outstanding = total_billed - total_collected - total_waived
     bills_count = len(bills)
-    members_count = sum(b.members_count or 0 for b in bills)
+    members_count = sum(b.members_count for b in bills)
     
     bill_stats = []
     
     for bill in bills:
-        b_due = bill.total_due or 0
-        b_collected = bill.total_collected or 0
-        b_waived = bill.total_waived or 0
-        b_balance = max(0, b_due - b_collected - b_waived)
+        b_due = bill.total_due
+        b_collected = bill.total_collected
+        b_balance = max(0, b_due - b_collected - bill.total_waived)
         
         bill_stats.append({
             'bill': bill,
-            'members': bill.members_count or 0,
+            'members': bill.members_count,
             'due': b_due,
             'collected': b_collected,
             'balance': b_balance,
             'paid_percentage': (b_collected / b_due * 100) if b_due > 0 else 0
         })
     
-    # Get members with outstanding balance
-    outstanding_members = BillMembership.objects.filter(
-        bill__association=association,
-        bill__status='active'
-    ).exclude(status__in=['paid', 'waived', 'cancelled']).select_related(
-        'membership__member', 'bill'
-    ).annotate(
-        paid_total=Sum('charges__payments__amount_paid', filter=Q(charges__payments__status='recorded'))
+    # Members with a positive balance, filtered and sorted in the database, paged by an (outstanding, pk) cursor.
+    outstanding_page, next_cursor = outstanding_bill_memberships(
+        association.id,
+        after=parse_outstanding_cursor(request.GET.get('after')),
     )
-    
-    outstanding_list = []
-    for bm in outstanding_members[:20]:
-        paid = bm.paid_total or 0
-        balance = bm.amount_due - paid - bm.amount_waived
-        if balance > 0:
-            outstanding_list.append({
-                'bm': bm,
-                'balance': balance
-            })
+    outstanding_list = [{'bm': bm, 'balance': bm.outstanding} for bm in outstanding_page]
     
     context = {
         **_admin_ctx(request),
@@ -201,6 +182,8 @@ def billing_dashboard(request, association_id=None):
         'members_count': members_count,
         'bill_stats': bill_stats,
         'outstanding_members': outstanding_list,
+        'outstanding_next_cursor': next_cursor,
+        'outstanding_is_first_page': not request.GET.get('after'),
         'title': f'Billing Dashboard - {association.name}',
     }
     
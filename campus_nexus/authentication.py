@@ -0,0 +1,35 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from campus_nexus.services.auth_cache import build_auth_user, get_auth_snapshot
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that reads the token's user from the auth user cache instead of
+    the database. The cached snapshot carries their association_admin / guild / dean ids,
+    so the role checks views make after authentication do not query either. The
+    active-user and revoked-token checks still run against the snapshot on every
+    request; signals drop the entry when the user or a role row changes.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        snapshot = get_auth_snapshot(user_id)
+        if snapshot is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not snapshot["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != snapshot["password_md5"]:
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return build_auth_user(snapshot)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.response import Response
+from rest_framework.validators import UniqueTogetherValidator, UniqueValidator
+from rest_framework.views import APIView
+
+from campus_nexus.renderers import DATA_PARSER_CLASSES
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """PrimaryKeyRelatedField resolving ids from a {str(pk): object} map loaded up front."""
+
+    def __init__(self, objects, **kwargs):
+        self.objects = objects
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, bool) or not isinstance(data, (int, str)):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return self.objects[str(data).strip()]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+def _as_pk(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _chunks(values: list, size: int):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+class BulkWriteView(APIView):
+    """
+    `POST <resource>/bulk/` with a JSON list of objects: items with an `id` are partial
+    updates, the others are creates.
+
+    Every item is validated before anything is written. Related ids are resolved with one
+    query per related model and unique fields are checked with one query per field (or
+    unique constraint) for the whole list. Writes use bulk_create / bulk_update in
+    API_BULK_BATCH_SIZE chunks inside one transaction, and `after_write()` does the work
+    post_save signals would have done. The response has one result per item in request
+    order; if any item is invalid nothing is written and the response is a 400. A unique
+    value taken by a concurrent request between the check and the write rolls the write
+    back and answers 409 with the same per-item results.
+    """
+    serializer_class = None
+    # Rows loaded for updates; select_related what previous_state() / after_write() read.
+    queryset = None
+    parser_classes = DATA_PARSER_CLASSES
+
+    def get_serializer_context(self):
+        return {"request": self.request, "view": self}
+
+    def get_queryset(self):
+        return self.queryset.all()
+
+    def before_create(self, objs) -> None:
+        """Defaults that Model.save() would fill in; bulk_create does not call it."""
+
+    def previous_state(self, instances):
+        """Snapshot of rows about to be updated, handed to after_write()."""
+        return None
+
+    def after_write(self, created, updated, previous) -> None:
+        """Side effects of the write, inside the same transaction."""
+
+    # --- validation ---------------------------------------------------------------------
+
+    def _prefetch_related_fields(self, items, *serializers_):
+        template = serializers_[0]
+        for name, field in list(template.fields.items()):
+            if field.read_only or not isinstance(field, serializers.PrimaryKeyRelatedField):
+                continue
+            pks = {_as_pk(item.get(field.field_name)) for item in items if isinstance(item, dict)} - {None}
+            objects = {str(pk): obj for pk, obj in field.get_queryset().in_bulk(list(pks)).items()} if pks else {}
+            for serializer in serializers_:
+                serializer.fields[name] = PrefetchedPrimaryKeyRelatedField(objects, **field._kwargs)
+
+    @staticmethod
+    def _drop_unique_validators(serializer):
+        # Checked for the whole list at once in _unique_errors().
+        for field in serializer.fields.values():
+            field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+        serializer.validators = [v for v in serializer.validators if not isinstance(v, UniqueTogetherValidator)]
+
+    def _unique_sets(self, model, writable: set[str]):
+        for field in model._meta.concrete_fields:
+            if field.unique and not field.primary_key and field.name in writable:
+                message = f"{model._meta.verbose_name} with this {field.verbose_name} already exists."
+                yield (field,), field.name, message
+        together = [(c.fields, c) for c in model._meta.total_unique_constraints]
+        together += [(fields, None) for fields in model._meta.unique_together]
+        for names, constraint in together:
+            if not writable & set(names):
+                continue
+            fields = tuple(model._meta.get_field(name) for name in names)
+            message = f"The fields {', '.join(names)} must make a unique set."
+            if constraint is not None and constraint.violation_error_message != constraint.default_violation_error_message:
+                message = str(constraint.violation_error_message)
+            yield fields, "non_field_errors", message
+
+    def _unique_errors(self, model, rows, writable: set[str], batch_size: int) -> dict[int, dict]:
+        errors: dict[int, dict] = {}
+        for fields, key_name, message in self._unique_sets(model, writable):
+            seen: dict[tuple, tuple[int, object]] = {}
+            for index, obj in rows:
+                key = tuple(getattr(obj, f.attname) for f in fields)
+                if any(v is None or v == "" for v in key):
+                    continue
+                if key in seen:
+                    errors.setdefault(index, {})[key_name] = ["Appears more than once in this request."]
+                    continue
+                seen[key] = (index, obj.pk)
+
+            attnames = [f.attname for f in fields]
+            for chunk in _chunks(list(seen), batch_size):
+                lookup = {f"{name}__in": {key[i] for key in chunk} for i, name in enumerate(attnames)}
+                for *values, pk in model._default_manager.filter(**lookup).values_list(*attnames, "pk"):
+                    hit = seen.get(tuple(values))
+                    if hit is not None and hit[1] != pk:
+                        errors.setdefault(hit[0], {})[key_name] = [message]
+        return errors
+
+    # --- request ------------------------------------------------------------------------
+
+    def post(self, request):
+        items = request.data
+        max_items = int(getattr(settings, "API_BULK_MAX_ITEMS", 5000))
+        batch_size = int(getattr(settings, "API_BULK_BATCH_SIZE", 500))
+        if not isinstance(items, list) or not items:
+            return Response({"detail": "Expected a non-empty list."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > max_items:
+            return Response({"detail": f"At most {max_items} items per request."}, status=status.HTTP_400_BAD_REQUEST)
+
+        model = self.serializer_class.Meta.model
+        context = self.get_serializer_context()
+        creator = self.serializer_class(context=context)
+        updater = self.serializer_class(context=context, partial=True)
+        self._prefetch_related_fields(items, creator, updater)
+        for serializer in (creator, updater):
+            self._drop_unique_validators(serializer)
+        writable = set()
+        for field in creator.fields.values():
+            if not field.read_only:
+                try:
+                    writable.add(model._meta.get_field(field.source).name)
+                except FieldDoesNotExist:
+                    pass
+
+        update_ids = {_as_pk(item.get("id")) for item in items if isinstance(item, dict) and "id" in item} - {None}
+        instances = self.get_queryset().in_bulk(list(update_ids)) if update_ids else {}
+        previous = self.previous_state(list(instances.values()))
+
+        errors: dict[int, dict] = {}
+        created, updated, rows, changed_fields, updated_ids = [], [], [], set(), set()
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors[index] = {"non_field_errors": ["Expected an object."]}
+                continue
+            instance = None
+            if "id" in item:
+                instance = instances.get(_as_pk(item["id"]))
+                if instance is None:
+                    errors[index] = {"id": [f"No {model._meta.verbose_name} with this id."]}
+                    continue
+                if instance.pk in updated_ids:
+                    errors[index] = {"id": ["Appears more than once in this request."]}
+                    continue
+                updated_ids.add(instance.pk)
+            serializer = updater if instance is not None else creator
+            serializer.instance = instance
+            try:
+                data = serializer.run_validation(item)
+            except serializers.ValidationError as exc:
+                errors[index] = serializers.as_serializer_error(exc)
+                continue
+
+            if instance is None:
+                obj = model(**data)
+                created.append(obj)
+            else:
+                obj = instance
+                for attr, value in data.items():
+                    setattr(obj, attr, value)
+                changed_fields.update(data)
+                updated.append(obj)
+            rows.append((index, obj, "created" if instance is None else "updated"))
+
+        unique_errors = self._unique_errors(model, [(index, obj) for index, obj, _ in rows], writable, batch_size)
+        for index, item_errors in unique_errors.items():
+            errors.setdefault(index, {}).update(item_errors)
+
+        if errors:
+            return self._invalid_response(errors, len(items), status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with transaction.atomic():
+                self.before_create(created)
+                model.objects.bulk_create(created, batch_size=batch_size)
+                if updated and changed_fields:
+                    if any(f.name == "updated_at" for f in model._meta.concrete_fields):
+                        now = timezone.now()
+                        for obj in updated:
+                            obj.updated_at = now
+                        changed_fields.add("updated_at")
+                    model.objects.bulk_update(updated, sorted(changed_fields), batch_size=batch_size)
+                self.after_write(created, updated, previous)
+        except IntegrityError:
+            # Another request wrote a conflicting row after the checks above; they now see it.
+            for obj in created:
+                obj.pk = None
+            errors = self._unique_errors(model, [(index, obj) for index, obj, _ in rows], writable, batch_size)
+            if not errors:
+                errors = {index: {"non_field_errors": ["Conflicts with a concurrent change; retry the request."]}
+                          for index, _, _ in rows}
+            return self._invalid_response(errors, len(items), status.HTTP_409_CONFLICT)
+
+        results = [{"id": obj.pk, "status": outcome} for _, obj, outcome in rows]
+        return Response({"created": len(created), "updated": len(updated), "results": results})
+
+    @staticmethod
+    def _invalid_response(errors: dict[int, dict], count: int, status_code: int) -> Response:
+        results = [
+            {"status": "invalid", "errors": errors[i]} if i in errors else {"status": "valid"}
+            for i in range(count)
+        ]
+        return Response({"created": 0, "updated": 0, "results": results}, status=status_code)
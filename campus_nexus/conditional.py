@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+from campus_nexus.query_optimizer import sparse_params
+
+
+def _has_updated_at(model) -> bool:
+    try:
+        model._meta.get_field("updated_at")
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _included_updated_at_paths(model, include: tuple) -> list[str]:
+    """`membership.member` -> ["membership__updated_at", "membership__member__updated_at"] where those exist."""
+    paths = set()
+    for dotted in include:
+        current, prefix = model, ""
+        for part in dotted.split("."):
+            try:
+                current = current._meta.get_field(part).related_model
+            except FieldDoesNotExist:
+                break
+            if current is None:
+                break
+            prefix = f"{prefix}__{part}" if prefix else part
+            if _has_updated_at(current):
+                paths.add(f"{prefix}__updated_at")
+    return sorted(paths)
+
+
+def _etag(*parts) -> str:
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified for list and detail endpoints whose model has `updated_at`.
+
+    The validator is computed with one aggregate query before anything is serialized:
+    MAX(updated_at) and COUNT(*) of the filtered list (plus MAX(updated_at) of embedded
+    `?include=` relations) for the first page of a list, or the row's own updated_at on
+    detail views (detail reads with `?include=` are always served in full). A matching
+    If-None-Match (or, on detail views, If-Modified-Since) gets an empty 304.
+
+    Lists send no Last-Modified: a delete, or a row leaving the filter, does not move
+    MAX(updated_at), so only the ETag (which also covers the count) can validate them.
+    """
+
+    def _not_modified_or_none(self, request, etag, last_modified):
+        if etag is None:
+            return None
+        # HTTP dates have whole-second precision.
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        conditional = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if conditional is not None and conditional.status_code == status.HTTP_304_NOT_MODIFIED:
+            return self._with_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+        return None
+
+    @staticmethod
+    def _with_validators(response, etag, last_modified):
+        if etag is not None:
+            response["ETag"] = etag
+            response["Cache-Control"] = "private, no-cache"
+            # JSON and MessagePack bodies of the same resource carry different ETags.
+            patch_vary_headers(response, ("Accept",))
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+    def _list_validators(self, request):
+        # Only the first page is validated: that is what polling clients re-fetch, and it
+        # keeps cursor pages a pure keyset read with no aggregate over the whole list.
+        paginator = self.paginator
+        if paginator is not None and request.query_params.get(getattr(paginator, "cursor_query_param", "cursor")):
+            return None, None
+        queryset = self.filter_queryset(self.get_queryset())
+        if not _has_updated_at(queryset.model):
+            return None, None
+        _, include = sparse_params(request)
+        aggregates = {"n": Count("pk"), "latest": Max("updated_at")}
+        for i, path in enumerate(_included_updated_at_paths(queryset.model, include)):
+            aggregates[f"inc{i}"] = Max(path)
+        row = queryset.order_by().aggregate(**aggregates)
+        etag = _etag(request.get_full_path(), request.accepted_media_type, *(row[k] for k in sorted(row)))
+        return etag, None
+
+    def _detail_validators(self, request):
+        queryset = self.get_queryset()
+        if not _has_updated_at(queryset.model) or sparse_params(request)[1]:
+            return None, None
+        lookup = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+        updated_at = queryset.filter(**{self.lookup_field: lookup}).values_list("updated_at", flat=True).first()
+        if updated_at is None:
+            return None, None
+        return _etag(request.get_full_path(), request.accepted_media_type, updated_at), updated_at
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self._list_validators(request)
+        not_modified = self._not_modified_or_none(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return self._with_validators(super().list(request, *args, **kwargs), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        etag, last_modified = self._detail_validators(request)
+        not_modified = self._not_modified_or_none(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+        return self._with_validators(super().retrieve(request, *args, **kwargs), etag, last_modified)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+from campus_nexus.models import (
+    Association, Cabinet, CabinetMember, Course, Event, Faculty, Fee, Feedback, Member, Membership, Payment,
+)
+
+MAX_IN_VALUES = 100
+# Highest code point: `value <= x < value + PREFIX_END` is a plain range scan on the column's index.
+PREFIX_END = "\U0010ffff"
+
+
+class FilterSet:
+    """
+    Declarative query-parameter filters for one API resource.
+
+    `fields` maps a model field to the lookups it accepts:
+    `?status=recorded`, `?status__in=recorded,reversed`, `?paid_at__gte=2026-01-01`,
+    `?registration_number__prefix=223-`. `ordering` whitelists `?ordering=` fields.
+    Every field listed here has a database index (see the model Meta / FKs).
+    """
+    model = None
+    fields: dict[str, tuple[str, ...]] = {}
+    ordering: tuple[str, ...] = ("id",)
+
+    @classmethod
+    def _parse(cls, name, raw):
+        model_field = cls.model._meta.get_field(name)
+        if model_field.is_relation:
+            model_field = model_field.target_field
+        try:
+            value = model_field.to_python(raw)
+        except DjangoValidationError as exc:
+            raise ValidationError({name: exc.messages})
+        if settings.USE_TZ and isinstance(value, datetime) and timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        return value
+
+    @classmethod
+    def filter_queryset(cls, params, queryset):
+        q = Q()
+        for name, lookups in cls.fields.items():
+            for lookup in lookups:
+                param = name if lookup == "exact" else f"{name}__{lookup}"
+                raw = params.get(param)
+                if raw is None or raw == "":
+                    continue
+                if lookup == "in":
+                    values = [v for v in raw.split(",") if v]
+                    if len(values) > MAX_IN_VALUES:
+                        raise ValidationError({param: f"At most {MAX_IN_VALUES} values are allowed."})
+                    q &= Q(**{f"{name}__in": [cls._parse(name, v) for v in values]})
+                elif lookup == "prefix":
+                    q &= Q(**{f"{name}__gte": raw, f"{name}__lt": raw + PREFIX_END})
+                elif lookup == "exact":
+                    q &= Q(**{name: cls._parse(name, raw)})
+                else:
+                    q &= Q(**{f"{name}__{lookup}": cls._parse(name, raw)})
+        return queryset.filter(q) if q else queryset
+
+
+class FilterSetBackend(BaseFilterBackend):
+    """Applies the view's `filterset_class`; views without one are left unfiltered."""
+
+    def filter_queryset(self, request, queryset, view):
+        filterset = getattr(view, "filterset_class", None)
+        if filterset is None:
+            return queryset
+        return filterset.filter_queryset(request.query_params, queryset)
+
+
+class FilterSetOrderingFilter(OrderingFilter):
+    """
+    `?ordering=` restricted to the filterset's whitelist: one field, then the primary key
+    so cursor pagination keys its cursor on the unique pair (see IdCursorPagination).
+    """
+
+    def get_valid_fields(self, queryset, view, context=None):
+        filterset = getattr(view, "filterset_class", None)
+        allowed = filterset.ordering if filterset else ("id",)
+        return [(name, name) for name in allowed]
+
+    def get_default_ordering(self, view):
+        return ["-id"]
+
+    def get_ordering(self, request, queryset, view):
+        ordering = list(super().get_ordering(request, queryset, view))[:1]
+        if ordering[0].lstrip("-") not in ("id", "pk"):
+            ordering.append("-id" if ordering[0].startswith("-") else "id")
+        return ordering
+
+
+class FacultyFilterSet(FilterSet):
+    model = Faculty
+    fields = {"name": ("exact", "prefix")}
+    ordering = ("id", "name")
+
+
+class CourseFilterSet(FilterSet):
+    model = Course
+    fields = {"faculty": ("exact", "in")}
+    ordering = ("id", "name")
+
+
+class AssociationFilterSet(FilterSet):
+    model = Association
+    fields = {"faculty": ("exact", "in")}
+    ordering = ("id", "name")
+
+
+class MemberFilterSet(FilterSet):
+    model = Member
+    fields = {
+        "registration_number": ("exact", "in", "prefix"),
+        "email": ("exact", "prefix"),
+        "member_type": ("exact", "in"),
+        "faculty": ("exact", "in"),
+        "course": ("exact", "in"),
+        "created_in_association": ("exact", "in"),
+        "created_at": ("gte", "lte"),
+    }
+    ordering = ("id", "created_at", "registration_number")
+
+
+class MembershipFilterSet(FilterSet):
+    model = Membership
+    fields = {
+        "member": ("exact", "in"),
+        "association": ("exact", "in"),
+        "status": ("exact", "in"),
+        "joined_at": ("gte", "lte"),
+    }
+    ordering = ("id", "joined_at")
+
+
+class PaymentFilterSet(FilterSet):
+    model = Payment
+    fields = {
+        "membership": ("exact", "in"),
+        "charge": ("exact", "in"),
+        "status": ("exact", "in"),
+        "payment_method": ("exact", "in"),
+        "paid_at": ("gte", "lte"),
+        "amount_paid": ("gte", "lte"),
+    }
+    ordering = ("id", "paid_at", "amount_paid")
+
+
+class EventFilterSet(FilterSet):
+    model = Event
+    fields = {
+        "association": ("exact", "in"),
+        "event_date": ("gte", "lte"),
+    }
+    ordering = ("id", "event_date")
+
+
+class CabinetFilterSet(FilterSet):
+    model = Cabinet
+    fields = {
+        "association": ("exact", "in"),
+        "year": ("exact", "in"),
+    }
+    ordering = ("id", "year")
+
+
+class CabinetMemberFilterSet(FilterSet):
+    model = CabinetMember
+    fields = {
+        "cabinet": ("exact", "in"),
+        "member": ("exact", "in"),
+    }
+    ordering = ("id",)
+
+
+class FeeFilterSet(FilterSet):
+    model = Fee
+    fields = {
+        "association": ("exact", "in"),
+        "fee_type": ("exact", "in"),
+    }
+    ordering = ("id", "created_at")
+
+
+class FeedbackFilterSet(FilterSet):
+    model = Feedback
+    fields = {
+        "association": ("exact", "in"),
+        "member": ("exact", "in"),
+        "submitted_at": ("gte", "lte"),
+    }
+    ordering = ("id", "submitted_at")
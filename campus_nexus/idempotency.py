@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.db import transaction
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from campus_nexus.services.idempotency import claim_idempotency_key, store_idempotent_response
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def request_fingerprint(request) -> str:
+    """sha256 of method, path and parsed body (uploaded files by content)."""
+    digest = hashlib.sha256(f"{request.method} {request.path}\n".encode())
+    data = request.data
+    if hasattr(data, "lists"):
+        data = sorted(data.lists())
+    digest.update(json.dumps(data, sort_keys=True, default=str).encode())
+    for name, upload in sorted(request.FILES.items()):
+        digest.update(name.encode())
+        for chunk in upload.chunks():
+            digest.update(chunk)
+        upload.seek(0)
+    return digest.hexdigest()
+
+
+class IdempotentPostMixin:
+    """
+    Makes POST safe to retry. With an `Idempotency-Key` header the first request runs and
+    its 2xx response is stored in the same transaction as its writes; a retry with the
+    same key and body gets that response back (`Idempotent-Replayed: true`) without the
+    view running again. Reusing a key for a different body is a 422. Keys are per user
+    and expire after IDEMPOTENCY_KEY_TTL_HOURS. Requests without the header are unchanged.
+    """
+
+    def post(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return super().post(request, *args, **kwargs)
+        key = key.strip()
+        if not key or len(key) > 255:
+            raise ValidationError({IDEMPOTENCY_HEADER: "Must be between 1 and 255 characters."})
+
+        fingerprint = request_fingerprint(request)
+        with transaction.atomic():
+            record, claimed = claim_idempotency_key(request.user, key, fingerprint)
+            if not claimed:
+                return self._replay(record, fingerprint)
+            response = super().post(request, *args, **kwargs)
+            if status.is_success(response.status_code):
+                body = json.loads(JSONRenderer().render(response.data) or b"null")
+                store_idempotent_response(record, response.status_code, body)
+            else:
+                # Let the client fix the request and retry with the same key.
+                record.delete()
+        return response
+
+    @staticmethod
+    def _replay(record, fingerprint):
+        if record.request_hash != fingerprint:
+            return Response(
+                {"detail": f"This {IDEMPOTENCY_HEADER} was already used for a different request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        if record.status_code is None:
+            return Response(
+                {"detail": f"A request with this {IDEMPOTENCY_HEADER} is still being processed."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(record.response_body, status=record.status_code, headers={"Idempotent-Replayed": "true"})
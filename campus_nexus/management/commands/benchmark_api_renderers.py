@@ -0,0 +1,105 @@
+import io
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from campus_nexus.models import Member, Payment
+from campus_nexus.renderers import (
+    MSGPACK_AVAILABLE, FastJSONParser, FastJSONRenderer, MessagePackParser, MessagePackRenderer, orjson,
+)
+from campus_nexus.serializers import MemberSerializer, PaymentSerializer
+
+
+def _payments(rows: int) -> list:
+    now = timezone.now()
+    return [
+        Payment(
+            pk=i + 1,
+            charge_id=i // 3 + 1,
+            membership_id=i // 3 + 1,
+            amount_paid=Decimal("12500.00") + i,
+            paid_at=now - timedelta(minutes=i),
+            recorded_at=now - timedelta(minutes=i, seconds=30),
+            updated_at=now,
+            payment_method="mobile_money",
+            reference_code=f"MP{i:010d}",
+            note="Subscription instalment",
+        )
+        for i in range(rows)
+    ]
+
+
+def _members(rows: int) -> list:
+    now = timezone.now()
+    return [
+        Member(
+            pk=i + 1,
+            first_name=f"Student{i}",
+            last_name="Okello",
+            email=f"student{i}@example.com",
+            phone=f"0700{i:06d}",
+            registration_number=f"223-063012-{i:05d}",
+            nationality="UG",
+            member_type="student",
+            faculty_id=1,
+            course_id=2,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(rows)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Time DRF's JSONRenderer against the orjson and MessagePack renderers (and their parsers) "
+        "on serialized payment and member lists. Touches no database rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="Objects per payload (default: 10000).")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the best is shown (default: 5).")
+
+    def _best(self, repeat, fn):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best * 1000
+
+    def handle(self, *args, **options):
+        rows, repeat = max(1, options["rows"]), max(1, options["repeat"])
+        formats = [
+            ("json (DRF)", JSONRenderer(), JSONParser()),
+            ("json (orjson)" if orjson is not None else "json (orjson missing, DRF fallback)", FastJSONRenderer(), FastJSONParser()),
+        ]
+        if MSGPACK_AVAILABLE:
+            formats.append(("msgpack", MessagePackRenderer(), MessagePackParser()))
+        else:
+            self.stdout.write(self.style.WARNING("msgpack is not installed; skipping application/msgpack."))
+
+        payloads = [
+            ("payments", PaymentSerializer(_payments(rows), many=True).data),
+            ("members", MemberSerializer(_members(rows), many=True).data),
+        ]
+        for name, results in payloads:
+            data = {"next": None, "previous": None, "results": results}
+            self.stdout.write(f"{name} ({rows} rows):")
+            baseline = None
+            for label, renderer, parser in formats:
+                body = renderer.render(data, renderer.media_type, {})
+                render_ms = self._best(repeat, lambda: renderer.render(data, renderer.media_type, {}))
+                parse_ms = self._best(repeat, lambda: parser.parse(io.BytesIO(body), parser.media_type, {}))
+                baseline = baseline or render_ms
+                self.stdout.write(
+                    f"  {label:<38} render {render_ms:8.1f} ms ({baseline / render_ms:4.1f}x)  "
+                    f"parse {parse_ms:8.1f} ms  {len(body) / 1024:8.0f} KiB"
+                )
+        self.stdout.write(self.style.SUCCESS("Done."))
@@ -1,13 +1,66 @@
+import codecs
+import copy
 import csv
+import gzip
+import hashlib
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
+from typing import NamedTuple, Optional
 
+import django
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
 
 from campus_nexus.countries import COUNTRY_LOOKUP
-from campus_nexus.models import Course, Faculty, Member
+from campus_nexus.models import Course, Faculty, Member, MemberImportRun
+
+
+class ParsedRow(NamedTuple):
+    """A CSV row after parsing and field validation, small enough to ship back from a worker."""
+    line_number: int
+    error: str  # why the row could not be parsed; nothing else is set then
+    values: Optional[tuple] = None  # in Command.VALUE_FIELDS order
+    faculty_name: str = ""
+    course_name: str = ""
+    field_errors: Optional[dict] = None  # full_clean() messages, minus relation and unique checks
+
+
+def _prevalidate_rows(rows):
+    """Parse and validate (line_number, row) pairs without touching the database."""
+    command = Command()
+    return [command._prevalidate(line_number, row) for line_number, row in rows]
+
+
+class _TrackedLines:
+    """Decoded lines of a binary file that remember the byte offset just past the last line read."""
+
+    def __init__(self, source):
+        self.source = source
+        if source.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+            source.seek(0)
+        self.offset = source.tell()
+
+    def seek(self, offset):
+        self.source.seek(offset)
+        self.offset = offset
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.source.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        return line.decode("utf-8")
 
 
 class Command(BaseCommand):
@@ -31,6 +84,18 @@ class Command(BaseCommand):
         "alumni": "alumni",
         "external": "external",
     }
+    # Columns the import writes, the unique ones checked per chunk in --batch-size mode, and
+    # the foreign keys whose per-row existence queries that mode skips (they come from lookups).
+    MEMBER_FIELDS = (
+        "first_name", "last_name", "email", "phone", "registration_number", "national_id_number",
+        "member_type", "faculty", "course", "nationality",
+    )
+    VALUE_FIELDS = (
+        "first_name", "last_name", "email", "phone", "registration_number", "national_id_number",
+        "member_type", "nationality",
+    )
+    UNIQUE_FIELDS = ("email", "registration_number", "national_id_number")
+    RELATION_FIELDS = ("faculty", "course", "created_by", "created_in_association")
 
     def add_arguments(self, parser):
         parser.add_argument("csv_path", type=str, help="Path to CSV file exported from ERP.")
@@ -57,6 +122,39 @@ class Command(BaseCommand):
             action="store_true",
             help="Validate and simulate import without committing changes.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=0,
+            help=(
+                "Import N rows at a time: faculties/courses are preloaded, existing members are fetched "
+                "with one query per chunk and rows are written with bulk_create/bulk_update. "
+                "0 (default) imports row by row."
+            ),
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help=(
+                "Rows committed (and checkpointed) together in row-by-row mode (default: 1000). "
+                "With --batch-size every batch is its own chunk."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Parse and validate rows in N worker processes while this process writes to the "
+                "database. Implies batched mode (--batch-size defaults to --chunk-size)."
+            ),
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the latest unfinished import of this same file from its last committed row.",
+        )
 
     def handle(self, *args, **options):
         csv_path = Path(options["csv_path"]).expanduser().resolve()
@@ -67,63 +165,184 @@ class Command(BaseCommand):
         create_missing_relations = bool(options["create_missing_relations"])
         default_course_duration_years = int(options["default_course_duration_years"])
         dry_run = bool(options["dry_run"])
-
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-        failure_messages: list[str] = []
-
-        with csv_path.open("r", encoding="utf-8-sig", newline="") as source:
-            reader = csv.DictReader(source)
-            if not reader.fieldnames:
+        batch_size = max(0, int(options["batch_size"] or 0))
+        workers = max(1, int(options["workers"]))
+        if workers > 1 and not batch_size:
+            batch_size = max(1, int(options["chunk_size"]))
+        chunk_size = batch_size or max(1, int(options["chunk_size"]))
+        resume = bool(options["resume"])
+        if resume and dry_run:
+            raise CommandError("--resume cannot be combined with --dry-run.")
+
+        # A dry run is one transaction that is rolled back; real imports commit chunk by
+        # chunk and checkpoint each one in a MemberImportRun row.
+        run = None if dry_run else self._start_run(csv_path, resume)
+        import_options = {
+            "created_by": created_by,
+            "create_missing_relations": create_missing_relations,
+            "default_course_duration_years": default_course_duration_years,
+        }
+
+        # Skip messages are spooled to disk past 1 MB so memory stays flat on any file size.
+        # export_members_csv writes .csv.gz files; offsets then count uncompressed bytes.
+        opener = gzip.open if csv_path.suffix == ".gz" else open
+        with opener(csv_path, "rb") as source, tempfile.SpooledTemporaryFile(
+            max_size=1 << 20, mode="w+", encoding="utf-8"
+        ) as failure_log:
+            lines = _TrackedLines(source)
+            fieldnames = next(csv.reader(lines), None)
+            if not fieldnames:
                 raise CommandError("CSV has no header row.")
 
             missing_required_headers = [
                 column
                 for column in self.REQUIRED_COLUMNS
-                if not any(alias in reader.fieldnames for alias in self.COLUMN_ALIASES[column])
+                if not any(alias in fieldnames for alias in self.COLUMN_ALIASES[column])
             ]
             if missing_required_headers:
                 raise CommandError(
                     "CSV is missing required column(s): " + ", ".join(missing_required_headers)
                 )
 
+            first_line = 2
+            if resume and run.byte_offset:
+                lines.seek(run.byte_offset)
+                first_line = run.last_line + 1
+                self.stdout.write(f"Resuming from line {first_line}.")
+            rows = enumerate(csv.DictReader(lines, fieldnames=fieldnames), start=first_line)
+            relations = self._preload_relations() if batch_size else None
+
+            created_count = run.created_count if run else 0
+            updated_count = run.updated_count if run else 0
+            skipped_count = run.skipped_count if run else 0
+            try:
+                chunks = self._read_chunks(rows, lines, chunk_size)
+                if batch_size:
+                    chunks = self._prevalidated(chunks, workers)
+                with transaction.atomic() if dry_run else nullcontext():
+                    for chunk, offset in chunks:
+                        with transaction.atomic():
+                            created, updated, failures = self._import_chunk(
+                                chunk, relations, batch_size, **import_options
+                            )
+                            created_count += created
+                            updated_count += updated
+                            skipped_count += len(failures)
+                            if run is not None:
+                                run.last_line = chunk[-1][0]
+                                run.byte_offset = offset
+                                run.created_count = created_count
+                                run.updated_count = updated_count
+                                run.skipped_count = skipped_count
+                                run.save(update_fields=[
+                                    "last_line", "byte_offset", "created_count", "updated_count",
+                                    "skipped_count", "updated_at",
+                                ])
+                        for line_number, exc in failures:
+                            failure_log.write(f"Line {line_number}: {exc}\n")
+
+                    if dry_run:
+                        transaction.set_rollback(True)
+            except BaseException as exc:
+                if run is not None:
+                    run.status = "failed"
+                    run.error = f"{exc.__class__.__name__}: {exc}"
+                    run.save(update_fields=["status", "error", "updated_at"])
+                    self.stderr.write(
+                        f"Import stopped after line {run.last_line}; run it again with --resume to continue."
+                    )
+                raise
+
+            if run is not None:
+                run.status = "completed"
+                run.save(update_fields=["status", "updated_at"])
+
+            mode = "DRY-RUN" if dry_run else "COMMITTED"
+            self.stdout.write(self.style.SUCCESS(f"{mode} import summary"))
+            self.stdout.write(f"Created: {created_count}")
+            self.stdout.write(f"Updated: {updated_count}")
+            self.stdout.write(f"Skipped: {skipped_count}")
+
+            if failure_log.tell():
+                self.stdout.write(self.style.WARNING("Skipped row details:"))
+                failure_log.seek(0)
+                for message in failure_log:
+                    self.stdout.write(f" - {message.rstrip()}")
+
+    def _start_run(self, csv_path, resume):
+        file_hash = self._file_hash(csv_path)
+        unfinished = MemberImportRun.objects.filter(file_hash=file_hash).exclude(status="completed").first()
+        if resume:
+            if unfinished is None:
+                raise CommandError(f"No unfinished import of {csv_path} to resume.")
+            unfinished.status = "running"
+            unfinished.error = ""
+            unfinished.save(update_fields=["status", "error", "updated_at"])
+            return unfinished
+        if unfinished is not None:
+            self.stdout.write(self.style.WARNING(
+                f"An unfinished import of this file stopped after line {unfinished.last_line}; "
+                "pass --resume to continue it instead of starting over."
+            ))
+        return MemberImportRun.objects.create(csv_path=str(csv_path), file_hash=file_hash)
+
+    @staticmethod
+    def _file_hash(csv_path):
+        digest = hashlib.sha256()
+        with csv_path.open("rb") as source:
+            for block in iter(lambda: source.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _read_chunks(rows, lines, chunk_size):
+        """(chunk, byte offset just past its last row) for each chunk of (line_number, row) pairs."""
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk, lines.offset
+
+    @staticmethod
+    def _prevalidated(chunks, workers):
+        """
+        The same chunks as lists of ParsedRow. With several workers, up to two chunks per
+        worker are parsed and validated ahead in a process pool while the caller writes the
+        current one; results come back in file order.
+        """
+        if workers <= 1:
+            for chunk, offset in chunks:
+                yield _prevalidate_rows(chunk), offset
+            return
+
+        # django.setup() is a no-op for forked workers, which inherit the loaded apps.
+        with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+            pending = deque()
+            for chunk, offset in chunks:
+                pending.append((pool.submit(_prevalidate_rows, chunk), offset))
+                if len(pending) >= workers * 2:
+                    future, ready_offset = pending.popleft()
+                    yield future.result(), ready_offset
+            while pending:
+                future, ready_offset = pending.popleft()
+                yield future.result(), ready_offset
+
+    def _import_chunk(self, chunk, relations, batch_size, **import_options):
+        """
+        Import one chunk: (line_number, row) pairs, or ParsedRows in batched mode. Returns
+        created and updated counts and the (line_number, error) failures. Callers wrap it
+        in a transaction.
+        """
+        if relations is None:
+            return self._import_row_by_row(chunk, **import_options)
+        try:
             with transaction.atomic():
-                for line_number, row in enumerate(reader, start=2):
-                    try:
-                        member, created = self._upsert_member(
-                            row=row,
-                            created_by=created_by,
-                            create_missing_relations=create_missing_relations,
-                            default_course_duration_years=default_course_duration_years,
-                        )
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
-                    except ValueError as exc:
-                        skipped_count += 1
-                        failure_messages.append(f"Line {line_number}: {exc}")
-                    except ValidationError as exc:
-                        skipped_count += 1
-                        failure_messages.append(f"Line {line_number}: {exc}")
-                    except Exception as exc:
-                        skipped_count += 1
-                        failure_messages.append(f"Line {line_number}: {exc}")
-
-                if dry_run:
-                    transaction.set_rollback(True)
-
-        mode = "DRY-RUN" if dry_run else "COMMITTED"
-        self.stdout.write(self.style.SUCCESS(f"{mode} import summary"))
-        self.stdout.write(f"Created: {created_count}")
-        self.stdout.write(f"Updated: {updated_count}")
-        self.stdout.write(f"Skipped: {skipped_count}")
-
-        if failure_messages:
-            self.stdout.write(self.style.WARNING("Skipped row details:"))
-            for message in failure_messages:
-                self.stdout.write(f" - {message}")
+                return self._import_batch(chunk, relations, batch_size, **import_options)
+        except IntegrityError:
+            # A conflict the in-memory checks could not see (e.g. a concurrent write):
+            # redo this chunk row by row so the offending lines are reported.
+            relations.update(self._preload_relations())
+        return self._import_parsed_row_by_row(chunk, **import_options)
 
     def _resolve_created_by(self, username):
         if not username:
@@ -134,7 +353,76 @@ class Command(BaseCommand):
         except user_model.DoesNotExist as exc:
             raise CommandError(f"User for --created-by was not found: {username}") from exc
 
-    def _upsert_member(self, row, created_by, create_missing_relations, default_course_duration_years):
+    def _import_row_by_row(self, rows, **import_options):
+        created_count = 0
+        updated_count = 0
+        failures = []
+        for line_number, row in rows:
+            try:
+                # A savepoint per row: a failed row (even an IntegrityError) leaves the rest intact.
+                with transaction.atomic():
+                    member, created = self._upsert_member(row=row, **import_options)
+                if created:
+                    created_count += 1
+                else:
+                    updated_count += 1
+            except Exception as exc:
+                failures.append((line_number, exc))
+        return created_count, updated_count, failures
+
+    def _import_parsed_row_by_row(self, parsed_rows, **import_options):
+        created_count = 0
+        updated_count = 0
+        failures = []
+        for parsed in parsed_rows:
+            if parsed.error:
+                failures.append((parsed.line_number, parsed.error))
+                continue
+            values = dict(zip(self.VALUE_FIELDS, parsed.values))
+            try:
+                with transaction.atomic():
+                    member, created = self._upsert_parsed(
+                        values, self._lookup_for(values), parsed.faculty_name, parsed.course_name, **import_options
+                    )
+                if created:
+                    created_count += 1
+                else:
+                    updated_count += 1
+            except Exception as exc:
+                failures.append((parsed.line_number, exc))
+        return created_count, updated_count, failures
+
+    def _upsert_member(self, row, **import_options):
+        return self._upsert_parsed(*self._parse_row(row), **import_options)
+
+    def _upsert_parsed(
+        self, values, lookup_kwargs, faculty_name, course_name,
+        created_by, create_missing_relations, default_course_duration_years,
+    ):
+        faculty = self._resolve_faculty(
+            name=faculty_name,
+            create_missing_relations=create_missing_relations,
+        )
+        course = self._resolve_course(
+            name=course_name,
+            faculty=faculty,
+            create_missing_relations=create_missing_relations,
+            default_course_duration_years=default_course_duration_years,
+        )
+        self._require_lookup(lookup_kwargs)
+
+        member = Member.objects.filter(**lookup_kwargs).first()
+        created = member is None
+        if created:
+            member = Member(**lookup_kwargs)
+
+        self._assign(member, values, faculty, course, created_by=created_by if created else None)
+        member.full_clean()
+        member.save()
+        return member, created
+
+    def _parse_row(self, row):
+        """Normalised member values of one row, the lookup matching it to a member, and its relation names."""
         first_name = self._value(row, "first_name")
         last_name = self._value(row, "last_name")
         email = self._value(row, "email").lower()
@@ -149,47 +437,211 @@ class Command(BaseCommand):
         national_id_number = self._value(row, "national_id_number")
         nationality = self._normalize_country(self._value(row, "nationality"))
 
-        faculty = self._resolve_faculty(
-            name=self._value(row, "faculty"),
-            create_missing_relations=create_missing_relations,
-        )
-        course = self._resolve_course(
-            name=self._value(row, "course"),
-            faculty=faculty,
-            create_missing_relations=create_missing_relations,
-            default_course_duration_years=default_course_duration_years,
+        values = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "phone": phone,
+            "registration_number": registration_number or None,
+            "national_id_number": national_id_number or None,
+            "member_type": member_type,
+            "nationality": nationality,
+        }
+        return values, self._lookup_for(values), self._value(row, "faculty"), self._value(row, "course")
+
+    @staticmethod
+    def _lookup_for(values):
+        if values["registration_number"]:
+            return {"registration_number": values["registration_number"]}
+        if values["email"]:
+            return {"email": values["email"]}
+        return {}
+
+    def _prevalidate(self, line_number, row):
+        """Parse one row and run the database-free part of full_clean(); safe in a worker process."""
+        try:
+            values, _, faculty_name, course_name = self._parse_row(row)
+        except ValueError as exc:
+            return ParsedRow(line_number, str(exc))
+        field_errors = None
+        try:
+            Member(**values).full_clean(
+                exclude=self.RELATION_FIELDS, validate_unique=False, validate_constraints=False
+            )
+        except ValidationError as exc:
+            field_errors = exc.message_dict
+        return ParsedRow(
+            line_number, "", tuple(values[field] for field in self.VALUE_FIELDS), faculty_name, course_name, field_errors
         )
 
-        lookup_kwargs = {}
-        if registration_number:
-            lookup_kwargs["registration_number"] = registration_number
-        elif email:
-            lookup_kwargs["email"] = email
-        else:
+    @staticmethod
+    def _require_lookup(lookup_kwargs):
+        if not lookup_kwargs:
             raise ValueError("Row must include registration_number or email for upsert matching.")
 
-        member = Member.objects.filter(**lookup_kwargs).first()
-        created = member is None
-        if created:
-            member = Member(**lookup_kwargs)
-
-        member.first_name = first_name
-        member.last_name = last_name
-        member.email = email
-        member.phone = phone
-        member.registration_number = registration_number or None
-        member.national_id_number = national_id_number or None
-        member.member_type = member_type
+    @staticmethod
+    def _assign(member, values, faculty, course, created_by=None):
+        for field, value in values.items():
+            setattr(member, field, value)
         member.faculty = faculty
         member.course = course
-        member.nationality = nationality
-
-        if created and created_by:
+        if created_by:
             member.created_by = created_by
 
-        member.full_clean()
-        member.save()
-        return member, created
+    # --- --batch-size mode -------------------------------------------------------------
+
+    def _import_batch(
+        self, rows, relations, batch_size, created_by, create_missing_relations, default_course_duration_years
+    ):
+        """
+        Same results as the row-by-row import, with a fixed number of queries per batch.
+
+        `rows` are ParsedRows, already field-validated by `_prevalidate()`. Faculties and
+        courses come from the case-insensitive dicts of `_preload_relations()`. Every member
+        a row could match or collide with (by registration number, email or NIN) is fetched
+        in one query; rows are then matched and unique-checked in memory in file order, as
+        if each earlier row had already been saved, and written with bulk_update / bulk_create.
+        """
+        parsed, failures = [], []
+        for row in rows:
+            if row.error:
+                failures.append((row.line_number, row.error))
+                continue
+            values = dict(zip(self.VALUE_FIELDS, row.values))
+            lookup_kwargs = self._lookup_for(values)
+            try:
+                faculty = self._cached_faculty(relations, row.faculty_name, create_missing_relations)
+                course = self._cached_course(
+                    relations, row.course_name, faculty, create_missing_relations, default_course_duration_years
+                )
+                self._require_lookup(lookup_kwargs)
+            except Exception as exc:
+                failures.append((row.line_number, exc))
+                continue
+            parsed.append((row.line_number, values, lookup_kwargs, faculty, course, row.field_errors))
+
+        created_count, updated_count = self._upsert_batch(parsed, batch_size, created_by, failures)
+        failures.sort(key=lambda failure: failure[0])
+        return created_count, updated_count, failures
+
+    def _upsert_batch(self, parsed, batch_size, created_by, failures):
+        query = Q()
+        for field in self.UNIQUE_FIELDS:
+            wanted = {values[field] for _, values, *_ in parsed if values[field]}
+            if wanted:
+                query |= Q(**{f"{field}__in": wanted})
+        existing = list(Member.objects.filter(query)) if query else []
+
+        # Who holds each unique value right now (existing pk, or the line that created it),
+        # and that member's current state including this chunk's accepted rows.
+        owners = {field: {} for field in self.UNIQUE_FIELDS}
+        current = {}
+        for member in existing:
+            current[member.pk] = member
+            for field in self.UNIQUE_FIELDS:
+                value = getattr(member, field)
+                if value:
+                    owners[field][value] = member.pk
+        to_create, to_update, released = {}, {}, set()
+
+        created_count = 0
+        updated_count = 0
+        for line_number, values, lookup_kwargs, faculty, course, field_errors in parsed:
+            [(lookup_field, lookup_value)] = lookup_kwargs.items()
+            key = owners[lookup_field].get(lookup_value)
+            base = current.get(key)
+            created = base is None
+            if created:
+                key = f"line-{line_number}"
+                member = Member(**lookup_kwargs)
+            else:
+                member = copy.copy(base)
+            self._assign(member, values, faculty, course, created_by=created_by if created else None)
+
+            errors = {field: list(messages) for field, messages in (field_errors or {}).items()}
+            for field in self.UNIQUE_FIELDS:
+                value = getattr(member, field)
+                if value and field not in errors and owners[field].get(value, key) != key:
+                    errors[field] = [member.unique_error_message(Member, (field,))]
+            if errors:
+                failures.append((line_number, ValidationError(errors)))
+                continue
+
+            claims = {(field, getattr(member, field)) for field in self.UNIQUE_FIELDS if getattr(member, field)}
+            if claims & released:
+                # A value another row gave up earlier in this chunk: write that row first.
+                self._write_members(to_create, to_update, batch_size)
+                released.clear()
+            for field in self.UNIQUE_FIELDS:
+                old, new = getattr(base, field, None), getattr(member, field)
+                if old and old != new and owners[field].get(old) == key:
+                    del owners[field][old]
+                    released.add((field, old))
+                if new:
+                    owners[field][new] = key
+            current[key] = member
+            (to_create if member.pk is None else to_update)[key] = member
+            if created:
+                created_count += 1
+            else:
+                updated_count += 1
+
+        self._write_members(to_create, to_update, batch_size)
+        return created_count, updated_count
+
+    def _write_members(self, to_create, to_update, batch_size):
+        # Updates first so values they release are free for the inserts.
+        if to_update:
+            now = timezone.now()
+            for member in to_update.values():
+                member.updated_at = now
+            Member.objects.bulk_update(
+                list(to_update.values()), [*self.MEMBER_FIELDS, "updated_at"], batch_size=batch_size
+            )
+        if to_create:
+            Member.objects.bulk_create(list(to_create.values()), batch_size=batch_size)
+        to_create.clear()
+        to_update.clear()
+
+    def _preload_relations(self):
+        faculties, courses, courses_by_faculty = {}, {}, {}
+        for faculty in Faculty.objects.order_by("pk"):
+            faculties.setdefault(faculty.name.lower(), faculty)
+        for course in Course.objects.order_by("pk"):
+            courses.setdefault(course.name.lower(), course)
+            courses_by_faculty.setdefault((course.name.lower(), course.faculty_id), course)
+        return {"faculties": faculties, "courses": courses, "courses_by_faculty": courses_by_faculty}
+
+    def _cached_faculty(self, relations, name, create_missing_relations):
+        if not name:
+            return None
+        faculty = relations["faculties"].get(name.lower())
+        if faculty is None:
+            if not create_missing_relations:
+                raise self._missing_relation("Faculty", name)
+            faculty = self._resolve_faculty(name=name, create_missing_relations=create_missing_relations)
+            relations["faculties"][name.lower()] = faculty
+        return faculty
+
+    def _cached_course(self, relations, name, faculty, create_missing_relations, default_course_duration_years):
+        if not name:
+            return None
+        if faculty:
+            course = relations["courses_by_faculty"].get((name.lower(), faculty.pk))
+        else:
+            course = relations["courses"].get(name.lower())
+        if course is None:
+            if not create_missing_relations:
+                raise self._missing_relation("Course", name)
+            course = self._resolve_course(
+                name=name,
+                faculty=faculty,
+                create_missing_relations=create_missing_relations,
+                default_course_duration_years=default_course_duration_years,
+            )
+            relations["courses"].setdefault(name.lower(), course)
+            relations["courses_by_faculty"][(name.lower(), course.faculty_id)] = course
+        return course
 
     def _resolve_faculty(self, name, create_missing_relations):
         if not name:
@@ -198,9 +650,7 @@ class Command(BaseCommand):
         if faculty:
             return faculty
         if not create_missing_relations:
-            raise ValueError(
-                f"Faculty '{name}' does not exist. Use --create-missing-relations to auto-create it."
-            )
+            raise self._missing_relation("Faculty", name)
         return Faculty.objects.create(name=name)
 
     def _resolve_course(self, name, faculty, create_missing_relations, default_course_duration_years):
@@ -216,9 +666,7 @@ class Command(BaseCommand):
             return course
 
         if not create_missing_relations:
-            raise ValueError(
-                f"Course '{name}' does not exist. Use --create-missing-relations to auto-create it."
-            )
+            raise self._missing_relation("Course", name)
 
         if not faculty:
             raise ValueError(
@@ -231,6 +679,10 @@ class Command(BaseCommand):
             duration_years=max(1, default_course_duration_years),
         )
 
+    @staticmethod
+    def _missing_relation(kind, name):
+        return ValueError(f"{kind} '{name}' does not exist. Use --create-missing-relations to auto-create it.")
+
     def _value(self, row, field):
         aliases = self.COLUMN_ALIASES[field]
         for alias in aliases:
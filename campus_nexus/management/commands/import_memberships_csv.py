@@ -0,0 +1,76 @@
+import csv
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from campus_nexus.services.enrollment import enroll_members
+
+
+class Command(BaseCommand):
+    help = "Enroll existing members into associations from a CSV of registration numbers and association names."
+
+    REQUIRED_COLUMNS = ("registration_number", "association")
+    COLUMN_ALIASES = {
+        "registration_number": ("registration_number", "reg_no", "registration_no"),
+        "association": ("association", "association_name"),
+        "status": ("status", "membership_status"),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", type=str, help="Path to the enrollment CSV.")
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and simulate the enrollment without committing changes.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows validated with one member query and one membership query, then bulk-created (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        csv_path = Path(options["csv_path"]).expanduser().resolve()
+        if not csv_path.exists() or not csv_path.is_file():
+            raise CommandError(f"CSV file not found: {csv_path}")
+        dry_run = bool(options["dry_run"])
+
+        with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+            reader = csv.DictReader(handle)
+            if not reader.fieldnames:
+                raise CommandError("CSV has no header row.")
+            columns = {
+                column: next((alias for alias in aliases if alias in reader.fieldnames), None)
+                for column, aliases in self.COLUMN_ALIASES.items()
+            }
+            missing_required_headers = [column for column in self.REQUIRED_COLUMNS if columns[column] is None]
+            if missing_required_headers:
+                raise CommandError("CSV is missing required column(s): " + ", ".join(missing_required_headers))
+
+            rows = (
+                (
+                    line_number,
+                    row.get(columns["registration_number"]),
+                    row.get(columns["association"]),
+                    row.get(columns["status"]) if columns["status"] else "",
+                )
+                for line_number, row in enumerate(reader, start=2)
+            )
+            with transaction.atomic():
+                result = enroll_members(rows, batch_size=max(1, int(options["batch_size"])))
+                if dry_run:
+                    transaction.set_rollback(True)
+
+        mode = "DRY-RUN" if dry_run else "COMMITTED"
+        self.stdout.write(self.style.SUCCESS(f"{mode} enrollment summary"))
+        self.stdout.write(f"Created: {result.created}")
+        self.stdout.write(f"Already enrolled: {result.existing}")
+        self.stdout.write(f"Skipped: {len(result.skipped)}")
+        self.stdout.write(f"Welcome emails queued: {result.emails_queued}")
+
+        if result.skipped:
+            self.stdout.write(self.style.WARNING("Skipped row details:"))
+            for line_number, message in result.skipped:
+                self.stdout.write(f" - Line {line_number}: {message}")
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from campus_nexus.services.idempotency import purge_expired_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = "Delete expired API idempotency keys. Run periodically (e.g. hourly from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows deleted per statement (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        deleted = purge_expired_idempotency_keys(batch_size=max(1, int(options["batch_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} expired idempotency key(s)."))
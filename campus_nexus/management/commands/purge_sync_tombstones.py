@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from campus_nexus.services.sync import purge_sync_tombstones
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete sync tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS. "
+        "Run periodically (e.g. daily from cron)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows deleted per statement (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        deleted = purge_sync_tombstones(batch_size=max(1, int(options["batch_size"])))
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} sync tombstone(s)."))
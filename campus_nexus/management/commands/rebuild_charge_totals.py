@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campus_nexus.models import Association
+from campus_nexus.services.charges import rebuild_charge_totals
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored amount_paid/balance/status columns on charges from recorded payments."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--association",
+            type=int,
+            default=None,
+            help="Only rebuild charges for this association ID (default: all associations).",
+        )
+
+    def handle(self, *args, **options):
+        association_id = options.get("association")
+        if association_id is not None and not Association.objects.filter(pk=association_id).exists():
+            raise CommandError(f"Association not found: {association_id}")
+
+        touched = rebuild_charge_totals(association_id=association_id)
+
+        scope = f"association {association_id}" if association_id is not None else "all associations"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt totals for {touched} charge(s) ({scope})."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campus_nexus.models import Association
+from campus_nexus.services.ledger import rebuild_monthly_ledger
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-association monthly income/expense rollup from recorded payments and expenses."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--association",
+            type=int,
+            default=None,
+            help="Only rebuild the ledger for this association ID (default: all associations).",
+        )
+
+    def handle(self, *args, **options):
+        association_id = options.get("association")
+        if association_id is not None and not Association.objects.filter(pk=association_id).exists():
+            raise CommandError(f"Association not found: {association_id}")
+
+        months = rebuild_monthly_ledger(association_id=association_id)
+
+        scope = f"association {association_id}" if association_id is not None else "all associations"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {months} ledger month(s) ({scope})."))
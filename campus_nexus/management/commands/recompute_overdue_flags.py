@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campus_nexus.models import Association
+from campus_nexus.services.subscriptions import recompute_overdue_flags_for_association
+
+
+class Command(BaseCommand):
+    help = "Recompute status and overdue flags of subscription charges with set-based UPDATEs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--association",
+            type=int,
+            default=None,
+            help="Only recompute this association ID (default: all associations).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many charges would change without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        association_id = options.get("association")
+        dry_run = bool(options["dry_run"])
+
+        associations = Association.objects.order_by("id")
+        if association_id is not None:
+            associations = associations.filter(pk=association_id)
+            if not associations.exists():
+                raise CommandError(f"Association not found: {association_id}")
+
+        total = 0
+        for assoc_id in associations.values_list("id", flat=True):
+            total += recompute_overdue_flags_for_association(assoc_id, dry_run=dry_run)
+
+        verb = "would change" if dry_run else "updated"
+        mode = "DRY-RUN" if dry_run else "COMMITTED"
+        self.stdout.write(self.style.SUCCESS(f"{mode}: {total} subscription charge(s) {verb}."))
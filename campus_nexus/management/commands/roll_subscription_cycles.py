@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campus_nexus.models import Association
+from campus_nexus.services.subscriptions import roll_subscription_cycles
+
+
+class Command(BaseCommand):
+    help = "Create missing current-cycle subscription charges for every membership (run on a schedule)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--association",
+            type=int,
+            default=None,
+            help="Only roll cycles for this association ID (default: all associations).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows per bulk insert / iterator chunk.",
+        )
+
+    def handle(self, *args, **options):
+        association_id = options.get("association")
+        if association_id is not None and not Association.objects.filter(pk=association_id).exists():
+            raise CommandError(f"Association not found: {association_id}")
+
+        result = roll_subscription_cycles(
+            association_id=association_id,
+            batch_size=max(1, int(options["batch_size"])),
+        )
+
+        self.stdout.write(self.style.SUCCESS("Subscription cycle rollover complete"))
+        self.stdout.write(f"Associations with a subscription fee: {result.associations}")
+        self.stdout.write(f"Memberships checked: {result.memberships}")
+        self.stdout.write(f"Charges created: {result.created}")
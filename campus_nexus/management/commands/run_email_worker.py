@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from campus_nexus.services.outbox import DEFAULT_MAX_ATTEMPTS, drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Deliver queued outbox emails over one SMTP connection per batch, with retry/backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Emails claimed and sent per SMTP connection.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help="Attempts before an email is marked failed.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new emails instead of exiting once the queue is drained.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep between polls when --loop is set and the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, int(options["batch_size"]))
+        max_attempts = max(1, int(options["max_attempts"]))
+        loop = options.get("loop", False)
+
+        sent = retried = failed = 0
+        try:
+            while True:
+                result = drain_outbox(batch_size=batch_size, max_attempts=max_attempts)
+                sent += result.sent
+                retried += result.retried
+                failed += result.failed
+                if not loop:
+                    break
+                time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("Email worker finished"))
+        self.stdout.write(f"Sent: {sent}")
+        self.stdout.write(f"Scheduled for retry: {retried}")
+        self.stdout.write(f"Failed permanently: {failed}")
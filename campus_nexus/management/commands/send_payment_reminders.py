@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from campus_nexus.models import Association
+from campus_nexus.services.reminders import send_payment_reminders
+
+
+class Command(BaseCommand):
+    help = "Queue and send today's payment reminders from each fee's reminder schedule (run nightly)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--association",
+            type=int,
+            default=None,
+            help="Only send reminders for this association ID (default: all associations).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the reminders that are due without logging, queuing or sending anything.",
+        )
+        parser.add_argument(
+            "--no-deliver",
+            action="store_true",
+            help="Only queue the emails; leave delivery to run_email_worker.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Charges read and rows inserted per batch.",
+        )
+
+    def handle(self, *args, **options):
+        association_id = options.get("association")
+        if association_id is not None and not Association.objects.filter(pk=association_id).exists():
+            raise CommandError(f"Association not found: {association_id}")
+
+        dry_run = options.get("dry_run", False)
+        result = send_payment_reminders(
+            association_id=association_id,
+            dry_run=dry_run,
+            deliver=not options.get("no_deliver", False),
+            batch_size=max(1, int(options["batch_size"])),
+        )
+
+        mode = "DRY-RUN" if dry_run else "COMMITTED"
+        self.stdout.write(self.style.SUCCESS(f"{mode} payment reminder run"))
+        self.stdout.write(f"Before due: {result.due['before_due']}")
+        self.stdout.write(f"Overdue: {result.due['overdue']}")
+        if dry_run:
+            self.stdout.write(f"Would queue: {result.would_queue}")
+        else:
+            self.stdout.write(f"Queued: {result.queued}")
+        self.stdout.write(f"Missing member email: {result.missing_email}")
+        if result.delivery is not None:
+            self.stdout.write(f"Sent: {result.delivery.sent} (retry later: {result.delivery.retried}, failed: {result.delivery.failed})")
+        rate = result.total_due / result.seconds if result.seconds else 0
+        self.stdout.write(f"Elapsed: {result.seconds:.2f}s ({rate:.0f} charges/s)")
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-16 20:41
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_charge_totals(apps, schema_editor):
+    Charge = apps.get_model("campus_nexus", "Charge")
+    Payment = apps.get_model("campus_nexus", "Payment")
+    money = DecimalField(max_digits=12, decimal_places=2)
+
+    paid_subquery = (
+        Payment.objects.filter(charge_id=OuterRef("pk"), status="recorded")
+        .order_by()
+        .values("charge_id")
+        .annotate(total=Sum("amount_paid"))
+        .values("total")
+    )
+    Charge.objects.update(
+        amount_paid=Coalesce(Subquery(paid_subquery, output_field=money), Value(Decimal("0")), output_field=money)
+    )
+    Charge.objects.update(
+        balance=Greatest(F("amount_due") - F("amount_paid"), Value(Decimal("0")), output_field=money)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0038_merge_20260611_0137'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='charge',
+            name='amount_paid',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='charge',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.RunPython(backfill_charge_totals, migrations.RunPython.noop),
+    ]
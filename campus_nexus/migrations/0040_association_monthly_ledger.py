@@ -0,0 +1,74 @@
+# Generated by Django 5.2.4 on 2026-10-16 20:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_monthly_ledger(apps, schema_editor):
+    Ledger = apps.get_model("campus_nexus", "AssociationMonthlyLedger")
+    Payment = apps.get_model("campus_nexus", "Payment")
+    Expense = apps.get_model("campus_nexus", "Expense")
+
+    rows = {}
+
+    def row_for(association_id, month):
+        key = (association_id, month)
+        if key not in rows:
+            rows[key] = Ledger(association_id=association_id, month=month)
+        return rows[key]
+
+    income = (
+        Payment.objects.filter(status="recorded")
+        .order_by()
+        .annotate(month=TruncMonth("paid_at", output_field=DateField()))
+        .values("membership__association_id", "month")
+        .annotate(total=Sum("amount_paid"), n=Count("id"))
+    )
+    for r in income:
+        row = row_for(r["membership__association_id"], r["month"])
+        row.income = r["total"] or 0
+        row.payment_count = r["n"]
+
+    spent = (
+        Expense.objects.filter(status="recorded")
+        .order_by()
+        .annotate(month=TruncMonth("spent_at", output_field=DateField()))
+        .values("association_id", "month")
+        .annotate(total=Sum("amount"), n=Count("id"))
+    )
+    for r in spent:
+        row = row_for(r["association_id"], r["month"])
+        row.expenses = r["total"] or 0
+        row.expense_count = r["n"]
+
+    Ledger.objects.bulk_create(rows.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0039_charge_amount_paid_charge_balance'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AssociationMonthlyLedger',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month this row covers.')),
+                ('income', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('expenses', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('payment_count', models.PositiveIntegerField(default=0)),
+                ('expense_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('association', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_ledger', to='campus_nexus.association')),
+            ],
+            options={
+                'ordering': ('association', 'month'),
+                'constraints': [models.UniqueConstraint(fields=('association', 'month'), name='uniq_ledger_month_per_association')],
+            },
+        ),
+        migrations.RunPython(backfill_monthly_ledger, migrations.RunPython.noop),
+    ]
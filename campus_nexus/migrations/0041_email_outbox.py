@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:14
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0040_association_monthly_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailOutbox',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('to_email', models.EmailField(max_length=254)),
+                ('from_email', models.CharField(blank=True, default='', max_length=255)),
+                ('subject', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('dedup_key', models.CharField(blank=True, help_text='Per-recipient idempotency key; a second enqueue with the same key is ignored.', max_length=255, null=True, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Email Outbox Entry',
+                'verbose_name_plural': 'Email Outbox',
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='campus_nexu_status_331260_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0041_email_outbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='association',
+            index=models.Index(fields=['name'], name='campus_nexu_name_6c02c3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='cabinet',
+            index=models.Index(fields=['year'], name='campus_nexu_year_31ccd6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['name'], name='campus_nexu_name_9aa86b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['event_date'], name='campus_nexu_event_d_358d3d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='faculty',
+            index=models.Index(fields=['name'], name='campus_nexu_name_51e057_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fee',
+            index=models.Index(fields=['fee_type'], name='campus_nexu_fee_typ_04a16b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='fee',
+            index=models.Index(fields=['created_at'], name='campus_nexu_created_26e4e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='feedback',
+            index=models.Index(fields=['submitted_at'], name='campus_nexu_submitt_3c08b9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['member_type'], name='campus_nexu_member__023101_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='member',
+            index=models.Index(fields=['created_at'], name='campus_nexu_created_5c0073_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['status'], name='campus_nexu_status_c563fe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['joined_at'], name='campus_nexu_joined__d9db2d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status'], name='campus_nexu_status_1ca6fb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['payment_method'], name='campus_nexu_payment_a3531b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['paid_at'], name='campus_nexu_paid_at_1eab11_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['amount_paid'], name='campus_nexu_amount__6c2eea_idx'),
+        ),
+    ]
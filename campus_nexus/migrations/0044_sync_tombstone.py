@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:33
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0043_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('member', 'Member'), ('membership', 'Membership'), ('charge', 'Charge'), ('payment', 'Payment')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('association', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='campus_nexus.association')),
+            ],
+            options={
+                'ordering': ('-deleted_at',),
+                'indexes': [models.Index(fields=['association', 'deleted_at'], name='campus_nexu_associa_546675_idx')],
+            },
+        ),
+    ]
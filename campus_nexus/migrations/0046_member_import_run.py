@@ -0,0 +1,33 @@
+# Generated by Django 5.2.4 on 2026-10-16 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0045_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberImportRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('csv_path', models.CharField(max_length=500)),
+                ('file_hash', models.CharField(db_index=True, max_length=64)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='running', max_length=12)),
+                ('last_line', models.PositiveIntegerField(default=1)),
+                ('byte_offset', models.PositiveBigIntegerField(default=0)),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('updated_count', models.PositiveIntegerField(default=0)),
+                ('skipped_count', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ('-started_at',),
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-16 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campus_nexus', '0046_member_import_run'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='synctombstone',
+            index=models.Index(fields=['deleted_at'], name='campus_nexu_deleted_360a0e_idx'),
+        ),
+    ]
@@ -4,6 +4,7 @@ from django.core.validators import RegexValidator
 from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.db.models.functions import Now
 from django.core.files.base import ContentFile
 from django.conf import settings
 from django.core.files.storage import default_storage
@@ -21,12 +22,40 @@ except Exception:
 User = get_user_model()
 
 
+class UpdatedAtModel(models.Model):
+    """
+    Adds an indexed `updated_at` that API validators (ETag / Last-Modified) and the sync
+    feed rely on. It is also written on save(update_fields=[...]); bulk `QuerySet.update()`
+    calls must set it themselves, see `touched_if`.
+    """
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | {"updated_at"}
+        super().save(*args, **kwargs)
+
+
+def touched_if(condition):
+    """`updated_at` value for a bulk update: now for rows matching `condition`, unchanged otherwise."""
+    return models.Case(
+        models.When(condition, then=Now()),
+        default=models.F("updated_at"),
+        output_field=models.DateTimeField(),
+    )
+
+
 class Faculty(models.Model):
     name = models.CharField(max_length=100)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
       verbose_name_plural = 'Faculties'
+      indexes = [models.Index(fields=["name"])]
 
     def __str__(self):
         return self.name
@@ -77,6 +106,9 @@ class Course(models.Model):
     duration_years = models.PositiveIntegerField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["name"])]
+
     def __str__(self):
         return self.name
 
@@ -107,6 +139,8 @@ class Association(models.Model):
     theme_css_file = models.FileField(upload_to="associations/themes/", blank=True, null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["name"])]
 
     def save(self, *args, **kwargs):
         # Detect logo change BEFORE saving
@@ -151,7 +185,7 @@ class Association(models.Model):
     def __str__(self):
         return self.name
 
-class Member(models.Model):
+class Member(UpdatedAtModel):
     MEMBER_TYPES = [
         ('student', 'Student'),
         ('alumni', 'Alumni'),
@@ -174,6 +208,12 @@ class Member(models.Model):
     course = models.ForeignKey(Course, on_delete=models.SET_NULL, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["member_type"]),
+            models.Index(fields=["created_at"]),
+        ]
+
     @property
     def full_name(self):
         return f"{self.first_name} {self.last_name}"
@@ -187,7 +227,7 @@ class Member(models.Model):
     def __str__(self):
         return f"{self.full_name} ({self.registration_number})"
 
-class Membership(models.Model):
+class Membership(UpdatedAtModel):
     STATUS_CHOICES = [
         ("active", "Active"),
         ("inactive", "Inactive"),
@@ -217,6 +257,10 @@ class Membership(models.Model):
                 ),
             )
         ]
+        indexes = [
+            models.Index(fields=["status"]),
+            models.Index(fields=["joined_at"]),
+        ]
 
     def clean(self):
         super().clean()
@@ -265,6 +309,9 @@ class Cabinet(models.Model):
    association = models.ForeignKey(Association, on_delete=models.CASCADE, related_name='cabinets')
    year = models.CharField(max_length=10)
 
+   class Meta:
+       indexes = [models.Index(fields=["year"])]
+
    def __str__(self):
        return f"{self.association.name} Cabinet ({self.year})"
 
@@ -279,7 +326,7 @@ class CabinetMember(models.Model):
     def __str__(self):
         return f"{self.role} - {self.member.full_name}"
 
-class Fee(models.Model):
+class Fee(UpdatedAtModel):
     FEE_TYPE_CHOICES = [
         ('membership', 'Membership'),
         ('subscription', 'Subscription'),
@@ -298,6 +345,12 @@ class Fee(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     allow_installments = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["fee_type"]),
+            models.Index(fields=["created_at"]),
+        ]
+
     def save(self, *args, **kwargs):
         # Only apply defaults when the field hasn't been explicitly set,
         # so admin-configured values are preserved on subsequent saves.
@@ -312,7 +365,7 @@ class Fee(models.Model):
         return f"{self.association.name} - {self.get_fee_type_display()} Fee - {self.amount}"
 
 
-class Charge(models.Model):
+class Charge(UpdatedAtModel):
     PURPOSE_CHOICES = [
         ("membership_fee", "Membership Fee"),
         ("subscription_fee", "Subscription Fee"),
@@ -360,11 +413,10 @@ class Charge(models.Model):
     period_end = models.DateField(null=True, blank=True)
     is_overdue = models.BooleanField(default=False)
 
-    @property
-    def balance(self):
-        paid = self.amount_paid_total
-        remaining = self.amount_due - paid
-        return remaining if remaining > 0 else 0
+    # Denormalized totals of recorded payments, kept in sync by the payment posting path
+    # (see services.charges.refresh_charge_totals) so listings never aggregate per row.
+    amount_paid = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
 
     def clean(self):
         # Ensure membership matches association
@@ -382,12 +434,23 @@ class Charge(models.Model):
 
     @property
     def amount_paid_total(self):
-        return self.payments.aggregate(s=models.Sum("amount_paid")).get("s") or 0
+        return self.amount_paid
+
+    def refresh_payment_totals(self):
+        """Recalculate amount_paid/balance/status from recorded payments (does not save)."""
+        paid = (
+            self.payments.filter(status="recorded")
+            .aggregate(s=models.Sum("amount_paid"))
+            .get("s") or 0
+        )
+        self.amount_paid = paid
+        self.balance = max(self.amount_due - paid, 0)
+        self.recompute_status()
 
     def recompute_status(self):
         if self.status == "cancelled":
             return
-        paid = self.amount_paid_total
+        paid = self.amount_paid or 0
         if paid <= 0:
             self.status = "unpaid"
         elif paid < self.amount_due:
@@ -395,6 +458,14 @@ class Charge(models.Model):
         else:
             self.status = "paid"
 
+    def save(self, *args, **kwargs):
+        if self.amount_due is not None:
+            self.balance = max(self.amount_due - (self.amount_paid or 0), 0)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"amount_due", "amount_paid"} & set(update_fields):
+            kwargs["update_fields"] = set(update_fields) | {"balance"}
+        super().save(*args, **kwargs)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -406,7 +477,7 @@ class Charge(models.Model):
     def __str__(self):
         label = self.title or self.get_purpose_display()
         return f"{self.membership.member.full_name} • {label} • {self.amount_due}"
-class Payment(models.Model):
+class Payment(UpdatedAtModel):
     STATUS_CHOICES = [
         ("recorded", "Recorded"),
         ("reversed", "Reversed"),
@@ -437,6 +508,14 @@ class Payment(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="recorded")
     note = models.TextField(blank=True, default="")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status"]),
+            models.Index(fields=["payment_method"]),
+            models.Index(fields=["paid_at"]),
+            models.Index(fields=["amount_paid"]),
+        ]
+
     def clean(self):
         super().clean()
 
@@ -526,6 +605,31 @@ class Expense(models.Model):
         return f"{self.association.name} - {self.title} ({self.amount})"
 
 
+class AssociationMonthlyLedger(models.Model):
+    """
+    Per-association monthly rollup of recorded payments and expenses.
+    Maintained by Payment/Expense signals (services.ledger) and rebuildable with
+    `rebuild_monthly_ledger`; dashboards read trends from here instead of
+    aggregating the raw tables.
+    """
+    association = models.ForeignKey(Association, on_delete=models.CASCADE, related_name="monthly_ledger")
+    month = models.DateField(help_text="First day of the month this row covers.")
+    income = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    expenses = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    payment_count = models.PositiveIntegerField(default=0)
+    expense_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("association", "month")
+        constraints = [
+            models.UniqueConstraint(fields=["association", "month"], name="uniq_ledger_month_per_association"),
+        ]
+
+    def __str__(self):
+        return f"{self.association.name} - {self.month:%b %Y}"
+
+
 class PaymentReminderLog(models.Model):
     REMINDER_TYPES = [
         ("before_due", "Before Due"),
@@ -595,7 +699,137 @@ class AuditLog(models.Model):
         return f"{self.created_at} | {self.action} | {self.model_name}#{self.object_id}"
 
 
-class Event(models.Model):
+class EmailOutbox(models.Model):
+    """
+    Transactional outbox for notification emails. Services enqueue rows in the same
+    transaction as the change they describe; `run_email_worker` delivers them.
+    """
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    ]
+
+    to_email = models.EmailField()
+    from_email = models.CharField(max_length=255, blank=True, default="")
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    dedup_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text="Per-recipient idempotency key; a second enqueue with the same key is ignored.",
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        verbose_name = "Email Outbox Entry"
+        verbose_name_plural = "Email Outbox"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.to_email} | {self.subject} ({self.status})"
+
+
+class IdempotencyKey(models.Model):
+    """
+    Result of an API POST sent with an `Idempotency-Key` header. A retry with the same key
+    and request gets the stored response back until `expires_at`; `purge_idempotency_keys`
+    deletes expired rows.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    key = models.CharField(max_length=255)
+    request_hash = models.CharField(max_length=64)
+    # Empty until the request that claimed the key has produced its response.
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_body = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="unique_idempotency_key_per_user"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} ({self.status_code})"
+
+
+class SyncTombstone(models.Model):
+    """
+    A deleted row as seen by one association's `/sync/` feed. Written by post_delete
+    hooks; clients that have synced past `deleted_at` drop the row locally.
+    """
+    KIND_CHOICES = [
+        ("member", "Member"),
+        ("membership", "Membership"),
+        ("charge", "Charge"),
+        ("payment", "Payment"),
+    ]
+
+    # No FK constraint: tombstones are written while an association's rows are being
+    # cascade-deleted, and outliving the association is harmless.
+    association = models.ForeignKey(
+        Association, on_delete=models.DO_NOTHING, db_constraint=False, related_name="+"
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ("-deleted_at",)
+        indexes = [
+            models.Index(fields=["association", "deleted_at"]),
+            models.Index(fields=["deleted_at"]),  # purge_sync_tombstones
+        ]
+
+    def __str__(self):
+        return f"{self.kind}#{self.object_id} deleted @ {self.deleted_at}"
+
+
+class MemberImportRun(models.Model):
+    """
+    Checkpoint of an `import_members_csv` run. Updated in the same transaction as each
+    committed chunk, so `last_line` / `byte_offset` always point just past rows that are in
+    the database; `--resume` seeks to `byte_offset` of the latest unfinished run for a file
+    with the same `file_hash`.
+    """
+    STATUS_CHOICES = [
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    ]
+
+    csv_path = models.CharField(max_length=500)
+    file_hash = models.CharField(max_length=64, db_index=True)
+    status = models.CharField(max_length=12, choices=STATUS_CHOICES, default="running")
+    last_line = models.PositiveIntegerField(default=1)
+    byte_offset = models.PositiveBigIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    skipped_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-started_at",)
+
+    def __str__(self):
+        return f"{self.csv_path} ({self.status}, line {self.last_line})"
+
+
+class Event(UpdatedAtModel):
     association = models.ForeignKey(Association, on_delete=models.CASCADE, related_name='events')
     title = models.CharField(max_length=200)
     description = models.TextField()
@@ -604,6 +838,9 @@ class Event(models.Model):
     posted_by = models.ForeignKey(Membership, on_delete=models.SET_NULL, null=True, related_name='posted_events')
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["event_date"])]
+
     def __str__(self):
         return self.title
 
@@ -625,6 +862,7 @@ class Feedback(models.Model):
 
     class Meta:
         ordering = ("-submitted_at",)
+        indexes = [models.Index(fields=["submitted_at"])]
 
     def __str__(self):
         who = self.member.full_name if self.member else (self.submitted_by.username if self.submitted_by else "Unknown")
@@ -720,7 +958,7 @@ class GuildExecutive(models.Model):
             return f"{self.get_position_type_display()} of {self.ministry} - {self.member.full_name}"
         return f"{self.get_position_type_display()} - {self.member.full_name}"
 
-class Announcement(models.Model):
+class Announcement(UpdatedAtModel):
     AUDIENCE_CHOICES = [
         ("all", "Everyone"),
         ("association", "Specific Association"),
@@ -990,11 +1228,8 @@ class BillMembership(models.Model):
     
     @property
     def amount_paid_total(self):
-        from django.db.models import Sum
-        return self.charges.aggregate(
-            total=Sum('payments__amount_paid',
-                     filter=models.Q(payments__status='recorded'))
-        )['total'] or 0
+        # Charges keep their recorded-payment totals in Charge.amount_paid.
+        return self.charges.aggregate(total=models.Sum('amount_paid'))['total'] or 0
     
     @property
     def balance(self):
@@ -1,20 +1,11 @@
-import logging
-
 from django.conf import settings
-from django.core.mail import send_mail
 
-logger = logging.getLogger(__name__)
+from campus_nexus.services.outbox import enqueue_email, enqueue_emails, outbox_email
 
 
-def send_payment_recorded_email(*, member, association, payment, charge):
-    """
-    Sends a payment confirmation email to the member.
-    Errors are logged but never raised — email delivery must never crash the admin page.
-    """
+def _payment_recorded_fields(member, association, payment, charge) -> dict:
+    """enqueue_email() / outbox_email() arguments for a payment confirmation."""
     to_email = member.email
-    if not to_email:
-        return
-
     subject = f"Payment received - {association.name}"
 
     purpose = getattr(charge, "title", "") or getattr(charge, "purpose", "Payment")
@@ -36,20 +27,33 @@ def send_payment_recorded_email(*, member, association, payment, charge):
 
     message += "Thank you.\nCampus Nexus"
 
-    try:
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None) or settings.EMAIL_HOST_USER,
-            recipient_list=[to_email],
-            fail_silently=False,
-        )
-    except Exception as exc:
-        # Log the error so it appears in server logs but never propagate it —
-        # a broken SMTP config must never prevent a treasurer from recording a payment.
-        logger.exception(
-            "Payment confirmation email failed for member %s (payment #%s): %s",
-            member.pk,
-            payment.pk,
-            exc,
-        )
+    return {
+        "to": to_email,
+        "subject": subject,
+        "body": message,
+        "from_email": getattr(settings, "DEFAULT_FROM_EMAIL", None) or settings.EMAIL_HOST_USER,
+        "dedup_key": f"payment-recorded:{payment.pk}:{to_email}",
+    }
+
+
+def send_payment_recorded_email(*, member, association, payment, charge):
+    """
+    Queues a payment confirmation email to the member in the email outbox.
+    """
+    if not member.email:
+        return
+
+    # Delivery happens in run_email_worker, so a slow or broken SMTP server
+    # never holds up (or fails) recording the payment.
+    enqueue_email(**_payment_recorded_fields(member, association, payment, charge))
+
+
+def queue_payment_recorded_emails(payments) -> int:
+    """Bulk version for payments written without post_payment() (membership, member, association and charge loaded)."""
+    entries = [
+        outbox_email(**_payment_recorded_fields(p.membership.member, p.membership.association, p, p.charge))
+        for p in payments
+        if p.membership.member.email
+    ]
+    enqueue_emails(entries)
+    return len(entries)
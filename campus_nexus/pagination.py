@@ -0,0 +1,111 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the primary key for every API list endpoint.
+
+    Each page is `WHERE id < <cursor> ORDER BY id DESC LIMIT n`, so deep pages cost the
+    same as the first one: no COUNT(*) and no OFFSET scan. Clients pick a page size with
+    `?page_size=`, capped at API_MAX_PAGE_SIZE.
+
+    With `?ordering=<field>` the cursor is the pair `(field, id)` and a page is
+    `WHERE field > v OR (field = v AND id > pk)`, so ties and NULLs (sorted as the
+    smallest value) neither repeat nor skip rows and never fall back to OFFSET.
+    """
+    ordering = "-id"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        self.page_size = int(getattr(settings, "API_PAGE_SIZE", 50))
+        self.max_page_size = int(getattr(settings, "API_MAX_PAGE_SIZE", 500))
+        return super().get_page_size(request)
+
+    def _keyset_field(self):
+        field = self.ordering[0].lstrip("-")
+        return None if field in ("id", "pk") else field
+
+    def _get_position_from_instance(self, instance, ordering):
+        field = self._keyset_field()
+        if field is None:
+            return super()._get_position_from_instance(instance, ordering)
+        value = instance[field] if isinstance(instance, dict) else getattr(instance, field)
+        pk = instance["id"] if isinstance(instance, dict) else instance.pk
+        return json.dumps([None if value is None else str(value), pk])
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.get_page_size(request) and self._composite_ordering(request, queryset, view):
+            return self._paginate_composite(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def _composite_ordering(self, request, queryset, view):
+        self.ordering = self.get_ordering(request, queryset, view)
+        return self._keyset_field() is not None
+
+    def _paginate_composite(self, queryset, request):
+        # Mirrors CursorPagination.paginate_queryset with a (field, id) position.
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        offset, reverse, current_position = self.cursor or (0, False, None)
+
+        field = self._keyset_field()
+        descending = self.ordering[0].startswith("-") != reverse
+        if descending:
+            queryset = queryset.order_by(F(field).desc(nulls_last=True), "-id")
+        else:
+            queryset = queryset.order_by(F(field).asc(nulls_first=True), "id")
+        if current_position is not None:
+            try:
+                queryset = queryset.filter(self._after(field, descending, current_position))
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following_position = len(results) > len(self.page)
+        following_position = (
+            self._get_position_from_instance(results[-1], self.ordering) if has_following_position else None
+        )
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None or offset > 0
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _after(self, field, descending, position):
+        """Rows strictly after `position` in (field, id) order, NULL sorting before any value."""
+        try:
+            value, pk = json.loads(position)
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if descending:
+            if value is None:
+                return Q(**{f"{field}__isnull": True, "id__lt": pk})
+            return Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk}) | Q(**{f"{field}__isnull": True})
+        if value is None:
+            return Q(**{f"{field}__isnull": True, "id__gt": pk}) | Q(**{f"{field}__isnull": False})
+        return Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk})
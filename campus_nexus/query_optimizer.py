@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+@dataclass
+class QueryPlan:
+    select_related: set = field(default_factory=set)
+    prefetch_related: set = field(default_factory=set)
+    only: set = field(default_factory=set)
+    # Paths ("" = the root model) whose columns are read by a property or method we
+    # cannot see into, e.g. `member.full_name`; every concrete column is loaded for them.
+    full_models: dict = field(default_factory=dict)
+
+
+def _concrete_names(model) -> list[str]:
+    return [f.name for f in model._meta.concrete_fields]
+
+
+def _join(prefix: str, name: str) -> str:
+    return f"{prefix}__{name}" if prefix else name
+
+
+def _walk(plan: QueryPlan, model, prefix: str, serializer_fields) -> None:
+    for serializer_field in serializer_fields.values():
+        if serializer_field.write_only:
+            continue
+        if serializer_field.source == "*":
+            plan.full_models[prefix] = model
+            continue
+
+        attrs = serializer_field.source_attrs
+        current, path = model, prefix
+        for i, attr in enumerate(attrs):
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                # Property / method: it may read any column of the model it hangs off.
+                plan.full_models[path] = current
+                break
+
+            name = _join(path, attr)
+            last = i == len(attrs) - 1
+            if model_field.many_to_many or model_field.one_to_many:
+                plan.prefetch_related.add(name)
+                break
+            if not model_field.is_relation:
+                plan.only.add(name)
+                break
+
+            # Forward FK / one-to-one.
+            plan.only.add(name)
+            if last and isinstance(serializer_field, serializers.BaseSerializer):
+                plan.select_related.add(name)
+                _walk(plan, model_field.related_model, name, serializer_field.fields)
+            elif not last:
+                plan.select_related.add(name)
+            current, path = model_field.related_model, name
+
+
+@lru_cache(maxsize=512)
+def plan_for(model, serializer_class, fields: tuple = (), include: tuple = ()) -> QueryPlan:
+    """
+    Work out select_related / prefetch_related / only() for a serializer from its
+    fields' `source` paths, including embedded `include` serializers. Cached per
+    (model, serializer class, sparse fields, includes); the plan only depends on those.
+    """
+    plan = QueryPlan()
+    serializer = serializer_class(context={"fields": fields, "include": include})
+    _walk(plan, model, "", serializer.fields)
+    for path, path_model in plan.full_models.items():
+        plan.only.update(_join(path, name) for name in _concrete_names(path_model))
+    plan.only.add(model._meta.pk.name)
+    return plan
+
+
+def sparse_params(request) -> tuple[tuple, tuple]:
+    """`?fields=` and `?include=` as sorted, de-duplicated tuples (hashable for plan_for)."""
+    def split(name):
+        return tuple(sorted({v.strip() for v in request.query_params.get(name, "").split(",") if v.strip()}))
+    return split("fields"), split("include")
+
+
+def optimize_for_serializer(
+    queryset, serializer_class, *, fields: tuple = (), include: tuple = (), ordering: tuple = ()
+):
+    """`ordering` columns are always loaded: the cursor paginator reads them off every row."""
+    plan = plan_for(queryset.model, serializer_class, fields, include)
+    if plan.select_related:
+        queryset = queryset.select_related(*sorted(plan.select_related))
+    if plan.prefetch_related:
+        queryset = queryset.prefetch_related(*sorted(plan.prefetch_related))
+    return queryset.only(*sorted(plan.only | {term.lstrip("-") for term in ordering}))
+
+
+class SerializerQueryOptimizerMixin:
+    """
+    Applies optimize_for_serializer() to read requests so list and detail endpoints
+    fetch exactly the rows and columns their serializer renders, in a fixed number
+    of queries. On reads `?fields=` / `?include=` are passed to the serializer and
+    shape the query the same way. Writes keep the plain queryset and full
+    serializer so model save() sees every field.
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method in SAFE_METHODS:
+            context["fields"], context["include"] = sparse_params(self.request)
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        fields, include = sparse_params(self.request)
+        paginator = self.paginator
+        ordering = paginator.get_ordering(self.request, queryset, self) if hasattr(paginator, "get_ordering") else ()
+        return optimize_for_serializer(
+            queryset, self.get_serializer_class(), fields=fields, include=include, ordering=tuple(ordering)
+        )
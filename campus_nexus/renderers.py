@@ -0,0 +1,94 @@
+"""
+Faster wire formats for the API.
+
+`FastJSONRenderer` / `FastJSONParser` encode and decode with orjson when it is installed
+and produce the same bytes as DRF's JSON renderer; without orjson they are DRF's own
+classes. `MessagePackRenderer` / `MessagePackParser` add `application/msgpack` (or
+`?format=msgpack`) for the mobile app when msgpack is installed. Both packages are
+optional; settings only switch to these classes when the package can be imported.
+"""
+from __future__ import annotations
+
+from django.conf import settings
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional wire format
+    msgpack = None
+
+MSGPACK_AVAILABLE = msgpack is not None
+
+# Types orjson would write differently from DRF's encoder are handed to it instead:
+# datetimes (DRF writes "Z" and millisecond precision), Decimal, lazy strings, ...
+_drf_default = JSONEncoder().default
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """JSONRenderer that encodes compact responses with orjson; indented ones stay on json.dumps."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which json.dumps still handles.
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer: U+2028/U+2029 are invalid inside JavaScript strings.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser that decodes with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        body = stream.read() if stream is not None else b""
+        try:
+            if encoding.lower().replace("-", "") != "utf8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # msgpack has no datetime/Decimal types of its own; they go out as the JSON API sends them.
+        return msgpack.packb(data, default=_drf_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
+
+
+# Parsers for endpoints that take structured bodies only (no forms or uploads).
+DATA_PARSER_CLASSES = (FastJSONParser if orjson else JSONParser,) + ((MessagePackParser,) if MSGPACK_AVAILABLE else ())
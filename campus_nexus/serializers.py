@@ -1,29 +1,93 @@
 from rest_framework import serializers
 from campus_nexus.models import (
     Faculty, Course, Association, Member, Cabinet, CabinetMember,
-    Payment, Event, Fee, Membership, Feedback
+    Charge, Payment, Event, Fee, Membership, Feedback
 )
-
-
-class FacultySerializer(serializers.ModelSerializer):
+from campus_nexus.services.payments import post_payment
+
+
+# Sparse-fieldset serializers by class name, filled as they are defined; `includes` refer
+# to them by name because a nested serializer may be defined further down the module.
+SERIALIZER_REGISTRY: dict[str, type] = {}
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    Honours `fields` / `include` from the serializer context (set by the API views from
+    `?fields=a,b` and `?include=membership.member,charge`).
+
+    `fields` keeps only the named fields. `include` swaps FK ids for embedded objects;
+    `includes` is the per-resource allow-list mapping an FK field to the name of the
+    serializer that renders it, and nested paths follow the nested serializer's own list.
+    """
+    includes: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        SERIALIZER_REGISTRY[cls.__name__] = cls
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        context = kwargs.get("context") or {}
+        fields, include = context.get("fields"), context.get("include")
+        if fields or include:
+            self.restrict(fields, include_tree(include or ()))
+
+    def restrict(self, fields, tree):
+        for name, subtree in tree.items():
+            if name not in self.includes:
+                raise serializers.ValidationError(
+                    {"include": f"'{name}' cannot be included here. Allowed: {', '.join(sorted(self.includes)) or 'none'}."}
+                )
+            nested = SERIALIZER_REGISTRY[self.includes[name]](read_only=True)
+            if subtree:
+                nested.restrict(None, subtree)
+            self.fields[name] = nested
+
+        if fields:
+            unknown = set(fields) - set(self.fields)
+            if unknown:
+                raise serializers.ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}."})
+            keep = set(fields) | set(tree)
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+
+
+def include_tree(paths) -> dict:
+    """("membership.member", "charge") -> {"membership": {"member": {}}, "charge": {}}"""
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+
+class FacultySerializer(SparseFieldsetSerializer):
     class Meta:
         model = Faculty
         fields = '__all__'
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsetSerializer):
+    includes = {"faculty": "FacultySerializer"}
+
     class Meta:
         model = Course
         fields = '__all__'
 
 
-class AssociationSerializer(serializers.ModelSerializer):
+class AssociationSerializer(SparseFieldsetSerializer):
+    includes = {"faculty": "FacultySerializer"}
+
     class Meta:
         model = Association
         fields = '__all__'
 
 
-class MemberSerializer(serializers.ModelSerializer):
+class MemberSerializer(SparseFieldsetSerializer):
+    includes = {"faculty": "FacultySerializer", "course": "CourseSerializer"}
     full_name = serializers.ReadOnlyField()
 
     class Meta:
@@ -31,14 +95,16 @@ class MemberSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class CabinetSerializer(serializers.ModelSerializer):
+class CabinetSerializer(SparseFieldsetSerializer):
+    includes = {"association": "AssociationSerializer"}
     association_name = serializers.CharField(source="association.name", read_only=True)
 
     class Meta:
         model = Cabinet
         fields = '__all__'
 
-class CabinetMemberSerializer(serializers.ModelSerializer):
+class CabinetMemberSerializer(SparseFieldsetSerializer):
+    includes = {"cabinet": "CabinetSerializer", "member": "MemberSerializer"}
     member_name = serializers.CharField(source="member.full_name", read_only=True)
 
     class Meta:
@@ -46,31 +112,58 @@ class CabinetMemberSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class PaymentSerializer(serializers.ModelSerializer):
+class ChargeSerializer(SparseFieldsetSerializer):
+    """Read-only; charges are embedded via `?include=charge` but not written through the API."""
+    class Meta:
+        model = Charge
+        fields = '__all__'
+        read_only_fields = [f.name for f in Charge._meta.concrete_fields]
+
+
+class PaymentSerializer(SparseFieldsetSerializer):
+    includes = {"membership": "MembershipSerializer", "charge": "ChargeSerializer"}
+
     class Meta:
         model = Payment
         fields = '__all__'
 
+    # Writes go through post_payment() so charge/bill totals and the receipt email are handled once.
+    def create(self, validated_data):
+        return post_payment(Payment(**validated_data))
+
+    def update(self, instance, validated_data):
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        return post_payment(instance)
+
+
+class EventSerializer(SparseFieldsetSerializer):
+    includes = {"association": "AssociationSerializer", "posted_by": "MembershipSerializer"}
 
-class EventSerializer(serializers.ModelSerializer):
     class Meta:
         model = Event
         fields = '__all__'
 
 
-class FeeSerializer(serializers.ModelSerializer):
+class FeeSerializer(SparseFieldsetSerializer):
+    includes = {"association": "AssociationSerializer"}
+
     class Meta:
         model = Fee
         fields = '__all__'
 
 
-class MembershipSerializer(serializers.ModelSerializer):
+class MembershipSerializer(SparseFieldsetSerializer):
+    includes = {"member": "MemberSerializer", "association": "AssociationSerializer"}
+
     class Meta:
         model = Membership
         fields = '__all__'
 
 
-class FeedbackSerializer(serializers.ModelSerializer):
+class FeedbackSerializer(SparseFieldsetSerializer):
+    includes = {"association": "AssociationSerializer", "member": "MemberSerializer"}
+
     class Meta:
         model = Feedback
         fields = '__all__'
\ No newline at end of file
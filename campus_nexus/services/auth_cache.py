@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from campus_nexus.models import AssociationAdmin, Dean, Guild
+
+KEY_PREFIX = "campus_nexus:auth-user"
+
+# What authentication and the role checks after it read. Everything else (username,
+# the password hash, names, ...) stays out of the cache and is deferred on the rebuilt user.
+USER_FIELDS = ("id", "is_active", "is_superuser", "is_staff")
+
+# The role rows permission checks read, with the columns kept for each. Missing ones are
+# cached as absent too, so `getattr(user, "association_admin", None)` does not query either.
+ROLE_FIELDS = {
+    "association_admin": (AssociationAdmin, ("id", "association_id")),
+    "guild": (Guild, ("id",)),
+    "dean": (Dean, ("id",)),
+}
+
+
+def _version_key(user_id) -> str:
+    return f"{KEY_PREFIX}:version:{user_id}"
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "AUTH_USER_CACHE_TTL", 60))
+
+
+def load_auth_snapshot(user_id) -> dict | None:
+    """
+    The user's `USER_FIELDS`, role ids and the md5 of their password hash (what the
+    revoke-token check compares against) in one query, or None if there is no such user.
+    """
+    lookups = [f"{relation}__{field}" for relation, (_, fields) in ROLE_FIELDS.items() for field in fields]
+    row = get_user_model().objects.filter(pk=user_id).values(*USER_FIELDS, "password", *lookups).first()
+    if row is None:
+        return None
+    snapshot = {field: row[field] for field in USER_FIELDS}
+    snapshot["password_md5"] = get_md5_hash_password(row.pop("password"))
+    for relation, (_, fields) in ROLE_FIELDS.items():
+        values = tuple(row[f"{relation}__{field}"] for field in fields)
+        snapshot[relation] = None if values[0] is None else values
+    return snapshot
+
+
+def _from_values(model, values: dict):
+    # Model.from_db() takes the loaded values in concrete field order; the rest are deferred.
+    names = [f.attname for f in model._meta.concrete_fields if f.attname in values]
+    return model.from_db(None, names, [values[name] for name in names])
+
+
+def build_auth_user(snapshot: dict):
+    """
+    A user instance from `snapshot` with its role rows attached. Columns not in the
+    snapshot are deferred, so reading one loads it and `save()` only writes loaded ones.
+    """
+    User = get_user_model()
+    user = _from_values(User, {field: snapshot[field] for field in USER_FIELDS})
+    for relation, (model, fields) in ROLE_FIELDS.items():
+        role = None
+        if snapshot[relation] is not None:
+            role = _from_values(model, {"user_id": user.pk, **dict(zip(fields, snapshot[relation]))})
+            model._meta.get_field("user").set_cached_value(role, user)
+        User._meta.get_field(relation).set_cached_value(user, role)
+    return user
+
+
+def get_auth_snapshot(user_id) -> dict | None:
+    """
+    Return `load_auth_snapshot(user_id)`, served from cache for AUTH_USER_CACHE_TTL seconds
+    (0 disables). Entries are keyed by the user's version stamp, which
+    `invalidate_auth_user()` bumps whenever the user or one of their role rows changes,
+    so a warm request costs two cache reads and no queries.
+    """
+    ttl = _ttl()
+    if ttl <= 0:
+        return load_auth_snapshot(user_id)
+
+    version = cache.get(_version_key(user_id), 0)
+    cache_key = f"{KEY_PREFIX}:{user_id}:{version}"
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = load_auth_snapshot(user_id)
+        if snapshot is not None:
+            cache.set(cache_key, snapshot, timeout=ttl)
+    return snapshot
+
+
+def invalidate_auth_user(user_id) -> None:
+    """Drop the cached user once the current transaction commits."""
+    if not user_id:
+        return
+
+    def bump():
+        cache.set(_version_key(user_id), time.time_ns(), timeout=None)
+
+    transaction.on_commit(bump)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Q, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from campus_nexus.models import BillMembership, Charge
+
+ZERO = Decimal("0.00")
+MONEY = DecimalField(max_digits=12, decimal_places=2)
+SETTLED_STATUSES = ("paid", "waived", "cancelled")
+
+
+def _money(subquery: QuerySet) -> Coalesce:
+    return Coalesce(Subquery(subquery, output_field=MONEY), Value(ZERO), output_field=MONEY)
+
+
+def annotate_bill_totals(queryset: QuerySet) -> QuerySet:
+    """
+    Annotate bills with members_count/total_due/total_waived/total_collected.
+
+    Each figure is its own correlated subquery, so bill memberships and charges are never
+    joined against each other (no fan-out), and collections come from the stored
+    Charge.amount_paid column rather than scanning payment history.
+    """
+    live = (
+        BillMembership.objects.filter(bill=OuterRef("pk"))
+        .exclude(status="cancelled")
+        .order_by()
+        .values("bill")
+    )
+    collected = (
+        Charge.objects.filter(bill_membership__bill=OuterRef("pk"))
+        .order_by()
+        .values("bill_membership__bill")
+        .annotate(total=Sum("amount_paid"))
+        .values("total")
+    )
+    return queryset.annotate(
+        members_count=Coalesce(
+            Subquery(live.annotate(n=Count("id")).values("n"), output_field=IntegerField()),
+            Value(0),
+        ),
+        total_due=_money(live.annotate(total=Sum("amount_due")).values("total")),
+        total_waived=_money(live.annotate(total=Sum("amount_waived")).values("total")),
+        total_collected=_money(collected),
+    )
+
+
+def annotate_bill_membership_paid(queryset: QuerySet) -> QuerySet:
+    """Annotate bill memberships with `paid_total` from their charges' stored amount_paid."""
+    paid = (
+        Charge.objects.filter(bill_membership=OuterRef("pk"))
+        .order_by()
+        .values("bill_membership")
+        .annotate(total=Sum("amount_paid"))
+        .values("total")
+    )
+    return queryset.annotate(paid_total=_money(paid))
+
+
+def parse_outstanding_cursor(raw: str | None) -> tuple[Decimal, int] | None:
+    """Decode the `after` cursor ("<outstanding>:<pk>"); malformed cursors restart from the top."""
+    if not raw:
+        return None
+    try:
+        amount, pk = raw.rsplit(":", 1)
+        return Decimal(amount), int(pk)
+    except (ValueError, InvalidOperation):
+        return None
+
+
+def outstanding_bill_memberships(
+    association_id: int,
+    *,
+    after: tuple[Decimal, int] | None = None,
+    limit: int = 20,
+) -> tuple[list[BillMembership], str | None]:
+    """
+    One page of open bill memberships with a positive balance, largest balance first.
+
+    Each row carries `paid_total` and `outstanding` annotations; the second return value
+    is the cursor for the next page (None on the last page). The cursor keeps pages stable
+    while balances change, but `outstanding` is computed, not indexed: every page still
+    evaluates the paid subquery for all of the association's open bill memberships
+    before filtering and sorting, so a deep page costs the same as the first.
+    """
+    qs = (
+        annotate_bill_membership_paid(
+            BillMembership.objects.filter(bill__association_id=association_id, bill__status="active")
+            .exclude(status__in=SETTLED_STATUSES)
+        )
+        .annotate(outstanding=F("amount_due") - F("paid_total") - F("amount_waived"))
+        .filter(outstanding__gt=0)
+    )
+    if after is not None:
+        amount, pk = after
+        qs = qs.filter(Q(outstanding__lt=amount) | Q(outstanding=amount, pk__lt=pk))
+
+    rows = list(
+        qs.select_related("membership__member", "bill").order_by("-outstanding", "-pk")[: limit + 1]
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = f"{last.outstanding}:{last.pk}"
+    return rows, next_cursor
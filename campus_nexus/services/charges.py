@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from decimal import Decimal
+
 from django.db import transaction
+from django.db.models import Case, DecimalField, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 
-from campus_nexus.models import Charge, Fee, Membership
+from campus_nexus.models import Charge, Fee, Membership, Payment, touched_if
 from campus_nexus.services.subscriptions import ensure_current_subscription_charge
 
 
@@ -72,3 +76,55 @@ def create_charge_custom(
     charge.recompute_status()
     charge.save(update_fields=["status"])
     return charge
+
+
+@transaction.atomic
+def refresh_charge_totals(charge_id) -> Charge | None:
+    """
+    Lock one charge and bring amount_paid / balance / status in line with its
+    recorded payments. Called from the payment posting path so the stored
+    totals change in the same transaction as the payment itself.
+    """
+    charge = Charge.objects.select_for_update().filter(pk=charge_id).first()
+    if charge is None:
+        return None
+    charge.refresh_payment_totals()
+    charge.save(update_fields=["amount_paid", "balance", "status"])
+    return charge
+
+
+def rebuild_charge_totals(association_id: int | None = None, *, charge_ids=None) -> int:
+    """
+    Set-based recomputation of Charge.amount_paid / balance / status, optionally limited
+    to one association and/or the given charges.
+    Runs three UPDATE statements regardless of how many charges exist.
+    Returns the number of charges touched.
+    """
+    money = DecimalField(max_digits=12, decimal_places=2)
+    paid_subquery = (
+        Payment.objects.filter(charge_id=OuterRef("pk"), status="recorded")
+        .order_by()
+        .values("charge_id")
+        .annotate(total=Sum("amount_paid"))
+        .values("total")
+    )
+
+    charges = Charge.objects.all()
+    if association_id is not None:
+        charges = charges.filter(association_id=association_id)
+    if charge_ids is not None:
+        charges = charges.filter(pk__in=list(charge_ids))
+
+    new_paid = Coalesce(Subquery(paid_subquery, output_field=money), Value(Decimal("0")), output_field=money)
+    new_balance = Greatest(F("amount_due") - F("amount_paid"), Value(Decimal("0")), output_field=money)
+    new_status = Case(
+        When(Q(amount_paid__lte=0), then=Value("unpaid")),
+        When(Q(amount_paid__lt=F("amount_due")), then=Value("partial")),
+        default=Value("paid"),
+    )
+    # SET expressions see the old row, so updated_at only moves for rows whose value changes.
+    with transaction.atomic():
+        touched = charges.update(amount_paid=new_paid, updated_at=touched_if(~Q(amount_paid=new_paid)))
+        charges.update(balance=new_balance, updated_at=touched_if(~Q(balance=new_balance)))
+        charges.exclude(status="cancelled").update(status=new_status, updated_at=touched_if(~Q(status=new_status)))
+    return touched
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+KEY_PREFIX = "campus_nexus:dashboard"
+GLOBAL_SCOPE = "global"
+ANNOUNCEMENTS_SCOPE = "announcements"
+REFRESH_PARAM = "refresh_dashboard"
+
+
+def association_scope(association_id: int) -> str:
+    return f"association:{association_id}"
+
+
+def _version_key(scope: str) -> str:
+    return f"{KEY_PREFIX}:version:{scope}"
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "DASHBOARD_CACHE_TTL", 300))
+
+
+def _stale_seconds() -> int:
+    return int(getattr(settings, "DASHBOARD_CACHE_STALE_SECONDS", 600))
+
+
+def wants_live_dashboard(request) -> bool:
+    """`?refresh_dashboard=1` on the admin index bypasses the snapshot and rewrites it."""
+    return bool(request is not None and request.GET.get(REFRESH_PARAM) == "1")
+
+
+def get_dashboard_snapshot(
+    key: str,
+    scopes: Iterable[str],
+    builder: Callable[[], dict[str, Any]],
+    *,
+    force: bool = False,
+) -> dict[str, Any]:
+    """
+    Return the cached payload for `key`, rebuilding it with `builder` when needed.
+
+    A snapshot is fresh while it is younger than DASHBOARD_CACHE_TTL and none of its
+    scopes has been invalidated since it was built. Once it goes stale it keeps being
+    served for up to DASHBOARD_CACHE_STALE_SECONDS while a single request (holding a
+    short cache lock) rebuilds it, so a burst of index hits never recomputes in parallel.
+    """
+    ttl = _ttl()
+    if ttl <= 0:
+        return builder()
+
+    cache_key = f"{KEY_PREFIX}:{key}"
+    version_keys = [_version_key(scope) for scope in scopes]
+    cached = cache.get_many([cache_key, *version_keys])
+    signature = tuple(cached.get(k) for k in version_keys)
+    entry = cached.get(cache_key)
+    lock_key = f"{cache_key}:lock"
+    locked = False
+
+    if entry is not None and not force:
+        age = time.time() - entry["computed_at"]
+        if entry["signature"] == signature and age < ttl:
+            return entry["payload"]
+        if age < ttl + _stale_seconds():
+            locked = cache.add(lock_key, 1, timeout=60)
+            if not locked:
+                return entry["payload"]
+
+    try:
+        payload = builder()
+        cache.set(
+            cache_key,
+            {"payload": payload, "signature": signature, "computed_at": time.time()},
+            timeout=ttl + _stale_seconds(),
+        )
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return payload
+
+
+def invalidate_dashboards(association_id: int | None = None, *, announcements: bool = False) -> None:
+    """
+    Mark the global dashboards (and one association's) stale once the current transaction
+    commits. `announcements=True` also reaches every association dashboard, since those
+    list campus-wide announcements.
+    """
+    scopes = [GLOBAL_SCOPE]
+    if association_id:
+        scopes.append(association_scope(association_id))
+    if announcements:
+        scopes.append(ANNOUNCEMENTS_SCOPE)
+
+    def bump():
+        stamp = time.time_ns()
+        cache.set_many({_version_key(scope): stamp for scope in scopes}, timeout=None)
+
+    transaction.on_commit(bump)
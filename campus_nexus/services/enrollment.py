@@ -0,0 +1,145 @@
+"""
+Set-based membership enrollment for cohort imports.
+
+`enroll_members` takes (line number, registration number, association name, status) rows
+and validates each chunk against two queries: the members by registration number and all
+of their existing memberships. The duplicate check and the "one faculty-based association
+per member" rule (`Membership.clean` / `MembershipAdminForm.clean`) then run on in-memory
+sets, and the valid memberships are written with `bulk_create`. Since `bulk_create` skips
+`post_save`, the welcome emails are queued in one outbox insert and the dashboards are
+invalidated once per association.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from campus_nexus.models import Association, Member, Membership
+from campus_nexus.services.dashboard_cache import invalidate_dashboards
+from campus_nexus.services.membership_emails import queue_membership_assigned_emails
+
+STATUSES = tuple(value for value, _ in Membership.STATUS_CHOICES)
+
+
+@dataclass
+class EnrollmentResult:
+    created: int = 0
+    existing: int = 0
+    emails_queued: int = 0
+    skipped: list[tuple[int, str]] = field(default_factory=list)
+
+
+def _faculty_rule_message(association_name: str, faculty_name: str) -> str:
+    return (
+        "Member you are trying to add belongs to a faculty-based association "
+        f"({association_name} - {faculty_name}). "
+        "You cannot add this member to another faculty-based association."
+    )
+
+
+def _load_associations() -> tuple[dict[str, Association], set[str]]:
+    """Associations by case-insensitive name, plus the names shared by more than one."""
+    by_name, ambiguous = {}, set()
+    for association in Association.objects.select_related("faculty"):
+        key = association.name.strip().casefold()
+        if key in by_name:
+            ambiguous.add(key)
+        by_name[key] = association
+    return by_name, ambiguous
+
+
+def _enroll_chunk(chunk, associations, ambiguous, result: EnrollmentResult) -> None:
+    registration_numbers = {reg for _, reg, _, _ in chunk if reg}
+    members = {
+        m.registration_number: m
+        for m in Member.objects.filter(registration_number__in=registration_numbers).select_related("faculty")
+    }
+
+    # One query for every existing membership of the chunk's members: the pairs catch
+    # duplicates, the faculty-based ones drive the one-faculty rule.
+    joined: set[tuple[int, int]] = set()
+    faculty_memberships: dict[int, tuple[int, str, str]] = {}
+    existing = Membership.objects.filter(member_id__in=[m.pk for m in members.values()]).values_list(
+        "member_id", "association_id", "association__name", "association__faculty_id", "association__faculty__name",
+    )
+    for member_id, association_id, association_name, faculty_id, faculty_name in existing:
+        joined.add((member_id, association_id))
+        if faculty_id is not None:
+            faculty_memberships.setdefault(member_id, (faculty_id, association_name, faculty_name))
+
+    today = timezone.localdate()
+    new = []
+    for line_number, registration_number, association_name, status in chunk:
+        if not registration_number:
+            result.skipped.append((line_number, "Missing registration number."))
+            continue
+        if not association_name:
+            result.skipped.append((line_number, "Missing association."))
+            continue
+        member = members.get(registration_number)
+        if member is None:
+            result.skipped.append((line_number, f"No member with registration number {registration_number}."))
+            continue
+        key = association_name.casefold()
+        if key in ambiguous:
+            result.skipped.append((line_number, f"More than one association is named {association_name}."))
+            continue
+        association = associations.get(key)
+        if association is None:
+            result.skipped.append((line_number, f"Association not found: {association_name}"))
+            continue
+        status = (status or "active").lower()
+        if status not in STATUSES:
+            result.skipped.append((line_number, f"Invalid status: {status}. Use one of: {', '.join(STATUSES)}."))
+            continue
+        if (member.pk, association.pk) in joined:
+            result.existing += 1
+            continue
+
+        if association.faculty_id:
+            if member.faculty_id != association.faculty_id:
+                result.skipped.append((
+                    line_number,
+                    "Member you are trying to add belongs to another faculty-based group. "
+                    f"{member.full_name} is in {member.faculty}, while this association is in {association.faculty}.",
+                ))
+                continue
+            current = faculty_memberships.get(member.pk)
+            if current is not None and current[0] != association.faculty_id:
+                result.skipped.append((line_number, _faculty_rule_message(current[1], current[2])))
+                continue
+            faculty_memberships.setdefault(member.pk, (association.faculty_id, association.name, association.faculty.name))
+
+        joined.add((member.pk, association.pk))
+        new.append(Membership(member=member, association=association, status=status, subscription_anchor_date=today))
+
+    if not new:
+        return
+    with transaction.atomic():
+        Membership.objects.bulk_create(new)
+        result.emails_queued += queue_membership_assigned_emails(new)
+        for association_id in {m.association_id for m in new}:
+            invalidate_dashboards(association_id)
+    result.created += len(new)
+
+
+def enroll_members(rows: Iterable[tuple[int, str, str, str]], *, batch_size: int = 1000) -> EnrollmentResult:
+    """
+    Create memberships for (line_number, registration_number, association_name, status) rows.
+    Rows already enrolled are counted in `existing`; invalid ones are returned in `skipped`
+    with the same messages the admin shows. Each chunk of `batch_size` rows is committed
+    (or, inside an outer transaction, written) as one unit.
+    """
+    associations, ambiguous = _load_associations()
+    result = EnrollmentResult()
+    rows = iter(rows)
+    while chunk := [
+        (line_number, (reg or "").strip(), (name or "").strip(), (status or "").strip())
+        for line_number, reg, name, status in islice(rows, max(1, batch_size))
+    ]:
+        _enroll_chunk(chunk, associations, ambiguous, result)
+    return result
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from campus_nexus.models import IdempotencyKey
+
+
+def _ttl() -> timedelta:
+    return timedelta(hours=int(getattr(settings, "IDEMPOTENCY_KEY_TTL_HOURS", 24)))
+
+
+def claim_idempotency_key(user, key: str, request_hash: str) -> tuple[IdempotencyKey, bool]:
+    """
+    Insert (user, key), or return the live row already holding it with claimed=False.
+    An expired row is replaced. Call inside the transaction that does the request's work
+    so a failed request releases the key along with everything else.
+    """
+    now = timezone.now()
+    fields = {"request_hash": request_hash, "expires_at": now + _ttl()}
+    try:
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(user=user, key=key, **fields), True
+    except IntegrityError:
+        pass
+
+    existing = IdempotencyKey.objects.select_for_update().get(user=user, key=key)
+    if existing.expires_at > now:
+        return existing, False
+    existing.delete()
+    return IdempotencyKey.objects.create(user=user, key=key, **fields), True
+
+
+def store_idempotent_response(record: IdempotencyKey, status_code: int, body) -> None:
+    record.status_code = status_code
+    record.response_body = body
+    record.save(update_fields=["status_code", "response_body"])
+
+
+def purge_expired_idempotency_keys(*, batch_size: int = 1000) -> int:
+    """Delete expired keys in primary-key batches so no single DELETE holds locks for long."""
+    now = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(IdempotencyKey.objects.filter(expires_at__lte=now).values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += IdempotencyKey.objects.filter(pk__in=ids).delete()[0]
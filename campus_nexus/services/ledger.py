@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from campus_nexus.models import AssociationMonthlyLedger, Expense, Payment
+
+ZERO = Decimal("0.00")
+
+
+def month_start(value: date | datetime) -> date:
+    if isinstance(value, datetime):
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        value = value.date()
+    return value.replace(day=1)
+
+
+def _bucket(instance) -> tuple[int, date] | None:
+    if isinstance(instance, Payment):
+        association_id = instance.membership.association_id if instance.membership_id else None
+        moment = instance.paid_at
+    else:
+        association_id = instance.association_id
+        moment = instance.spent_at
+    if not association_id or not moment:
+        return None
+    return association_id, month_start(moment)
+
+
+def _stored_bucket(instance) -> tuple[int, date] | None:
+    """The bucket the row belonged to before this save (None for new rows)."""
+    if not instance.pk:
+        return None
+    if isinstance(instance, Payment):
+        row = Payment.objects.filter(pk=instance.pk).values_list("membership__association_id", "paid_at").first()
+    else:
+        row = Expense.objects.filter(pk=instance.pk).values_list("association_id", "spent_at").first()
+    if not row or not row[0] or not row[1]:
+        return None
+    return row[0], month_start(row[1])
+
+
+def remember_previous_bucket(instance) -> None:
+    instance._ledger_previous_bucket = _stored_bucket(instance)
+
+
+def refresh_ledger_month(association_id: int, month: date) -> AssociationMonthlyLedger:
+    """Recompute one (association, month) row from the source tables."""
+    month = month_start(month)
+    next_month = month + relativedelta(months=1)
+
+    income = Payment.objects.filter(
+        membership__association_id=association_id,
+        status="recorded",
+        paid_at__date__gte=month,
+        paid_at__date__lt=next_month,
+    ).aggregate(total=Sum("amount_paid"), n=Count("id"))
+    spent = Expense.objects.filter(
+        association_id=association_id,
+        status="recorded",
+        spent_at__date__gte=month,
+        spent_at__date__lt=next_month,
+    ).aggregate(total=Sum("amount"), n=Count("id"))
+
+    row, _ = AssociationMonthlyLedger.objects.update_or_create(
+        association_id=association_id,
+        month=month,
+        defaults={
+            "income": income["total"] or ZERO,
+            "payment_count": income["n"] or 0,
+            "expenses": spent["total"] or ZERO,
+            "expense_count": spent["n"] or 0,
+        },
+    )
+    return row
+
+
+def ledger_buckets(instances) -> set[tuple[int, date]]:
+    """(association, month) buckets of Payment/Expense rows, for refreshing after bulk writes."""
+    return {bucket for bucket in map(_bucket, instances) if bucket is not None}
+
+
+def refresh_ledger_for(instance) -> None:
+    """Refresh the month(s) touched by a Payment/Expense write (old and new bucket)."""
+    buckets = {getattr(instance, "_ledger_previous_bucket", None), _bucket(instance)}
+    for bucket in buckets - {None}:
+        refresh_ledger_month(*bucket)
+
+
+@transaction.atomic
+def rebuild_monthly_ledger(association_id: int | None = None) -> int:
+    """Rebuild the rollup set-based: two GROUP BY queries, one delete, one bulk insert."""
+    payments = Payment.objects.filter(status="recorded")
+    expenses = Expense.objects.filter(status="recorded")
+    existing = AssociationMonthlyLedger.objects.all()
+    if association_id is not None:
+        payments = payments.filter(membership__association_id=association_id)
+        expenses = expenses.filter(association_id=association_id)
+        existing = existing.filter(association_id=association_id)
+
+    rows: dict[tuple[int, date], AssociationMonthlyLedger] = {}
+
+    def row_for(assoc_id, month):
+        key = (assoc_id, month)
+        if key not in rows:
+            rows[key] = AssociationMonthlyLedger(association_id=assoc_id, month=month)
+        return rows[key]
+
+    income = (
+        payments.order_by()
+        .annotate(month=TruncMonth("paid_at", output_field=DateField()))
+        .values("membership__association_id", "month")
+        .annotate(total=Sum("amount_paid"), n=Count("id"))
+    )
+    for r in income:
+        row = row_for(r["membership__association_id"], r["month"])
+        row.income = r["total"] or ZERO
+        row.payment_count = r["n"]
+
+    spent = (
+        expenses.order_by()
+        .annotate(month=TruncMonth("spent_at", output_field=DateField()))
+        .values("association_id", "month")
+        .annotate(total=Sum("amount"), n=Count("id"))
+    )
+    for r in spent:
+        row = row_for(r["association_id"], r["month"])
+        row.expenses = r["total"] or ZERO
+        row.expense_count = r["n"]
+
+    existing.delete()
+    AssociationMonthlyLedger.objects.bulk_create(rows.values(), batch_size=1000)
+    return len(rows)
+
+
+def ledger_rows(association_id: int) -> list[AssociationMonthlyLedger]:
+    """All ledger rows for an association in month order (one indexed query)."""
+    return list(AssociationMonthlyLedger.objects.filter(association_id=association_id).order_by("month"))
@@ -1,8 +1,10 @@
 from django.conf import settings
-from django.core.mail import send_mail
 
+from campus_nexus.services.outbox import enqueue_email, enqueue_emails, outbox_email
 
-def send_membership_assigned_email(*, member, association, membership):
+
+def _membership_assigned_fields(member, association, membership) -> dict:
+    """enqueue_email() / outbox_email() arguments for the "you've joined" email."""
     subject = f"You've joined {association.name} on Campus Nexus"
     message = (
         f"Hello {member.full_name},\n\n"
@@ -12,23 +14,35 @@ def send_membership_assigned_email(*, member, association, membership):
         "If you believe this was a mistake, please contact your association admin.\n\n"
         "Regards,\nCampus Nexus"
     )
+    return {
+        "to": member.email,
+        "subject": subject,
+        "body": message,
+        "from_email": getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@campusnexus.local",
+        "dedup_key": f"membership-assigned:{membership.pk}:{member.email}",
+    }
 
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@campusnexus.local"
 
+def send_membership_assigned_email(*, member, association, membership):
     # safety: only send if member has email
     if not member.email:
         return
 
-    send_mail(
-        subject,
-        message,
-        from_email,
-        [member.email],
-        fail_silently=False,
-    )
+    enqueue_email(**_membership_assigned_fields(member, association, membership))
+
+
+def queue_membership_assigned_emails(memberships) -> int:
+    """Bulk version for memberships created without post_save (member and association loaded)."""
+    entries = [
+        outbox_email(**_membership_assigned_fields(m.member, m.association, m))
+        for m in memberships
+        if m.member.email
+    ]
+    enqueue_emails(entries)
+    return len(entries)
 
 
-def send_membership_removed_email(*, member, association):
+def send_membership_removed_email(*, member, association, membership_id=None):
     subject = f"Removed from {association.name} on Campus Nexus"
     message = (
         f"Hello {member.full_name},\n\n"
@@ -42,10 +56,10 @@ def send_membership_removed_email(*, member, association):
     if not member.email:
         return
 
-    send_mail(
-        subject,
-        message,
-        from_email,
-        [member.email],
-        fail_silently=False,
+    enqueue_email(
+        to=member.email,
+        subject=subject,
+        body=message,
+        from_email=from_email,
+        dedup_key=f"membership-removed:{membership_id}:{member.email}" if membership_id else None,
     )
@@ -2,11 +2,12 @@ from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
 from django.urls import reverse
 from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_encode
 
+from campus_nexus.services.outbox import enqueue_email
+
 
 def build_password_setup_link(*, user, base_url=None):
     root_url = (base_url or getattr(settings, "CAMPUS_NEXUS_SITE_URL", "")).strip()
@@ -43,11 +44,10 @@ def send_onboarding_invitation_email(*, user, invited_by=None, base_url=None):
         "Campus Nexus"
     )
 
-    send_mail(
+    enqueue_email(
+        to=user.email,
         subject=subject,
-        message=message,
+        body=message,
         from_email=getattr(settings, "DEFAULT_FROM_EMAIL", None),
-        recipient_list=[user.email],
-        fail_silently=False,
     )
     return True
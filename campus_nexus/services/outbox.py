@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Q
+from django.utils import timezone
+
+from campus_nexus.models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 6
+BASE_BACKOFF_SECONDS = 60
+MAX_BACKOFF_SECONDS = 6 * 60 * 60
+# A row claimed by a worker that died mid-batch becomes claimable again after this lease.
+SENDING_LEASE = timedelta(minutes=10)
+
+
+@dataclass
+class DeliveryResult:
+    claimed: int = 0
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def _default_from_email() -> str:
+    return getattr(settings, "DEFAULT_FROM_EMAIL", None) or "no-reply@campusnexus.local"
+
+
+def _outbox_fields(to: str, subject: str, body: str, from_email: str | None) -> dict:
+    return {
+        "to_email": to,
+        "from_email": from_email or _default_from_email(),
+        "subject": subject[:255],
+        "body": body,
+    }
+
+
+def enqueue_email(*, to: str, subject: str, body: str, from_email: str | None = None, dedup_key: str | None = None) -> bool:
+    """
+    Queue one email for the delivery worker. Call inside the transaction that
+    caused it so the message is only sent if that change commits.
+
+    Returns False when there is no recipient or `dedup_key` was already queued.
+    """
+    if not to:
+        return False
+    fields = _outbox_fields(to, subject, body, from_email)
+    if dedup_key is None:
+        EmailOutbox.objects.create(**fields)
+        return True
+    _, created = EmailOutbox.objects.get_or_create(dedup_key=dedup_key[:255], defaults=fields)
+    return created
+
+
+def outbox_email(*, to: str, subject: str, body: str, from_email: str | None = None, dedup_key: str | None = None) -> EmailOutbox:
+    """Unsaved outbox row for `enqueue_emails`."""
+    return EmailOutbox(dedup_key=dedup_key[:255] if dedup_key else None, **_outbox_fields(to, subject, body, from_email))
+
+
+def enqueue_emails(entries: list[EmailOutbox], *, batch_size: int = 500) -> None:
+    """Bulk version of enqueue_email; rows whose dedup_key is already queued are skipped."""
+    EmailOutbox.objects.bulk_create(entries, batch_size=batch_size, ignore_conflicts=True)
+
+
+def backoff_for(attempts: int) -> timedelta:
+    return timedelta(seconds=min(BASE_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0), MAX_BACKOFF_SECONDS))
+
+
+def _claim(batch_size: int, now) -> list[EmailOutbox]:
+    due = Q(status__in=("pending", "sending"), next_attempt_at__lte=now)
+    ids = list(EmailOutbox.objects.filter(due).order_by("next_attempt_at", "id").values_list("id", flat=True)[:batch_size])
+    if not ids:
+        return []
+    # Conditional UPDATE: concurrent workers only get the rows they actually flipped.
+    lease_until = now + SENDING_LEASE
+    EmailOutbox.objects.filter(Q(id__in=ids) & due).update(status="sending", next_attempt_at=lease_until)
+    return list(EmailOutbox.objects.filter(id__in=ids, status="sending", next_attempt_at=lease_until).order_by("id"))
+
+
+def deliver_pending(*, batch_size: int = 100, max_attempts: int = DEFAULT_MAX_ATTEMPTS, connection=None) -> DeliveryResult:
+    """Send one batch of due outbox rows over a single SMTP connection."""
+    now = timezone.now()
+    batch = _claim(batch_size, now)
+    result = DeliveryResult(claimed=len(batch))
+    if not batch:
+        return result
+
+    connection = connection or get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        logger.warning("Email worker could not open a mail connection: %s", exc)
+        for entry in batch:
+            _record_failure(entry, exc, max_attempts, result)
+        return result
+
+    try:
+        for entry in batch:
+            message = EmailMessage(
+                subject=entry.subject,
+                body=entry.body,
+                from_email=entry.from_email or _default_from_email(),
+                to=[entry.to_email],
+                connection=connection,
+            )
+            try:
+                message.send(fail_silently=False)
+            except Exception as exc:
+                _record_failure(entry, exc, max_attempts, result)
+                continue
+            entry.status = "sent"
+            entry.sent_at = timezone.now()
+            entry.attempts += 1
+            entry.last_error = ""
+            entry.save(update_fields=["status", "sent_at", "attempts", "last_error"])
+            result.sent += 1
+    finally:
+        connection.close()
+    return result
+
+
+def _record_failure(entry: EmailOutbox, exc: Exception, max_attempts: int, result: DeliveryResult) -> None:
+    entry.attempts += 1
+    entry.last_error = f"{type(exc).__name__}: {exc}"[:2000]
+    if entry.attempts >= max_attempts:
+        entry.status = "failed"
+        result.failed += 1
+    else:
+        entry.status = "pending"
+        entry.next_attempt_at = timezone.now() + backoff_for(entry.attempts)
+        result.retried += 1
+    entry.save(update_fields=["status", "attempts", "last_error", "next_attempt_at"])
+    logger.warning("Outbox email #%s to %s failed (attempt %s): %s", entry.pk, entry.to_email, entry.attempts, exc)
+
+
+def drain_outbox(*, batch_size: int = 100, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> DeliveryResult:
+    """Deliver batches until nothing is due; rows rescheduled for retry are left for a later run."""
+    total = DeliveryResult()
+    while True:
+        result = deliver_pending(batch_size=batch_size, max_attempts=max_attempts)
+        if not result.claimed:
+            return total
+        total.claimed += result.claimed
+        total.sent += result.sent
+        total.retried += result.retried
+        total.failed += result.failed
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from django.db import transaction
+
+from campus_nexus.models import Charge, Payment
+from campus_nexus.notifications.email_utils import queue_payment_recorded_emails, send_payment_recorded_email
+from campus_nexus.services.charges import rebuild_charge_totals, refresh_charge_totals
+from campus_nexus.services.dashboard_cache import invalidate_dashboards
+from campus_nexus.services.ledger import ledger_buckets, refresh_ledger_month
+
+# Set on a Payment while post_payment() saves it so the fallback signals in
+# campus_nexus.signals (charge/bill refresh) leave the work to this service.
+POSTING_FLAG = "_posting_via_service"
+
+
+def is_being_posted(payment: Payment) -> bool:
+    return bool(getattr(payment, POSTING_FLAG, False))
+
+
+@transaction.atomic
+def post_payment(payment: Payment, *, notify: bool = True) -> Payment:
+    """
+    Save a new or edited payment and bring its charge and bill membership up to date.
+
+    The charge row is locked once before the payment is written, its stored totals are
+    recomputed with a single aggregate, and the linked BillMembership (if any) is updated
+    from the charges' stored totals. New payments get one receipt email in the outbox,
+    committed together with the payment.
+    """
+    created = payment.pk is None
+    previous_charge_id = None
+    if not created:
+        previous_charge_id = Payment.objects.filter(pk=payment.pk).values_list("charge_id", flat=True).first()
+
+    charge = None
+    if payment.charge_id:
+        charge = (
+            Charge.objects.select_related("bill_membership")
+            .select_for_update()
+            .get(pk=payment.charge_id)
+        )
+        payment.charge = charge
+
+    setattr(payment, POSTING_FLAG, True)
+    try:
+        payment.save()
+    finally:
+        setattr(payment, POSTING_FLAG, False)
+
+    if charge is not None:
+        charge.refresh_payment_totals()
+        charge.save(update_fields=["amount_paid", "balance", "status"])
+        if charge.bill_membership_id:
+            charge.bill_membership.update_status_from_payments()
+
+    if previous_charge_id and previous_charge_id != payment.charge_id:
+        old = refresh_charge_totals(previous_charge_id)
+        if old is not None and old.bill_membership_id:
+            old.bill_membership.update_status_from_payments()
+
+    if created and notify:
+        send_payment_recorded_email(
+            member=payment.membership.member,
+            association=payment.membership.association,
+            payment=payment,
+            charge=charge,
+        )
+    return payment
+
+
+def payment_scope(payments) -> tuple[set[int], set]:
+    """Charge ids and ledger buckets the given payments count towards (memberships loaded)."""
+    return {p.charge_id for p in payments if p.charge_id}, ledger_buckets(payments)
+
+
+@transaction.atomic
+def post_payments(created, updated=(), *, previous_scope=None, notify: bool = True) -> None:
+    """
+    Bulk counterpart of post_payment() for rows already written with bulk_create /
+    bulk_update, which fire no signals. Touched charges are recomputed set-based, then
+    their bill memberships, the affected ledger months and dashboards are refreshed, and
+    new payments get one receipt each in the outbox.
+
+    `previous_scope` is payment_scope() of the updated rows taken before they changed,
+    so charges and months they moved away from are refreshed too.
+    """
+    charge_ids, buckets = payment_scope([*created, *updated])
+    if previous_scope is not None:
+        charge_ids |= previous_scope[0]
+        buckets |= previous_scope[1]
+
+    if charge_ids:
+        rebuild_charge_totals(charge_ids=charge_ids)
+        billed = Charge.objects.filter(pk__in=charge_ids, bill_membership__isnull=False).select_related("bill_membership")
+        for bill_membership in {charge.bill_membership for charge in billed}:
+            bill_membership.update_status_from_payments()
+    for bucket in buckets:
+        refresh_ledger_month(*bucket)
+    for association_id in {association_id for association_id, _ in buckets}:
+        invalidate_dashboards(association_id)
+
+    if created and notify:
+        # Reloaded so receipts show the recomputed charge balance.
+        queue_payment_recorded_emails(
+            Payment.objects.filter(pk__in=[p.pk for p in created])
+            .select_related("membership__member", "membership__association", "charge")
+            .order_by("pk")
+        )
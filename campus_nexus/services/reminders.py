@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from campus_nexus.models import Charge, EmailOutbox, Fee, PaymentReminderLog
+from campus_nexus.services.outbox import DeliveryResult, drain_outbox, enqueue_emails, outbox_email
+from campus_nexus.services.subscription_emails import reminder_from_email, subscription_reminder_content
+
+_REMINDER_FIELDS = (
+    "id",
+    "membership_id",
+    "membership__member__email",
+    "membership__member__first_name",
+    "association__name",
+    "amount_due",
+    "amount_paid",
+    "balance",
+    "due_date",
+)
+
+
+@dataclass
+class ReminderRunResult:
+    due: dict = field(default_factory=lambda: defaultdict(int))
+    queued: int = 0  # outbox rows this run actually inserted
+    would_queue: int = 0  # dry run: emails that would have been queued
+    missing_email: int = 0
+    delivery: DeliveryResult | None = None
+    seconds: float = 0.0
+
+    @property
+    def total_due(self) -> int:
+        return sum(self.due.values())
+
+
+def _fee_schedules(association_id: int | None) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+    """
+    Group fees that have a reminder schedule by offset: {days_before_due: [fee ids]}
+    and {grace_days: [fee ids]}. One small query over Fee.
+    """
+    fees = Fee.objects.exclude(reminder_days_before_due=[])
+    if association_id is not None:
+        fees = fees.filter(association_id=association_id)
+
+    before: dict[int, list[int]] = defaultdict(list)
+    grace: dict[int, list[int]] = defaultdict(list)
+    for fee_id, days, grace_days in fees.values_list("id", "reminder_days_before_due", "grace_days"):
+        for d in days or []:
+            if isinstance(d, int) and d >= 0:
+                before[d].append(fee_id)
+        grace[int(grace_days or 0)].append(fee_id)
+    return before, grace
+
+
+def _due_filters(association_id: int | None, today: date) -> dict[str, Q]:
+    """
+    One Q per reminder type, OR-ing one (fee ids, due date) pair per distinct offset:
+    "before_due" on each configured day before due_date, "overdue" on the first day
+    past due_date + grace_days (the day recompute_overdue_flags starts flagging it).
+    """
+    before, grace = _fee_schedules(association_id)
+    filters = {}
+    if before:
+        q = Q()
+        for days, fee_ids in before.items():
+            q |= Q(fee_id__in=fee_ids, due_date=today + timedelta(days=days))
+        filters["before_due"] = q
+    if grace:
+        q = Q()
+        for grace_days, fee_ids in grace.items():
+            q |= Q(fee_id__in=fee_ids, due_date=today - timedelta(days=grace_days + 1))
+        filters["overdue"] = q
+    return filters
+
+
+def send_payment_reminders(
+    association_id: int | None = None,
+    *,
+    today: date | None = None,
+    dry_run: bool = False,
+    deliver: bool = True,
+    batch_size: int = 1000,
+) -> ReminderRunResult:
+    """
+    Queue every reminder due today for unpaid charges, following each fee's
+    reminder_days_before_due and grace_days.
+
+    Each batch writes its PaymentReminderLog rows and outbox emails in one
+    transaction; both are inserted with ignore_conflicts, so re-running the same
+    day (or two overlapping runs) never sends a reminder twice. With deliver=True
+    the queued emails are then sent over a shared SMTP connection per batch.
+    """
+    started = time.monotonic()
+    today = today or timezone.localdate()
+    result = ReminderRunResult()
+    from_email = reminder_from_email()
+
+    open_charges = Charge.objects.filter(
+        status__in=("unpaid", "partial"),
+        balance__gt=0,
+        due_date__isnull=False,
+    )
+    if association_id is not None:
+        open_charges = open_charges.filter(association_id=association_id)
+
+    for reminder_type, due_filter in _due_filters(association_id, today).items():
+        already_sent = PaymentReminderLog.objects.filter(
+            charge_id=OuterRef("pk"), reminder_type=reminder_type, scheduled_for=today
+        )
+        pending = open_charges.filter(due_filter).filter(~Exists(already_sent)).order_by("pk").values(*_REMINDER_FIELDS)
+
+        last_pk = 0
+        while True:
+            # Keyset batches keep each read small and never hold a cursor open across writes.
+            rows = list(pending.filter(pk__gt=last_pk)[:batch_size])
+            if not rows:
+                break
+            last_pk = rows[-1]["id"]
+            result.due[reminder_type] += len(rows)
+
+            logs, emails = [], []
+            for row in rows:
+                to = row["membership__member__email"]
+                if not to:
+                    result.missing_email += 1
+                    continue
+                subject, body = subscription_reminder_content(
+                    first_name=row["membership__member__first_name"],
+                    association_name=row["association__name"],
+                    amount_due=row["amount_due"],
+                    amount_paid=row["amount_paid"],
+                    balance=row["balance"],
+                    due_date=row["due_date"],
+                    days_left=(row["due_date"] - today).days,
+                )
+                logs.append(
+                    PaymentReminderLog(
+                        membership_id=row["membership_id"],
+                        charge_id=row["id"],
+                        reminder_type=reminder_type,
+                        scheduled_for=today,
+                    )
+                )
+                emails.append(
+                    outbox_email(
+                        to=to,
+                        subject=subject,
+                        body=body,
+                        from_email=from_email,
+                        dedup_key=f"payment-reminder:{row['id']}:{reminder_type}:{today:%Y-%m-%d}:{to}",
+                    )
+                )
+
+            if dry_run:
+                result.would_queue += len(emails)
+                continue
+            if not logs:
+                continue
+            # ignore_conflicts drops emails another run already queued, so count the
+            # dedup keys that exist after the insert rather than the rows handed to it.
+            keys = EmailOutbox.objects.filter(dedup_key__in=[e.dedup_key for e in emails])
+            with transaction.atomic():
+                already_queued = keys.count()
+                PaymentReminderLog.objects.bulk_create(logs, batch_size=batch_size, ignore_conflicts=True)
+                enqueue_emails(emails, batch_size=batch_size)
+                result.queued += keys.count() - already_queued
+
+    if deliver and not dry_run and result.queued:
+        result.delivery = drain_outbox()
+
+    result.seconds = time.monotonic() - started
+    return result
@@ -0,0 +1,171 @@
+"""
+Single-pass KPI queries for the admin dashboards.
+
+Each helper reads one source table exactly once: scalar KPIs come from a single
+`aggregate()` with filtered Count/Sum expressions, breakdowns from a single GROUP BY
+whose rows are folded into the totals in Python.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db.models import Case, Count, IntegerField, Q, QuerySet, Sum, Value, When, Window
+
+from campus_nexus.models import Announcement, Association, AssociationMonthlyLedger, Charge, Member, Membership
+
+ZERO = Decimal("0.00")
+OPEN_CHARGE_STATUSES = ("unpaid", "partial")
+
+
+@dataclass(frozen=True)
+class AssociationStats:
+    total: int
+    faculty_based: int
+    non_faculty_based: int
+
+
+@dataclass(frozen=True)
+class MemberStats:
+    total: int
+    by_type: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class AssociationMembershipCount:
+    name: str
+    total: int
+    active: int
+
+
+@dataclass(frozen=True)
+class MembershipStats:
+    total: int
+    by_status: dict[str, int] = field(default_factory=dict)
+    by_association: tuple[AssociationMembershipCount, ...] = ()
+
+    @property
+    def active(self) -> int:
+        return self.by_status.get("active", 0)
+
+    @property
+    def inactive(self) -> int:
+        return self.by_status.get("inactive", 0)
+
+    @property
+    def suspended(self) -> int:
+        return self.by_status.get("suspended", 0)
+
+    def top_associations(self, limit: int, *, active_only: bool = False) -> list[AssociationMembershipCount]:
+        key = "active" if active_only else "total"
+        rows = [row for row in self.by_association if getattr(row, key) > 0]
+        rows.sort(key=lambda row: (-getattr(row, key), row.name))
+        return rows[:limit]
+
+
+@dataclass(frozen=True)
+class ChargeStats:
+    total_billed: Decimal
+    outstanding_balance: Decimal
+    open_count: int
+    overdue_count: int
+
+
+@dataclass(frozen=True)
+class FinanceStats:
+    income: Decimal
+    expenses: Decimal
+
+
+@dataclass(frozen=True)
+class AnnouncementStats:
+    published: int
+    drafts: int
+
+
+def _aggregate(queryset: QuerySet, **expressions) -> dict:
+    row = queryset.order_by().aggregate(**expressions)
+    return {name: (ZERO if value is None else value) for name, value in row.items()}
+
+
+def association_stats() -> AssociationStats:
+    row = _aggregate(
+        Association.objects.all(),
+        total=Count("id"),
+        faculty_based=Count("id", filter=Q(faculty__isnull=False)),
+        non_faculty_based=Count("id", filter=Q(faculty__isnull=True)),
+    )
+    return AssociationStats(**row)
+
+
+def member_stats() -> MemberStats:
+    by_type = {
+        row["member_type"]: row["n"]
+        for row in Member.objects.order_by().values("member_type").annotate(n=Count("id"))
+    }
+    return MemberStats(total=sum(by_type.values()), by_type=by_type)
+
+
+def membership_stats(association_id: int | None = None) -> MembershipStats:
+    """
+    Status totals plus per-association counts from one GROUP BY. A member holds at most one
+    membership per association, so counting rows equals counting distinct members.
+    """
+    qs = Membership.objects.order_by()
+    if association_id is not None:
+        qs = qs.filter(association_id=association_id)
+
+    by_status: dict[str, int] = {}
+    per_association: dict[int, dict] = {}
+    for row in qs.values("association_id", "association__name", "status").annotate(n=Count("id")):
+        by_status[row["status"]] = by_status.get(row["status"], 0) + row["n"]
+        bucket = per_association.setdefault(
+            row["association_id"], {"name": row["association__name"], "total": 0, "active": 0}
+        )
+        bucket["total"] += row["n"]
+        if row["status"] == "active":
+            bucket["active"] += row["n"]
+
+    return MembershipStats(
+        total=sum(by_status.values()),
+        by_status=by_status,
+        by_association=tuple(AssociationMembershipCount(**bucket) for bucket in per_association.values()),
+    )
+
+
+def charge_stats(association_id: int | None = None) -> ChargeStats:
+    qs = Charge.objects.exclude(status="cancelled")
+    if association_id is not None:
+        qs = qs.filter(association_id=association_id)
+    is_open = Q(status__in=OPEN_CHARGE_STATUSES)
+    row = _aggregate(
+        qs,
+        total_billed=Sum("amount_due"),
+        outstanding_balance=Sum("balance", filter=is_open & Q(balance__gt=0)),
+        open_count=Count("id", filter=is_open),
+        overdue_count=Count("id", filter=is_open & Q(is_overdue=True)),
+    )
+    return ChargeStats(**row)
+
+
+def finance_stats() -> FinanceStats:
+    row = _aggregate(AssociationMonthlyLedger.objects.all(), income=Sum("income"), expenses=Sum("expenses"))
+    return FinanceStats(**row)
+
+
+def announcement_feed(queryset: QuerySet, limit: int) -> tuple[list[Announcement], AnnouncementStats]:
+    """Latest `limit` announcements plus published/draft totals over `queryset`, in one query."""
+
+    def _flag_total(published: bool):
+        return Window(
+            Sum(Case(When(is_published=published, then=Value(1)), default=Value(0), output_field=IntegerField()))
+        )
+
+    rows = list(
+        queryset.select_related("association", "faculty", "posted_by")
+        .annotate(published_total=_flag_total(True), draft_total=_flag_total(False))
+        .order_by("-created_at")[:limit]
+    )
+    if not rows:
+        return rows, AnnouncementStats(published=0, drafts=0)
+    return rows, AnnouncementStats(published=rows[0].published_total, drafts=rows[0].draft_total)
@@ -1,30 +1,48 @@
 from django.conf import settings
-from django.core.mail import send_mail
+from django.utils import timezone
 
+from campus_nexus.services.outbox import enqueue_email
 
-def send_subscription_reminder_email(*, member, association, charge, days_left: int):
-    if not member.email:
-        return False
 
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "Campus Nexus <no-reply@campusnexus.local>")
+def reminder_from_email() -> str:
+    return getattr(settings, "DEFAULT_FROM_EMAIL", "Campus Nexus <no-reply@campusnexus.local>")
 
-    subject = f"Subscription reminder: {association.name}"
+
+def subscription_reminder_content(*, first_name, association_name, amount_due, amount_paid, balance, due_date, days_left: int):
+    """Subject and body of a subscription reminder, built from plain values so batch runs need no model instances."""
+    subject = f"Subscription reminder: {association_name}"
     message = (
-        f"Hello {member.first_name},\n\n"
-        f"This is a reminder that your subscription for '{association.name}' is due.\n\n"
-        f"Amount due: {charge.amount_due}\n"
-        f"Amount paid: {charge.amount_paid_total}\n"
-        f"Balance: {charge.balance}\n"
-        f"Due date: {charge.due_date}\n"
+        f"Hello {first_name},\n\n"
+        f"This is a reminder that your subscription for '{association_name}' is due.\n\n"
+        f"Amount due: {amount_due}\n"
+        f"Amount paid: {amount_paid}\n"
+        f"Balance: {balance}\n"
+        f"Due date: {due_date}\n"
         f"Days left: {days_left}\n\n"
         f"Thank you,\nCampus Nexus"
     )
+    return subject, message
+
+
+def send_subscription_reminder_email(*, member, association, charge, days_left: int):
+    if not member.email:
+        return False
+
+    subject, message = subscription_reminder_content(
+        first_name=member.first_name,
+        association_name=association.name,
+        amount_due=charge.amount_due,
+        amount_paid=charge.amount_paid_total,
+        balance=charge.balance,
+        due_date=charge.due_date,
+        days_left=days_left,
+    )
 
-    send_mail(
+    # One manual reminder per charge per recipient per day, however often the button is pressed.
+    return enqueue_email(
+        to=member.email,
         subject=subject,
-        message=message,
-        from_email=from_email,
-        recipient_list=[member.email],
-        fail_silently=True,
+        body=message,
+        from_email=reminder_from_email(),
+        dedup_key=f"subscription-reminder:{charge.pk}:{timezone.localdate():%Y-%m-%d}:{member.email}",
     )
-    return True
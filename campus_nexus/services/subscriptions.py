@@ -6,9 +6,13 @@ from decimal import Decimal
 
 from dateutil.relativedelta import relativedelta
 from django.db import transaction
+from django.db.models import BooleanField, Case, DecimalField, Exists, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.lookups import LessThan, LessThanOrEqual
 from django.utils import timezone
 
-from campus_nexus.models import Fee, Charge, Membership
+from campus_nexus.models import Fee, Charge, Membership, Payment, touched_if
+from campus_nexus.services.dashboard_cache import invalidate_dashboards
 
 
 def get_subscription_fee(association_id: int) -> Fee | None:
@@ -82,15 +86,190 @@ def ensure_current_subscription_charge(membership: Membership) -> Charge | None:
     return charge
 
 
-def recompute_overdue_flags_for_association(association_id: int) -> None:
-    today = timezone.localdate()
-    charges = list(
-        Charge.objects.filter(association_id=association_id, purpose="subscription_fee")
-        .select_related("fee")
+@dataclass
+class RolloverResult:
+    associations: int = 0
+    memberships: int = 0
+    created: int = 0
+
+
+def _latest_subscription_fees(association_id: int | None = None) -> dict[int, Fee]:
+    """Latest subscription fee per association, fetched in a single query."""
+    fees = Fee.objects.filter(fee_type="subscription").order_by("association_id", "-created_at", "-id")
+    if association_id is not None:
+        fees = fees.filter(association_id=association_id)
+
+    latest: dict[int, Fee] = {}
+    for fee in fees:
+        latest.setdefault(fee.association_id, fee)
+    return latest
+
+
+def _roll_association(fee: Fee, today: date, batch_size: int) -> tuple[int, int]:
+    # Anchor-less memberships start their first cycle today, like ensure_current_subscription_charge.
+    Membership.objects.filter(
+        association_id=fee.association_id, subscription_anchor_date__isnull=True
+    ).update(subscription_anchor_date=today, updated_at=timezone.now())
+
+    # Anti-join: memberships with no charge for the cycle running today (or, for an anchor
+    # still in the future, the first one). The bounds of the missing cycles are computed in
+    # Python afterwards: relativedelta's end-of-month clamping has no portable SQL form.
+    current_charge = Charge.objects.filter(
+        fee=fee,
+        membership_id=OuterRef("pk"),
+        period_end__gte=today,
+        period_start__lte=Greatest(Value(today), OuterRef("subscription_anchor_date")),
+    )
+    memberships = Membership.objects.filter(association_id=fee.association_id)
+    missing_memberships = (
+        memberships.filter(~Exists(current_charge))
+        .values_list("id", "subscription_anchor_date")
+        .iterator(chunk_size=batch_size)
     )
-    for c in charges:
-        grace = int(c.fee.grace_days) if c.fee_id else 0
-        due = c.due_date + timedelta(days=grace) if c.due_date and grace else c.due_date
-        c.is_overdue = bool(due and c.balance > 0 and today > due)
-        c.recompute_status()
-    Charge.objects.bulk_update(charges, ["status", "is_overdue"])
+
+    due_offset = timedelta(days=int(fee.grace_days or 0))
+    missing = []
+    for membership_id, anchor in missing_memberships:
+        period_start, period_end = cycle_bounds(anchor, fee.duration_months, today)
+        missing.append(
+            Charge(
+                association_id=fee.association_id,
+                membership_id=membership_id,
+                fee=fee,
+                purpose="subscription_fee",
+                title=f"Subscription ({period_start} → {period_end})",
+                amount_due=fee.amount,
+                amount_paid=Decimal("0"),
+                balance=fee.amount,
+                due_date=period_end + due_offset,
+                period_start=period_start,
+                period_end=period_end,
+                status="unpaid",
+            )
+        )
+    if not missing:
+        return memberships.count(), 0
+
+    # ignore_conflicts: uniq_charge_per_cycle makes concurrent runs (or a payment
+    # creating the same cycle charge meanwhile) harmless. Skipped rows are not counted.
+    cycle_charges = Charge.objects.filter(fee=fee, period_end__gte=today)
+    before = cycle_charges.count()
+    Charge.objects.bulk_create(missing, batch_size=batch_size, ignore_conflicts=True)
+    return memberships.count(), cycle_charges.count() - before
+
+
+def roll_subscription_cycles(
+    association_id: int | None = None, *, today: date | None = None, batch_size: int = 1000
+) -> RolloverResult:
+    """
+    Bulk version of ensure_current_subscription_charge: make sure every membership
+    of one (or every) association has a charge for its current subscription cycle,
+    then refresh overdue flags. Meant to run on a schedule, not per request.
+    """
+    today = today or timezone.localdate()
+    result = RolloverResult()
+
+    for assoc_id, fee in _latest_subscription_fees(association_id).items():
+        with transaction.atomic():
+            seen, created = _roll_association(fee, today, batch_size)
+            recompute_overdue_flags_for_association(assoc_id)
+        if created:
+            invalidate_dashboards(assoc_id)
+        result.associations += 1
+        result.memberships += seen
+        result.created += created
+
+    return result
+
+
+def _recorded_paid_expression():
+    """Correlated SUM of a charge's recorded payments (0 when there are none)."""
+    money = DecimalField(max_digits=12, decimal_places=2)
+    paid = (
+        Payment.objects.filter(charge_id=OuterRef("pk"), status="recorded")
+        .order_by()
+        .values("charge_id")
+        .annotate(total=Sum("amount_paid"))
+        .values("total")
+    )
+    return Coalesce(Subquery(paid, output_field=money), Value(Decimal("0")), output_field=money)
+
+
+def _recomputed_status_expression():
+    return Case(
+        When(status="cancelled", then=F("status")),
+        When(LessThanOrEqual(_recorded_paid_expression(), 0), then=Value("unpaid")),
+        When(LessThan(_recorded_paid_expression(), F("amount_due")), then=Value("partial")),
+        default=Value("paid"),
+    )
+
+
+def recompute_overdue_flags_for_association(
+    association_id: int, *, today: date | None = None, dry_run: bool = False
+) -> int:
+    """
+    Refresh amount_paid / balance / status / is_overdue for an association's
+    subscription charges with a handful of UPDATE statements (one for the payment
+    totals, one per distinct grace_days value for the overdue flag).
+
+    A charge is overdue when it still has a balance and today is past
+    due_date + fee.grace_days. Returns the number of charges whose stored values
+    differ from the recomputed ones; with dry_run=True nothing is written.
+    """
+    today = today or timezone.localdate()
+    money = DecimalField(max_digits=12, decimal_places=2)
+    charges = Charge.objects.filter(association_id=association_id, purpose="subscription_fee")
+
+    grace_values = list(
+        charges.filter(fee__isnull=False)
+        .order_by()
+        .values_list("fee__grace_days", flat=True)
+        .distinct()
+    )
+    grace_groups = [(Q(fee__isnull=True), 0)] + [(Q(fee__grace_days=g), int(g)) for g in grace_values]
+
+    def overdue_cutoff(grace: int) -> date:
+        return today - timedelta(days=grace)
+
+    new_overdue = Case(
+        *[
+            When(
+                group & Q(due_date__lt=overdue_cutoff(grace)) & LessThan(_recorded_paid_expression(), F("amount_due")),
+                then=Value(True),
+            )
+            for group, grace in grace_groups
+        ],
+        default=Value(False),
+        output_field=BooleanField(),
+    )
+    changed = (
+        charges.annotate(
+            new_paid=_recorded_paid_expression(),
+            new_status=_recomputed_status_expression(),
+            new_overdue=new_overdue,
+        )
+        .filter(~Q(amount_paid=F("new_paid")) | ~Q(status=F("new_status")) | ~Q(is_overdue=F("new_overdue")))
+        .count()
+    )
+    if dry_run or not changed:
+        return changed
+
+    with transaction.atomic():
+        charges.update(
+            amount_paid=_recorded_paid_expression(),
+            balance=Greatest(F("amount_due") - _recorded_paid_expression(), Value(Decimal("0")), output_field=money),
+            status=_recomputed_status_expression(),
+            updated_at=touched_if(
+                ~Q(amount_paid=_recorded_paid_expression()) | ~Q(status=_recomputed_status_expression())
+            ),
+        )
+        for group, grace in grace_groups:
+            overdue = Case(
+                When(due_date__lt=overdue_cutoff(grace), balance__gt=0, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+            charges.filter(group).update(is_overdue=overdue, updated_at=touched_if(~Q(is_overdue=overdue)))
+    # QuerySet.update() sends no signals, so the dashboards' unpaid/overdue counts are dropped here.
+    invalidate_dashboards(association_id)
+    return changed
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db.models import DateTimeField, F, IntegerField, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from campus_nexus.models import Charge, Member, Membership, Payment, SyncTombstone
+
+# Position of each kind in the change sequence (timestamp, kind, id); deletes sort last.
+SYNC_KINDS = ("member", "membership", "charge", "payment")
+SYNC_MODELS = {"member": Member, "membership": Membership, "charge": Charge, "payment": Payment}
+_DELETE = len(SYNC_KINDS)
+
+
+class SyncCursorExpired(ValueError):
+    """The cursor is older than the tombstone retention, so deletes it missed may be gone."""
+
+
+@dataclass(frozen=True)
+class SyncCursor:
+    """
+    Last change a client has seen, as (timestamp, kind, id), plus `since`: when its
+    initial download started. Tombstones older than that describe rows it never had.
+    `seen_until` is set when the client has every change up to that time, so a quiet
+    feed does not age out with its last change.
+    """
+    since: datetime
+    ts: datetime | None = None
+    rank: int = -1
+    object_id: int = 0
+    seen_until: datetime | None = None
+
+    @property
+    def horizon(self) -> datetime:
+        """Changes the client has not seen all happened at or after this time."""
+        return self.seen_until or self.ts or self.since
+
+    def encode(self) -> str:
+        raw = [
+            self.since.isoformat(),
+            self.ts.isoformat() if self.ts else None,
+            self.rank,
+            self.object_id,
+            self.seen_until.isoformat() if self.seen_until else None,
+        ]
+        return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncCursor":
+        """Raises ValueError for anything that is not a cursor this module issued."""
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            since, ts, rank, object_id, *rest = raw
+            seen_until = rest.pop() if rest else None  # absent from cursors issued before it existed
+            if rest:
+                raise ValueError(raw)
+            cursor = cls(
+                since=datetime.fromisoformat(since),
+                ts=datetime.fromisoformat(ts) if ts else None,
+                rank=int(rank),
+                object_id=int(object_id),
+                seen_until=datetime.fromisoformat(seen_until) if seen_until else None,
+            )
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, TypeError, ValueError) as exc:
+            raise ValueError("Invalid sync cursor.") from exc
+        if any(value is not None and value.tzinfo is None for value in (cursor.since, cursor.ts, cursor.seen_until)):
+            raise ValueError("Invalid sync cursor.")
+        return cursor
+
+
+@dataclass
+class SyncPage:
+    # ("upsert" | "delete", kind, object_id) in change-sequence order; kind is one of SYNC_KINDS.
+    changes: list[tuple[str, str, int]] = field(default_factory=list)
+    cursor: SyncCursor | None = None
+    has_more: bool = False
+
+
+def _retention() -> timedelta:
+    return timedelta(days=int(getattr(settings, "SYNC_TOMBSTONE_RETENTION_DAYS", 30)))
+
+
+def _sources(association_id: int, since: datetime):
+    """One (ts, rank, oid) queryset per kind, all scoped to the association."""
+    ts = DateTimeField()
+    return [
+        # A member is in scope through its membership, and (re)appears when either changes.
+        Membership.objects.filter(association_id=association_id).annotate(
+            ts=Greatest("updated_at", "member__updated_at", output_field=ts), oid=F("member_id"),
+        ),
+        Membership.objects.filter(association_id=association_id).annotate(ts=F("updated_at"), oid=F("id")),
+        Charge.objects.filter(association_id=association_id).annotate(ts=F("updated_at"), oid=F("id")),
+        Payment.objects.filter(membership__association_id=association_id).annotate(ts=F("updated_at"), oid=F("id")),
+        SyncTombstone.objects.filter(association_id=association_id, deleted_at__gt=since).annotate(
+            ts=F("deleted_at"), oid=F("id"),
+        ),
+    ]
+
+
+def _after(cursor: SyncCursor, rank: int) -> Q:
+    """Keyset predicate `(ts, rank, oid) > cursor` for a source whose rank is constant."""
+    if cursor.ts is None:
+        return Q()
+    if rank > cursor.rank:
+        return Q(ts__gte=cursor.ts)
+    if rank == cursor.rank:
+        return Q(ts__gt=cursor.ts) | Q(ts=cursor.ts, oid__gt=cursor.object_id)
+    return Q(ts__gt=cursor.ts)
+
+
+def sync_changes(association_id: int, cursor: SyncCursor | None = None, *, limit: int = 500) -> SyncPage:
+    """
+    Next `limit` changes of an association's members, memberships, charges and payments
+    after `cursor` (None = initial download), ordered by (updated_at / deleted_at, kind, id).
+
+    Rows newer than SYNC_SETTLE_SECONDS are left for the next call, so a transaction that
+    commits a little after its timestamp cannot land behind a cursor already handed out.
+    Raises SyncCursorExpired when the cursor's horizon is older than
+    SYNC_TOMBSTONE_RETENTION_DAYS: tombstones it still needs may have been purged.
+    """
+    now = timezone.now()
+    if cursor is None:
+        cursor = SyncCursor(since=now)
+    elif cursor.horizon < now - _retention():
+        raise SyncCursorExpired("Sync cursor has expired; start a full resync without a cursor.")
+    settle = timedelta(seconds=int(getattr(settings, "SYNC_SETTLE_SECONDS", 5)))
+    until = now - settle
+
+    branches = []
+    for rank, source in enumerate(_sources(association_id, cursor.since)):
+        branches.append(
+            source.filter(_after(cursor, rank), ts__lte=until)
+            .annotate(rank=Value(rank, output_field=IntegerField()))
+            .order_by()
+            .values_list("ts", "rank", "oid")
+        )
+    rows = list(branches[0].union(*branches[1:], all=True).order_by("ts", "rank", "oid")[: limit + 1])
+
+    page = SyncPage(cursor=cursor, has_more=len(rows) > limit)
+    rows = rows[:limit]
+
+    tombstones = {}
+    tombstone_ids = [oid for _, rank, oid in rows if rank == _DELETE]
+    if tombstone_ids:
+        tombstones = {
+            pk: (kind, object_id)
+            for pk, kind, object_id in SyncTombstone.objects.filter(pk__in=tombstone_ids).values_list(
+                "pk", "kind", "object_id"
+            )
+        }
+    for ts, rank, oid in rows:
+        if rank == _DELETE:
+            page.changes.append(("delete", *tombstones[oid]))
+        else:
+            page.changes.append(("upsert", SYNC_KINDS[rank], oid))
+    # With the whole backlog handed out the client has every change up to `until`.
+    seen_until = None if page.has_more else until
+    if rows:
+        ts, rank, oid = rows[-1]
+        page.cursor = SyncCursor(since=cursor.since, ts=ts, rank=rank, object_id=oid, seen_until=seen_until)
+    elif seen_until is not None:
+        page.cursor = replace(cursor, seen_until=seen_until)
+    return page
+
+
+def purge_sync_tombstones(*, batch_size: int = 1000) -> int:
+    """
+    Delete tombstones older than SYNC_TOMBSTONE_RETENTION_DAYS in primary-key batches;
+    `sync_changes` answers cursors older than that with SyncCursorExpired.
+    """
+    cutoff = timezone.now() - _retention()
+    deleted = 0
+    while True:
+        ids = list(SyncTombstone.objects.filter(deleted_at__lt=cutoff).values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += SyncTombstone.objects.filter(pk__in=ids).delete()[0]
+
+
+def record_tombstones(association_id: int | None, kind: str, *object_ids: int) -> None:
+    if association_id is None:
+        return
+    SyncTombstone.objects.bulk_create(
+        [SyncTombstone(association_id=association_id, kind=kind, object_id=pk) for pk in object_ids if pk]
+    )
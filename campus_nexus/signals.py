@@ -1,10 +1,13 @@
 from django.dispatch import receiver
-from django.db.models.signals import post_save, post_delete
-from django.core.mail import send_mail
-from django.conf import settings
-from django.db import transaction
-
-from .models import AssociationAdmin, Guild, Payment, Membership
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
+
+from .models import Announcement, Association, AssociationAdmin, Charge, Dean, Event, Expense, Guild, Payment, Membership, User
+from campus_nexus.services.auth_cache import invalidate_auth_user
+from campus_nexus.services.charges import refresh_charge_totals
+from campus_nexus.services.dashboard_cache import invalidate_dashboards
+from campus_nexus.services.ledger import refresh_ledger_for, remember_previous_bucket
+from campus_nexus.services.payments import is_being_posted
+from campus_nexus.services.sync import record_tombstones
 from campus_nexus.services.membership_emails import (
     send_membership_assigned_email,
     send_membership_removed_email,
@@ -64,84 +67,124 @@ def add_guild_model_permissions(sender, instance: Guild, created: bool, **kwargs
 
 @receiver([post_save, post_delete], sender=Payment)
 def recompute_charge_after_payment(sender, instance: Payment, **kwargs):
-    charge = instance.charge
-    if charge is None:
+    # post_payment() refreshes the charge itself; this covers direct ORM writes and deletes.
+    if not instance.charge_id or is_being_posted(instance):
         return
-    charge.recompute_status()
-    charge.save(update_fields=["status"])
+    refresh_charge_totals(instance.charge_id)
 
 
-@receiver(post_save, sender=Payment)
-def send_payment_recorded_email(sender, instance: Payment, created: bool, **kwargs):
-    # Only send when first created (not edits)
-    if not created:
-        return
+@receiver(pre_save, sender=Payment)
+@receiver(pre_save, sender=Expense)
+def remember_ledger_bucket(sender, instance, **kwargs):
+    """Capture the month a row is moving out of so the old ledger bucket gets refreshed too."""
+    remember_previous_bucket(instance)
 
-    member = instance.membership.member
-    if not member.email:
-        return
 
-    association = instance.membership.association
-    amount = instance.amount_paid
-    purpose = ""
-    if getattr(instance, "charge_id", None) and instance.charge:
-        purpose = instance.charge.title or instance.charge.get_purpose_display()
-
-    subject = "Payment Received - Campus Nexus"
-    message = (
-        f"Hello {member.full_name},\n\n"
-        f"Your payment has been recorded successfully in Campus Nexus.\n\n"
-        f"Association: {association.name}\n"
-        f"Amount: UGX {amount}\n"
-        f"Purpose: {purpose or 'N/A'}\n"
-        f"Method: {instance.get_payment_method_display() if hasattr(instance, 'get_payment_method_display') else instance.payment_method}\n"
-        f"Date Recorded: {instance.recorded_at if hasattr(instance, 'recorded_at') else instance.payment_date}\n\n"
-        f"Thank you.\n"
-        f"Campus Nexus"
-    )
+@receiver([post_save, post_delete], sender=Payment)
+@receiver([post_save, post_delete], sender=Expense)
+def refresh_monthly_ledger(sender, instance, origin=None, **kwargs):
+    # Deleting an association cascades to its ledger rows too; refreshing would recreate them.
+    if origin is not None and getattr(origin, "model", type(origin)) is Association:
+        return
+    refresh_ledger_for(instance)
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [member.email],
-        fail_silently=False,
-    )
-    
 
 @receiver(post_save, sender=Membership)
 def membership_created_email(sender, instance: Membership, created, **kwargs):
     if not created:
         return
 
-    member = instance.member
-    association = instance.association
-
-    transaction.on_commit(
-        lambda: send_membership_assigned_email(
-            member=member,
-            association=association,
-            membership=instance,
-        )
+    # Enqueued in the same transaction: the outbox row only exists if the membership commits.
+    send_membership_assigned_email(
+        member=instance.member,
+        association=instance.association,
+        membership=instance,
     )
 
 
 @receiver(post_delete, sender=Membership)
 def membership_removed_email(sender, instance: Membership, **kwargs):
-    member = instance.member
-    association = instance.association
-
-    transaction.on_commit(
-        lambda: send_membership_removed_email(
-            member=member,
-            association=association,
-        )
+    send_membership_removed_email(
+        member=instance.member,
+        association=instance.association,
+        membership_id=instance.pk,
     )
 
 @receiver([post_save, post_delete], sender=Payment)
 def update_bill_membership_status(sender, instance: Payment, **kwargs):
     """Auto-update BillMembership status when payment recorded/updated/deleted"""
-    charge = getattr(instance, 'charge', None)
+    if is_being_posted(instance):
+        return
+    try:
+        charge = instance.charge
+    except Charge.DoesNotExist:
+        return  # deleted together with its charge
     if charge and charge.bill_membership:
         bill_mem = charge.bill_membership
         bill_mem.update_status_from_payments()
+
+
+@receiver([post_save, post_delete], sender=Membership)
+@receiver([post_save, post_delete], sender=Expense)
+@receiver([post_save, post_delete], sender=Charge)
+@receiver([post_save, post_delete], sender=Event)
+def invalidate_association_dashboards(sender, instance, **kwargs):
+    invalidate_dashboards(instance.association_id)
+
+
+@receiver([post_save, post_delete], sender=Payment)
+def invalidate_dashboards_after_payment(sender, instance: Payment, **kwargs):
+    invalidate_dashboards(instance.membership.association_id)
+
+
+@receiver([post_save, post_delete], sender=Announcement)
+def invalidate_dashboards_after_announcement(sender, instance: Announcement, **kwargs):
+    invalidate_dashboards(instance.association_id, announcements=True)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_cached_auth_user(sender, instance, **kwargs):
+    invalidate_auth_user(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=AssociationAdmin)
+@receiver([post_save, post_delete], sender=Guild)
+@receiver([post_save, post_delete], sender=Dean)
+def invalidate_cached_auth_user_role(sender, instance, **kwargs):
+    invalidate_auth_user(instance.user_id)
+
+
+# Payment ids cascading from a membership.delete() / charge.delete(), kept on that instance
+# and written in one INSERT by its post_delete below (payments are deleted first).
+PAYMENT_TOMBSTONES = "_payment_tombstones"
+
+
+@receiver(post_delete, sender=Membership)
+def membership_sync_tombstones(sender, instance: Membership, **kwargs):
+    # Leaving the association also takes the member out of that association's sync scope.
+    record_tombstones(instance.association_id, "membership", instance.pk)
+    record_tombstones(instance.association_id, "member", instance.member_id)
+    record_tombstones(instance.association_id, "payment", *instance.__dict__.pop(PAYMENT_TOMBSTONES, ()))
+
+
+@receiver(post_delete, sender=Charge)
+def charge_sync_tombstone(sender, instance: Charge, **kwargs):
+    record_tombstones(instance.association_id, "charge", instance.pk)
+    record_tombstones(instance.association_id, "payment", *instance.__dict__.pop(PAYMENT_TOMBSTONES, ()))
+
+
+# pre_delete (still inside the delete's transaction): when a membership is deleted its
+# payments' post_delete can run after the membership row is already gone.
+@receiver(pre_delete, sender=Payment)
+def payment_sync_tombstone(sender, instance: Payment, origin=None, **kwargs):
+    if (isinstance(origin, Membership) and origin.pk == instance.membership_id) or (
+        isinstance(origin, Charge) and origin.pk == instance.charge_id
+    ):
+        origin.__dict__.setdefault(PAYMENT_TOMBSTONES, []).append(instance.pk)
+        return
+    if not Payment.membership.is_cached(instance) and Payment.charge.is_cached(instance) and instance.charge:
+        association_id = instance.charge.association_id
+    else:
+        # Cached, or loaded once here and reused by invalidate_dashboards_after_payment.
+        association_id = instance.membership.association_id
+    record_tombstones(association_id, "payment", instance.pk)
@@ -1,23 +1,21 @@
 import json
 from decimal import Decimal
-from datetime import date
 
 from dateutil.relativedelta import relativedelta
 from django import template
-from django.db.models import Count, DecimalField, ExpressionWrapper, F, Q, Sum
-from django.db.models.functions import Coalesce, TruncMonth
+from django.db.models import Count, Q
 from django.utils import timezone
 
-from campus_nexus.models import (
-    Announcement,
-    Association,
-    Charge,
-    Expense,
-    Event,
-    Member,
-    Membership,
-    Payment,
+from campus_nexus.models import Announcement, Event, Payment
+from campus_nexus.services import stats
+from campus_nexus.services.dashboard_cache import (
+    ANNOUNCEMENTS_SCOPE,
+    GLOBAL_SCOPE,
+    association_scope,
+    get_dashboard_snapshot,
+    wants_live_dashboard,
 )
+from campus_nexus.services.ledger import ledger_rows
 
 register = template.Library()
 
@@ -28,34 +26,21 @@ def _json_list(x):
     return json.dumps(list(x))
 
 
-def _monthly_trend(association, months=6):
-    """Returns last `months` months of income and expenses as chart-ready lists."""
-    today = timezone.localdate()
+def _monthly_trend(ledger, months=6):
+    """
+    Returns last `months` months of income and expenses as chart-ready lists,
+    built from already-fetched AssociationMonthlyLedger rows (no extra queries).
+    """
+    by_month = {row.month: row for row in ledger}
+    current = timezone.localdate().replace(day=1)
     labels, income_data, expense_data = [], [], []
 
     for i in range(months - 1, -1, -1):
-        anchor = today - relativedelta(months=i)
-        label = anchor.strftime("%b %Y")
-        labels.append(label)
-
-        inc = (
-            Payment.objects.filter(
-                membership__association=association,
-                status="recorded",
-                paid_at__year=anchor.year,
-                paid_at__month=anchor.month,
-            ).aggregate(s=Sum("amount_paid"))["s"] or ZERO
-        )
-        exp = (
-            Expense.objects.filter(
-                association=association,
-                status="recorded",
-                spent_at__year=anchor.year,
-                spent_at__month=anchor.month,
-            ).aggregate(s=Sum("amount"))["s"] or ZERO
-        )
-        income_data.append(float(inc))
-        expense_data.append(float(exp))
+        anchor = current - relativedelta(months=i)
+        labels.append(anchor.strftime("%b %Y"))
+        row = by_month.get(anchor)
+        income_data.append(float(row.income) if row else 0.0)
+        expense_data.append(float(row.expenses) if row else 0.0)
 
     return {
         "labels": _json_list(labels),
@@ -64,63 +49,35 @@ def _monthly_trend(association, months=6):
     }
 
 
-def _outstanding_balance(charges_qs):
-    """Compute outstanding balance at the DB level — no Python iteration."""
-    result = (
-        charges_qs.filter(status__in=["unpaid", "partial"])
-        .annotate(
-            paid_total=Coalesce(
-                Sum("payments__amount_paid", filter=Q(payments__status="recorded")),
-                ZERO,
-                output_field=DecimalField(max_digits=14, decimal_places=2),
-            )
-        )
-        .annotate(
-            remaining=ExpressionWrapper(
-                F("amount_due") - F("paid_total"),
-                output_field=DecimalField(max_digits=14, decimal_places=2),
-            )
-        )
-        .filter(remaining__gt=0)
-        .aggregate(total=Sum("remaining"))
+@register.simple_tag(takes_context=True)
+def dean_dashboard_data(context):
+    return get_dashboard_snapshot(
+        "dean",
+        [GLOBAL_SCOPE],
+        _dean_dashboard_payload,
+        force=wants_live_dashboard(context.get("request")),
     )
-    return result["total"] or ZERO
 
 
-@register.simple_tag(takes_context=True)
-def dean_dashboard_data(context):
-    total_associations = Association.objects.count()
-    total_members = Member.objects.count() or 0
+def _percent(value, total):
+    return 0.0 if total == 0 else round((value / total) * 100, 2)
 
-    faculty_based = Association.objects.filter(faculty__isnull=False).count()
-    non_faculty_based = Association.objects.filter(faculty__isnull=True).count()
 
-    active_memberships = Membership.objects.filter(status="active").count()
-    inactive_memberships = Membership.objects.filter(status="inactive").count()
-    suspended_memberships = Membership.objects.filter(status="suspended").count()
+def _dean_dashboard_payload():
+    associations = stats.association_stats()
+    members = stats.member_stats()
+    memberships = stats.membership_stats()
+    total_members = members.total
 
-    members_qs = (
-        Membership.objects.values("association__name")
-        .annotate(total=Count("member_id", distinct=True))
-        .order_by("-total")
-    )
-    top_members_qs = list(members_qs[:12])
-
-    members_labels = [r["association__name"] for r in top_members_qs]
-    members_data = [int(r["total"]) for r in top_members_qs]
-
-    members_percent = [
-        0.0 if total_members == 0 else round((v / total_members) * 100, 2)
-        for v in members_data
-    ]
-
-    if top_members_qs:
-        top_assoc_name = top_members_qs[0]["association__name"]
-        top_assoc_members = int(top_members_qs[0]["total"])
-        top_assoc_percent = (
-            0.0 if total_members == 0
-            else round((top_assoc_members / total_members) * 100, 2)
-        )
+    top_members = memberships.top_associations(12)
+    members_labels = [r.name for r in top_members]
+    members_data = [r.total for r in top_members]
+    members_percent = [_percent(v, total_members) for v in members_data]
+
+    if top_members:
+        top_assoc_name = top_members[0].name
+        top_assoc_members = top_members[0].total
+        top_assoc_percent = _percent(top_assoc_members, total_members)
     else:
         top_assoc_name = ""
         top_assoc_members = 0
@@ -134,34 +91,24 @@ def dean_dashboard_data(context):
     ev_labels = [r["association__name"] for r in events_qs]
     ev_data = [int(r["total"]) for r in events_qs]
 
-    member_type_qs = (
-        Member.objects.values("member_type")
-        .annotate(total=Count("id"))
-        .order_by("-total")
-    )
-    type_labels = [r["member_type"].title() for r in member_type_qs]
-    type_data = [int(r["total"]) for r in member_type_qs]
-    type_percent = [
-        0.0 if total_members == 0 else round((v / total_members) * 100, 2)
-        for v in type_data
-    ]
-
-    latest_announcements = (
-        Announcement.objects.filter(is_published=True)
-        .select_related("association", "faculty", "posted_by")
-        .order_by("-created_at")[:5]
+    member_types = sorted(members.by_type.items(), key=lambda item: -item[1])
+    type_labels = [member_type.title() for member_type, _ in member_types]
+    type_data = [total for _, total in member_types]
+    type_percent = [_percent(v, total_members) for v in type_data]
+
+    latest_announcements, announcement_totals = stats.announcement_feed(
+        Announcement.objects.filter(is_published=True), 5
     )
-    total_published_announcements = Announcement.objects.filter(is_published=True).count()
 
     return {
-        "total_associations": total_associations,
+        "total_associations": associations.total,
         "total_members": total_members,
-        "faculty_based_associations": faculty_based,
-        "non_faculty_based_associations": non_faculty_based,
+        "faculty_based_associations": associations.faculty_based,
+        "non_faculty_based_associations": associations.non_faculty_based,
         "membership_status": {
-            "active": active_memberships,
-            "inactive": inactive_memberships,
-            "suspended": suspended_memberships,
+            "active": memberships.active,
+            "inactive": memberships.inactive,
+            "suspended": memberships.suspended,
         },
         "top_assoc_name": top_assoc_name,
         "top_assoc_members": top_assoc_members,
@@ -182,62 +129,51 @@ def dean_dashboard_data(context):
         },
         "assoc_type_split": {
             "labels": _json_list(["Faculty-based", "Non faculty-based"]),
-            "data": _json_list([faculty_based, non_faculty_based]),
+            "data": _json_list([associations.faculty_based, associations.non_faculty_based]),
         },
         "announcements": {
             "latest": latest_announcements,
-            "published_count": total_published_announcements,
+            "published_count": announcement_totals.published,
         },
     }
 
 
 @register.simple_tag(takes_context=True)
 def guild_dashboard_data(context):
-    total_associations = Association.objects.count()
-    total_members = Member.objects.count() or 0
-    total_memberships = Membership.objects.filter(status="active").count()
-
-    top_assoc_qs = (
-        Membership.objects.filter(status="active")
-        .values("association__name")
-        .annotate(total=Count("member_id", distinct=True))
-        .order_by("-total")[:6]
+    return get_dashboard_snapshot(
+        "guild",
+        [GLOBAL_SCOPE],
+        _guild_dashboard_payload,
+        force=wants_live_dashboard(context.get("request")),
     )
-    top_assoc_labels = [r["association__name"] for r in top_assoc_qs]
-    top_assoc_data = [int(r["total"]) for r in top_assoc_qs]
 
-    member_type_qs = (
-        Member.objects.values("member_type")
-        .annotate(total=Count("id"))
-        .order_by("-total")
-    )
-    type_labels = [r["member_type"].title() for r in member_type_qs]
-    type_data = [int(r["total"]) for r in member_type_qs]
 
-    latest_announcements = (
-        Announcement.objects.all()
-        .select_related("association", "faculty", "posted_by")
-        .order_by("-created_at")[:6]
-    )
-    drafts = Announcement.objects.filter(is_published=False).count()
-    published = Announcement.objects.filter(is_published=True).count()
+def _guild_dashboard_payload():
+    associations = stats.association_stats()
+    members = stats.member_stats()
+    memberships = stats.membership_stats()
+
+    top_assoc = memberships.top_associations(6, active_only=True)
+    member_types = sorted(members.by_type.items(), key=lambda item: -item[1])
+
+    latest_announcements, announcement_totals = stats.announcement_feed(Announcement.objects.all(), 6)
 
     return {
-        "total_associations": total_associations,
-        "total_members": total_members,
-        "active_memberships": total_memberships,
+        "total_associations": associations.total,
+        "total_members": members.total,
+        "active_memberships": memberships.active,
         "top_associations": {
-            "labels": _json_list(top_assoc_labels),
-            "data": _json_list(top_assoc_data),
+            "labels": _json_list(r.name for r in top_assoc),
+            "data": _json_list(r.active for r in top_assoc),
         },
         "member_type_distribution": {
-            "labels": _json_list(type_labels),
-            "data": _json_list(type_data),
+            "labels": _json_list(member_type.title() for member_type, _ in member_types),
+            "data": _json_list(total for _, total in member_types),
         },
         "announcements": {
             "latest": latest_announcements,
-            "drafts": drafts,
-            "published": published,
+            "drafts": announcement_totals.drafts,
+            "published": announcement_totals.published,
         },
     }
 
@@ -250,61 +186,35 @@ def association_dashboard_data(context):
         return {}
 
     assoc = assoc_admin.association
-
-    membership_status_qs = (
-        Membership.objects.filter(association=assoc)
-        .values("status")
-        .annotate(total=Count("id"))
+    # Announcements include the admin's own drafts, so snapshots are per association and user.
+    return get_dashboard_snapshot(
+        f"association:{assoc.id}:user:{request.user.pk}",
+        [association_scope(assoc.id), ANNOUNCEMENTS_SCOPE],
+        lambda: _association_dashboard_payload(assoc, request.user),
+        force=wants_live_dashboard(request),
     )
-    membership_counts = {row["status"]: row["total"] for row in membership_status_qs}
-    total_members = sum(membership_counts.values())
-    active_members = membership_counts.get("active", 0)
-
-    total_events = Event.objects.filter(association=assoc).count()
-    charges_qs = Charge.objects.filter(association=assoc).exclude(status="cancelled")
-
-    total_billed = charges_qs.aggregate(total=Sum("amount_due")).get("total") or ZERO
 
-    total_collected = (
-        Payment.objects.filter(membership__association=assoc, status="recorded")
-        .aggregate(total=Sum("amount_paid"))
-        .get("total") or ZERO
-    )
-    total_expenses = (
-        Expense.objects.filter(association=assoc, status="recorded")
-        .aggregate(total=Sum("amount"))
-        .get("total") or ZERO
-    )
 
-    outstanding_balance = _outstanding_balance(charges_qs)
+def _association_dashboard_payload(assoc, user):
+    memberships = stats.membership_stats(assoc.id)
+    charges = stats.charge_stats(assoc.id)
+    total_events = Event.objects.filter(association=assoc).count()
+    total_billed = charges.total_billed
 
-    overdue_charges_count = charges_qs.filter(
-        is_overdue=True, status__in=["unpaid", "partial"]
-    ).count()
-    open_charges_count = charges_qs.filter(status__in=["unpaid", "partial"]).count()
+    # One indexed read of the monthly rollup covers lifetime, month-to-date and trend figures.
+    ledger = ledger_rows(assoc.id)
+    total_collected = sum((row.income for row in ledger), ZERO)
+    total_expenses = sum((row.expenses for row in ledger), ZERO)
 
     collection_rate = (
         round((float(total_collected) / float(total_billed)) * 100, 1)
         if total_billed > 0 else 0.0
     )
 
-    today = timezone.localdate()
-    this_month_collected = (
-        Payment.objects.filter(
-            membership__association=assoc,
-            status="recorded",
-            paid_at__year=today.year,
-            paid_at__month=today.month,
-        ).aggregate(total=Sum("amount_paid")).get("total") or ZERO
-    )
-    this_month_expenses = (
-        Expense.objects.filter(
-            association=assoc,
-            status="recorded",
-            spent_at__year=today.year,
-            spent_at__month=today.month,
-        ).aggregate(total=Sum("amount")).get("total") or ZERO
-    )
+    current_month = timezone.localdate().replace(day=1)
+    this_month = next((row for row in ledger if row.month == current_month), None)
+    this_month_collected = this_month.income if this_month else ZERO
+    this_month_expenses = this_month.expenses if this_month else ZERO
 
     net_position = total_collected - total_expenses
     net_margin_percent = (
@@ -312,39 +222,38 @@ def association_dashboard_data(context):
         if total_collected > 0 else ZERO
     )
 
-    recent_payments = (
+    recent_payments = list(
         Payment.objects.filter(membership__association=assoc, status="recorded")
         .select_related("membership__member", "charge")
         .order_by("-recorded_at")[:6]
     )
 
-    latest_announcements = (
+    latest_announcements, _ = stats.announcement_feed(
         Announcement.objects.filter(
             Q(is_published=True, audience="all")
             | Q(is_published=True, audience="association", association=assoc)
-            | Q(posted_by=request.user)
-        )
-        .select_related("association", "faculty", "posted_by")
-        .order_by("-created_at")[:6]
+            | Q(posted_by=user)
+        ),
+        6,
     )
 
-    monthly_trend = _monthly_trend(assoc, months=6)
+    monthly_trend = _monthly_trend(ledger, months=6)
 
     return {
         "association_name": assoc.name,
-        "total_members": total_members,
-        "active_members": active_members,
+        "total_members": memberships.total,
+        "active_members": memberships.active,
         "total_events": total_events,
-        "membership_status": membership_counts,
+        "membership_status": memberships.by_status,
         "finance": {
             "total_billed": total_billed,
             "total_collected": total_collected,
             "total_expenses": total_expenses,
             "net_position": net_position,
             "net_margin_percent": net_margin_percent,
-            "outstanding_balance": outstanding_balance,
-            "overdue_charges_count": overdue_charges_count,
-            "open_charges_count": open_charges_count,
+            "outstanding_balance": charges.outstanding_balance,
+            "overdue_charges_count": charges.overdue_count,
+            "open_charges_count": charges.open_count,
             "this_month_collected": this_month_collected,
             "this_month_expenses": this_month_expenses,
             "collection_rate": collection_rate,
@@ -355,54 +264,39 @@ def association_dashboard_data(context):
     }
 
 
-@register.simple_tag
-def superuser_dashboard_data():
-    total_members = Member.objects.count()
-    total_associations = Association.objects.count()
-    total_memberships = Membership.objects.filter(status="active").count()
-
-    total_collected = (
-        Payment.objects.filter(status="recorded")
-        .aggregate(s=Sum("amount_paid"))["s"] or ZERO
-    )
-    total_expenses = (
-        Expense.objects.filter(status="recorded")
-        .aggregate(s=Sum("amount"))["s"] or ZERO
+@register.simple_tag(takes_context=True)
+def superuser_dashboard_data(context):
+    return get_dashboard_snapshot(
+        "superuser",
+        [GLOBAL_SCOPE],
+        _superuser_dashboard_payload,
+        force=wants_live_dashboard(context.get("request")),
     )
-    overdue_count = Charge.objects.filter(
-        is_overdue=True, status__in=["unpaid", "partial"]
-    ).count()
 
-    member_type_qs = (
-        Member.objects.values("member_type")
-        .annotate(total=Count("id"))
-        .order_by("-total")
-    )
-    type_labels = [r["member_type"].title() for r in member_type_qs]
-    type_data = [int(r["total"]) for r in member_type_qs]
-
-    top_assoc_qs = (
-        Membership.objects.filter(status="active")
-        .values("association__name")
-        .annotate(total=Count("member_id", distinct=True))
-        .order_by("-total")[:8]
-    )
-    top_labels = [r["association__name"] for r in top_assoc_qs]
-    top_data = [int(r["total"]) for r in top_assoc_qs]
+
+def _superuser_dashboard_payload():
+    associations = stats.association_stats()
+    members = stats.member_stats()
+    memberships = stats.membership_stats()
+    finance = stats.finance_stats()
+    charges = stats.charge_stats()
+
+    member_types = sorted(members.by_type.items(), key=lambda item: -item[1])
+    top_assoc = memberships.top_associations(8, active_only=True)
 
     return {
-        "total_members": total_members,
-        "total_associations": total_associations,
-        "active_memberships": total_memberships,
-        "total_collected": total_collected,
-        "total_expenses": total_expenses,
-        "overdue_count": overdue_count,
+        "total_members": members.total,
+        "total_associations": associations.total,
+        "active_memberships": memberships.active,
+        "total_collected": finance.income,
+        "total_expenses": finance.expenses,
+        "overdue_count": charges.overdue_count,
         "member_type_distribution": {
-            "labels": _json_list(type_labels),
-            "data": _json_list(type_data),
+            "labels": _json_list(member_type.title() for member_type, _ in member_types),
+            "data": _json_list(total for _, total in member_types),
         },
         "top_associations": {
-            "labels": _json_list(top_labels),
-            "data": _json_list(top_data),
+            "labels": _json_list(r.name for r in top_assoc),
+            "data": _json_list(r.active for r in top_assoc),
         },
     }
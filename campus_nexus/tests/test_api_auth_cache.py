@@ -0,0 +1,103 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from campus_nexus.models import Association, AssociationAdmin, Charge, Member, Membership
+from campus_nexus.services.auth_cache import build_auth_user, get_auth_snapshot
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "auth-cache-tests"}}
+AUTH_TABLES = ("auth_user", "campus_nexus_associationadmin", "campus_nexus_guild", "campus_nexus_dean")
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    DASHBOARD_CACHE_TTL=0,
+    SYNC_SETTLE_SECONDS=0,
+    AUTH_USER_CACHE_TTL=60,
+)
+class CachedJWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Auth Cache Association")
+        cls.other = Association.objects.create(name="Other Auth Cache Association")
+        cls.user = get_user_model().objects.create_user(username="auth_cache", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=cls.user, association=cls.association)
+        for i, association in enumerate([cls.association, cls.other]):
+            member = Member.objects.create(
+                first_name=f"Auth{i}",
+                last_name="Member",
+                email=f"authcache{i}@example.com",
+                phone=f"07000015{i:02d}",
+                registration_number=f"223-063012-15{i}",
+                member_type="student",
+            )
+            membership = Membership.objects.create(member=member, association=association)
+            Charge.objects.create(association=association, membership=membership, purpose="other", amount_due=10)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def _sync(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("sync"))
+        auth_queries = [q["sql"] for q in ctx.captured_queries if any(f'"{t}"' in q["sql"] for t in AUTH_TABLES)]
+        return response, auth_queries
+
+    def _charge_associations(self, response):
+        self.assertEqual(response.status_code, 200, response.content)
+        ids = [c["id"] for c in response.data["changes"] if c["type"] == "charge"]
+        return set(Charge.objects.filter(pk__in=ids).values_list("association_id", flat=True))
+
+    def test_warm_requests_make_no_auth_queries(self):
+        response, cold = self._sync()
+        self.assertEqual(len(cold), 1, cold)
+        self.assertEqual(self._charge_associations(response), {self.association.pk})
+
+        response, warm = self._sync()
+        self.assertEqual(warm, [])
+        self.assertEqual(self._charge_associations(response), {self.association.pk})
+
+    def test_role_changes_drop_the_cached_user(self):
+        self._sync()
+        with self.captureOnCommitCallbacks(execute=True):
+            admin = AssociationAdmin.objects.get(user=self.user)
+            admin.association = self.other
+            admin.save()
+
+        response, auth_queries = self._sync()
+        self.assertEqual(len(auth_queries), 1)
+        self.assertEqual(self._charge_associations(response), {self.other.pk})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.delete()
+        response, _ = self._sync()
+        self.assertEqual(response.status_code, 403)
+
+    def test_deactivated_user_is_rejected(self):
+        self._sync()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save(update_fields=["is_active"])
+
+        response, _ = self._sync()
+        self.assertEqual(response.status_code, 401)
+
+    def test_cache_holds_no_password_hash(self):
+        self._sync()
+        snapshot = get_auth_snapshot(self.user.pk)
+        self.assertNotIn("password", snapshot)
+        self.assertNotIn(self.user.password, repr(snapshot))
+        self.assertEqual(snapshot["password_md5"], get_md5_hash_password(self.user.password))
+
+        user = build_auth_user(snapshot)
+        self.assertEqual(user.association_admin.association_id, self.association.pk)
+        self.assertEqual(user.username, "auth_cache")  # deferred, loaded on access
@@ -0,0 +1,184 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from campus_nexus.bulk import BulkWriteView
+from campus_nexus.models import (
+    Association, AssociationMonthlyLedger, Charge, Course, EmailOutbox, Faculty, Member, Membership, Payment,
+    SyncTombstone,
+)
+
+
+def _member(i, **extra):
+    return {
+        "first_name": f"Bulk{i}",
+        "last_name": "Student",
+        "email": f"bulk{i}@example.com",
+        "phone": f"0700013{i:03d}",
+        "registration_number": f"225-063012-{i:03d}",
+        "member_type": "student",
+        **extra,
+    }
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ApiBulkWriteTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_bulk", password="pass12345")
+        cls.faculty = Faculty.objects.create(name="Bulk Faculty")
+        cls.course = Course.objects.create(name="Bulk Course", faculty=cls.faculty, duration_years=3)
+        cls.association = Association.objects.create(name="Bulk Association")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _post(self, name, items):
+        return self.client.post(reverse(name), items, format="json")
+
+    def test_members_are_created_in_a_fixed_number_of_queries(self):
+        counts = []
+        for start, size in [(0, 5), (100, 40)]:
+            items = [_member(start + i, faculty=self.faculty.pk, course=self.course.pk) for i in range(size)]
+            with CaptureQueriesContext(connection) as ctx:
+                response = self._post("member-bulk", items)
+            self.assertEqual(response.status_code, 200, response.content)
+            self.assertEqual(response.data["created"], size)
+            counts.append(len(ctx.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(Member.objects.filter(course=self.course).count(), 45)
+        first = response.data["results"][0]
+        self.assertEqual(first["status"], "created")
+        self.assertEqual(Member.objects.get(pk=first["id"]).registration_number, "225-063012-100")
+
+    def test_any_invalid_item_rejects_the_whole_list(self):
+        Member.objects.create(**_member(900))
+        items = [
+            _member(1),
+            _member(2, email="bulk1@example.com"),
+            _member(3, email="bulk900@example.com"),
+            _member(4, faculty=999999),
+            _member(5, phone="not-a-phone"),
+        ]
+
+        response = self._post("member-bulk", items)
+
+        self.assertEqual(response.status_code, 400)
+        statuses = [r["status"] for r in response.data["results"]]
+        self.assertEqual(statuses, ["valid", "invalid", "invalid", "invalid", "invalid"])
+        errors = [r.get("errors", {}) for r in response.data["results"]]
+        self.assertIn("email", errors[1])
+        self.assertIn("email", errors[2])
+        self.assertIn("faculty", errors[3])
+        self.assertIn("phone", errors[4])
+        self.assertFalse(Member.objects.filter(email="bulk1@example.com").exists())
+
+    def test_updates_by_id_are_partial(self):
+        member = Member.objects.create(**_member(7))
+
+        response = self._post("member-bulk", [{"id": member.pk, "phone": "0700999999"}, {"id": 999999}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("id", response.data["results"][1]["errors"])
+
+        response = self._post("member-bulk", [{"id": member.pk, "phone": "0700999999"}])
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.data["results"], [{"id": member.pk, "status": "updated"}])
+        member.refresh_from_db()
+        self.assertEqual(member.phone, "0700999999")
+        self.assertEqual(member.first_name, "Bulk7")
+
+    def test_memberships_queue_welcome_emails_and_enforce_uniqueness(self):
+        members = [Member.objects.create(**_member(20 + i)) for i in range(3)]
+        Membership.objects.create(member=members[0], association=self.association)
+        EmailOutbox.objects.all().delete()
+
+        items = [{"member": m.pk, "association": self.association.pk} for m in members]
+
+        response = self._post("membership-bulk", items)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([r["status"] for r in response.data["results"]], ["invalid", "valid", "valid"])
+        self.assertIn("already registered", str(response.data["results"][0]["errors"]))
+
+        response = self._post("membership-bulk", items[1:])
+        self.assertEqual(response.status_code, 200, response.content)
+        created = Membership.objects.filter(pk__in=[r["id"] for r in response.data["results"]])
+        self.assertTrue(all(m.subscription_anchor_date for m in created))
+        self.assertEqual(
+            set(EmailOutbox.objects.values_list("to_email", flat=True)), {m.email for m in members[1:]}
+        )
+
+    def test_conflicting_concurrent_write_is_a_409_per_item(self):
+        unique_errors = BulkWriteView._unique_errors
+        checks = []
+
+        def checked_before_the_race(view, *args):
+            # The first check passes; a concurrent request then inserts the same email.
+            checks.append(args)
+            if len(checks) == 1:
+                Member.objects.create(**_member(62, email="bulk61@example.com"))
+                return {}
+            return unique_errors(view, *args)
+
+        with mock.patch.object(BulkWriteView, "_unique_errors", checked_before_the_race):
+            response = self._post("member-bulk", [_member(60), _member(61)])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual([r["status"] for r in response.data["results"]], ["valid", "invalid"])
+        self.assertIn("email", response.data["results"][1]["errors"])
+        self.assertFalse(Member.objects.filter(email="bulk60@example.com").exists())
+
+    def test_moving_a_membership_updates_the_old_associations_scope(self):
+        other = Association.objects.create(name="Other Bulk Association")
+        member = Member.objects.create(**_member(70))
+        membership = Membership.objects.create(member=member, association=self.association)
+
+        with mock.patch("campus_nexus.views.invalidate_dashboards") as invalidate:
+            response = self._post("membership-bulk", [{"id": membership.pk, "association": other.pk}])
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual({c.args[0] for c in invalidate.call_args_list}, {self.association.pk, other.pk})
+        self.assertEqual(
+            set(SyncTombstone.objects.filter(association=self.association).values_list("kind", "object_id")),
+            {("membership", membership.pk), ("member", member.pk)},
+        )
+        self.assertFalse(SyncTombstone.objects.filter(association=other).exists())
+
+    def test_payments_refresh_charges_ledger_and_receipts(self):
+        member = Member.objects.create(**_member(40))
+        membership = Membership.objects.create(member=member, association=self.association)
+        charge = Charge.objects.create(
+            association=self.association, membership=membership, purpose="other", amount_due=Decimal("100.00")
+        )
+        EmailOutbox.objects.all().delete()
+        item = {"charge": charge.pk, "membership": membership.pk, "amount_paid": "30.00"}
+
+        response = self._post("payment-bulk", [item, {**item, "amount_paid": "20.00"}])
+
+        self.assertEqual(response.status_code, 200, response.content)
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("50.00"))
+        self.assertEqual(charge.status, "partial")
+        self.assertEqual(EmailOutbox.objects.filter(subject__startswith="Payment received").count(), 2)
+        ledger = AssociationMonthlyLedger.objects.get(association=self.association)
+        self.assertEqual(ledger.income, Decimal("50.00"))
+
+        payment_id = response.data["results"][0]["id"]
+        response = self._post("payment-bulk", [{"id": payment_id, "amount_paid": "80.00"}])
+        self.assertEqual(response.status_code, 200, response.content)
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("100.00"))
+        self.assertEqual(charge.status, "paid")
+        self.assertEqual(Payment.objects.get(pk=payment_id).amount_paid, Decimal("80.00"))
+        self.assertEqual(EmailOutbox.objects.filter(subject__startswith="Payment received").count(), 2)
+
+    def test_rejects_non_lists(self):
+        self.assertEqual(self._post("member-bulk", {"first_name": "x"}).status_code, 400)
+        self.assertEqual(self._post("member-bulk", []).status_code, 400)
@@ -0,0 +1,93 @@
+import time
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Association, Charge, Member, Membership, Payment
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ApiConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_conditional", password="pass12345")
+        association = Association.objects.create(name="Conditional Association")
+        member = Member.objects.create(
+            first_name="Conditional",
+            last_name="Member",
+            email="conditional@example.com",
+            phone="0700001100",
+            registration_number="223-063012-110",
+            member_type="student",
+        )
+        cls.membership = Membership.objects.create(member=member, association=association)
+        cls.charge = Charge.objects.create(
+            association=association,
+            membership=cls.membership,
+            purpose="other",
+            amount_due=Decimal("100.00"),
+        )
+        cls.payment = Payment.objects.create(charge=cls.charge, membership=cls.membership, amount_paid=Decimal("40.00"))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_list_is_a_304_from_one_query(self):
+        first = self.client.get(reverse("payment-list"))
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first["ETag"].startswith('W/"'))
+        self.assertNotIn("Last-Modified", first)
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(reverse("payment-list"), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], first["ETag"])
+        self.assertEqual(len(ctx.captured_queries), 1)
+
+    def test_write_changes_the_list_etag(self):
+        etag = self.client.get(reverse("payment-list"))["ETag"]
+
+        Payment.objects.create(charge=self.charge, membership=self.membership, amount_paid=Decimal("10.00"))
+
+        response = self.client.get(reverse("payment-list"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_delete_is_not_hidden_by_if_modified_since(self):
+        extra = Payment.objects.create(charge=self.charge, membership=self.membership, amount_paid=Decimal("10.00"))
+        etag = self.client.get(reverse("payment-list"))["ETag"]
+
+        extra.delete()
+
+        # MAX(updated_at) did not move; a date-only validator must not turn this into a 304.
+        since = http_date(time.time() + 60)
+        response = self.client.get(reverse("payment-list"), HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+        response = self.client.get(reverse("payment-list"), HTTP_IF_NONE_MATCH=etag, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 200)
+
+    def test_filters_get_their_own_etag(self):
+        unfiltered = self.client.get(reverse("payment-list"))["ETag"]
+        filtered = self.client.get(reverse("payment-list"), {"status": "recorded"})["ETag"]
+        self.assertNotEqual(unfiltered, filtered)
+
+    def test_unchanged_detail_is_a_304(self):
+        url = reverse("payment-detail", args=[self.payment.pk])
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304)
+
+        self.payment.note = "edited"
+        self.payment.save(update_fields=["note"])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200)
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campus_nexus import filters
+from campus_nexus.models import Association, Charge, Member, Membership, Payment
+
+
+def _indexed_leading_columns(model):
+    columns = {model._meta.pk.name}
+    for f in model._meta.concrete_fields:
+        if f.db_index or f.unique or f.is_relation:
+            columns.add(f.name)
+    for index in model._meta.indexes:
+        columns.add(index.fields[0].lstrip("-"))
+    for constraint in model._meta.constraints:
+        fields = getattr(constraint, "fields", ())
+        if fields:
+            columns.add(fields[0])
+    return columns
+
+
+class FilterSetIndexTests(SimpleTestCase):
+    def test_every_filter_and_ordering_field_is_indexed(self):
+        for filterset in filters.FilterSet.__subclasses__():
+            indexed = _indexed_leading_columns(filterset.model)
+            for name in [*filterset.fields, *filterset.ordering]:
+                self.assertIn(name, indexed, f"{filterset.__name__}.{name} has no index")
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ApiFilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_filter", password="pass12345")
+        cls.association = Association.objects.create(name="Filter Association")
+        cls.memberships = []
+        for i, reg in enumerate(["223-063012-901", "223-063012-902", "224-063012-903"]):
+            member = Member.objects.create(
+                first_name=f"Filter{i}",
+                last_name="Member",
+                email=f"filter{i}@example.com",
+                phone=f"07000009{i:02d}",
+                registration_number=reg,
+                member_type="student" if i < 2 else "alumni",
+            )
+            cls.memberships.append(Membership.objects.create(member=member, association=cls.association))
+
+        cls.charge = Charge.objects.create(
+            association=cls.association,
+            membership=cls.memberships[0],
+            purpose="other",
+            amount_due=Decimal("500.00"),
+        )
+        base = timezone.make_aware(datetime(2026, 3, 1, 12, 0))
+        for day, amount in [(0, "50.00"), (10, "120.00"), (20, "80.00")]:
+            Payment.objects.create(
+                charge=cls.charge,
+                membership=cls.memberships[0],
+                amount_paid=Decimal(amount),
+                paid_at=base + timedelta(days=day),
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def _ids(self, name, params):
+        response = self.client.get(reverse(name), params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.data["results"]
+
+    def test_prefix_and_in_filters_on_members(self):
+        rows = self._ids("member-list", {"registration_number__prefix": "223-"})
+        self.assertEqual({r["registration_number"] for r in rows}, {"223-063012-901", "223-063012-902"})
+
+        rows = self._ids("member-list", {"member_type__in": "alumni"})
+        self.assertEqual([r["registration_number"] for r in rows], ["224-063012-903"])
+
+    def test_date_and_amount_ranges_with_ordering(self):
+        rows = self._ids(
+            "payment-list",
+            {"paid_at__gte": "2026-03-05", "amount_paid__lte": "100", "ordering": "amount_paid"},
+        )
+        self.assertEqual([r["amount_paid"] for r in rows], ["80.00"])
+
+        rows = self._ids("payment-list", {"membership": self.memberships[0].pk, "ordering": "-amount_paid"})
+        self.assertEqual([r["amount_paid"] for r in rows], ["120.00", "80.00", "50.00"])
+
+    def test_invalid_value_is_a_400(self):
+        response = self.client.get(reverse("payment-list"), {"paid_at__gte": "not-a-date"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("paid_at", response.data)
+
+    def test_unlisted_ordering_falls_back_to_default(self):
+        rows = self._ids("member-list", {"ordering": "phone"})
+        self.assertEqual([r["id"] for r in rows], sorted((r["id"] for r in rows), reverse=True))
@@ -0,0 +1,101 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Association, Charge, EmailOutbox, IdempotencyKey, Member, Membership, Payment
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class PaymentIdempotencyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_idempotent", password="pass12345")
+        association = Association.objects.create(name="Idempotent Association")
+        member = Member.objects.create(
+            first_name="Retry",
+            last_name="Member",
+            email="retry@example.com",
+            phone="0700001400",
+            registration_number="223-063012-140",
+            member_type="student",
+        )
+        cls.membership = Membership.objects.create(member=member, association=association)
+        cls.charge = Charge.objects.create(
+            association=association, membership=cls.membership, purpose="other", amount_due=Decimal("100.00")
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        EmailOutbox.objects.all().delete()
+
+    def _pay(self, key, amount="25.00", **data):
+        payload = {"charge": self.charge.pk, "membership": self.membership.pk, "amount_paid": amount, **data}
+        return self.client.post(reverse("payment-list"), payload, HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retry_replays_the_first_response_without_recording_again(self):
+        first = self._pay("momo-123")
+        second = self._pay("momo-123")
+
+        self.assertEqual(first.status_code, 201, first.content)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(second.data["id"], first.data["id"])
+        self.assertEqual(Payment.objects.filter(charge=self.charge).count(), 1)
+        self.assertEqual(EmailOutbox.objects.filter(subject__startswith="Payment received").count(), 1)
+        self.charge.refresh_from_db()
+        self.assertEqual(self.charge.amount_paid, Decimal("25.00"))
+
+    def test_key_reused_for_a_different_request_is_rejected(self):
+        self._pay("momo-456")
+        response = self._pay("momo-456", amount="30.00")
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Payment.objects.filter(charge=self.charge).count(), 1)
+
+    def test_failed_request_releases_the_key(self):
+        response = self._pay("momo-789", amount="not-money")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(IdempotencyKey.objects.filter(key="momo-789").exists())
+
+        self.assertEqual(self._pay("momo-789").status_code, 201)
+
+    def test_requests_without_a_key_are_unchanged(self):
+        payload = {"charge": self.charge.pk, "membership": self.membership.pk, "amount_paid": "5.00"}
+        self.client.post(reverse("payment-list"), payload)
+        self.client.post(reverse("payment-list"), payload)
+
+        self.assertEqual(Payment.objects.filter(charge=self.charge).count(), 2)
+        self.assertFalse(IdempotencyKey.objects.exists())
+
+    def test_bulk_payments_accept_a_key(self):
+        items = [{"charge": self.charge.pk, "membership": self.membership.pk, "amount_paid": "10.00"}]
+        url = reverse("payment-bulk")
+        first = self.client.post(url, items, format="json", HTTP_IDEMPOTENCY_KEY="bulk-1")
+        second = self.client.post(url, items, format="json", HTTP_IDEMPOTENCY_KEY="bulk-1")
+
+        self.assertEqual(first.status_code, 200, first.content)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(Payment.objects.filter(charge=self.charge).count(), 1)
+
+    def test_expired_keys_are_reusable_and_purged(self):
+        self._pay("old-key")
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(self._pay("old-key", amount="30.00").status_code, 201)
+        self.assertEqual(Payment.objects.filter(charge=self.charge).count(), 2)
+
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        self._pay("fresh-key")
+        out = StringIO()
+        call_command("purge_idempotency_keys", stdout=out)
+
+        self.assertIn("Purged 1", out.getvalue())
+        self.assertEqual(list(IdempotencyKey.objects.values_list("key", flat=True)), ["fresh-key"])
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Member
+
+
+@override_settings(API_PAGE_SIZE=5, API_MAX_PAGE_SIZE=8)
+class ApiCursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_pager", password="pass12345")
+        Member.objects.bulk_create(
+            Member(
+                first_name=f"Page{i}",
+                last_name="Member",
+                email=f"page{i}@example.com",
+                phone=f"07000007{i:02d}",
+                registration_number=f"223-063012-7{i:02d}",
+                member_type="student",
+            )
+            for i in range(12)
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_walks_every_row_once_newest_first(self):
+        seen = []
+        url = reverse("member-list")
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), 5)
+            self.assertNotIn("count", response.data)
+            seen.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+
+        expected = list(Member.objects.order_by("-id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
+
+    def test_page_size_param_is_capped(self):
+        response = self.client.get(reverse("member-list"), {"page_size": 100})
+        self.assertEqual(len(response.data["results"]), 8)
+
+    def test_deep_page_uses_keyset_not_offset_or_count(self):
+        first = self.client.get(reverse("member-list"))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(first.data["next"])
+        self.assertEqual(response.status_code, 200)
+
+        sql = " ".join(q["sql"].upper() for q in ctx.captured_queries)
+        self.assertNotIn("COUNT(", sql)
+        self.assertNotIn("OFFSET", sql)
+        self.assertIn('"ID" <', sql)
+
+    def _walk(self, params):
+        pages, response = [], self.client.get(reverse("member-list"), params)
+        while True:
+            self.assertEqual(response.status_code, 200, response.content)
+            pages.append([row["id"] for row in response.data["results"]])
+            if not response.data["next"]:
+                return pages, response
+            response = self.client.get(response.data["next"])
+
+    def test_ordering_with_ties_and_nulls_pages_on_field_and_id(self):
+        members = list(Member.objects.order_by("id"))
+        created = [timezone.now() - timedelta(days=1), timezone.now()]
+        for i, member in enumerate(members):
+            if i % 3 == 0:
+                member.registration_number = None
+            member.created_at = created[i % 2]
+        Member.objects.bulk_update(members, ["registration_number", "created_at"])
+
+        # NULLs sort as the smallest value; ties fall back to id in the same direction.
+        keys = {
+            "registration_number": lambda m: (m.registration_number is not None, m.registration_number or "", m.id),
+            "created_at": lambda m: (m.created_at, m.id),
+        }
+        for field, key in keys.items():
+            for ordering in (field, f"-{field}"):
+                with self.subTest(ordering=ordering):
+                    self._assert_walks_in_order(ordering, sorted(members, key=key, reverse=ordering.startswith("-")))
+
+    def _assert_walks_in_order(self, ordering, expected):
+        pages, last = self._walk({"ordering": ordering, "page_size": 2})
+        seen = [pk for page in pages for pk in page]
+        self.assertEqual(seen, [m.id for m in expected])
+
+        # Walking back from the last page returns the same pages.
+        url, previous = last.data["previous"], []
+        while url:
+            response = self.client.get(url)
+            previous.insert(0, [row["id"] for row in response.data["results"]])
+            url = response.data["previous"]
+        self.assertEqual(previous, pages[:-1])
+
+    def test_ordered_pages_use_keyset_not_offset(self):
+        first = self.client.get(reverse("member-list"), {"ordering": "created_at", "page_size": 2})
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(first.data["next"])
+        self.assertEqual(response.status_code, 200)
+        sql = " ".join(q["sql"].upper() for q in ctx.captured_queries)
+        self.assertNotIn("OFFSET", sql)
+        self.assertIn('"ID" >', sql)
@@ -0,0 +1,115 @@
+import itertools
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campus_nexus.models import (
+    Association,
+    Cabinet,
+    CabinetMember,
+    Charge,
+    Course,
+    Event,
+    Faculty,
+    Fee,
+    Feedback,
+    Member,
+    Membership,
+    Payment,
+)
+
+LIST_ENDPOINTS = (
+    "faculty-list",
+    "course-list",
+    "association-list",
+    "member-list",
+    "event-list",
+    "cabinet-list",
+    "cabinet-member-list",
+    "payment-list",
+    "membership-list",
+    "fee-list",
+    "feedback-list",
+)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ApiListQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_counter", password="pass12345")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.seq = itertools.count(1)
+
+    def _add_rows(self, n):
+        for _ in range(n):
+            i = next(self.seq)
+            faculty = Faculty.objects.create(name=f"Faculty {i}")
+            Course.objects.create(name=f"Course {i}", faculty=faculty, duration_years=3)
+            association = Association.objects.create(name=f"Association {i}", faculty=faculty)
+            member = Member.objects.create(
+                first_name=f"Count{i}",
+                last_name="Queries",
+                email=f"count{i}@example.com",
+                phone=f"07000008{i:02d}",
+                registration_number=f"223-063012-8{i:02d}",
+                member_type="student",
+            )
+            membership = Membership.objects.create(member=member, association=association)
+            cabinet = Cabinet.objects.create(association=association, year="2026")
+            CabinetMember.objects.create(cabinet=cabinet, member=member, role="Chair")
+            Event.objects.create(
+                association=association,
+                title=f"Event {i}",
+                description="Talk",
+                event_date=timezone.now() + timedelta(days=i),
+                venue="Hall",
+                posted_by=membership,
+            )
+            fee = Fee.objects.create(association=association, fee_type="membership", amount=Decimal("10.00"))
+            charge = Charge.objects.create(
+                association=association,
+                membership=membership,
+                fee=fee,
+                purpose="membership_fee",
+                amount_due=Decimal("10.00"),
+            )
+            Payment.objects.create(charge=charge, membership=membership, amount_paid=Decimal("5.00"))
+            Feedback.objects.create(association=association, member=member, subject="Hi", message="Hello")
+
+    def _query_counts(self):
+        counts = {}
+        for name in LIST_ENDPOINTS:
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(reverse(name))
+            self.assertEqual(response.status_code, 200, name)
+            counts[name] = len(ctx.captured_queries)
+        return counts
+
+    def test_list_endpoints_run_constant_queries(self):
+        self._add_rows(1)
+        small = self._query_counts()
+        self._add_rows(5)
+        large = self._query_counts()
+
+        self.assertEqual(small, large)
+        for name, count in large.items():
+            self.assertLessEqual(count, 2, name)
+
+    def test_cabinet_serializers_render_related_names(self):
+        self._add_rows(3)
+
+        response = self.client.get(reverse("cabinet-member-list"))
+        self.assertEqual(response.data["results"][0]["member_name"], "Count3 Queries")
+        response = self.client.get(reverse("cabinet-list"))
+        self.assertEqual(response.data["results"][0]["association_name"], "Association 3")
@@ -0,0 +1,97 @@
+import io
+import unittest
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Member
+from campus_nexus.renderers import MSGPACK_AVAILABLE, orjson, FastJSONParser, FastJSONRenderer, MessagePackParser, MessagePackRenderer
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_output_matches_drf_json(self):
+        data = {
+            "amount": Decimal("12500.50"),
+            "paid_at": datetime(2026, 3, 1, 8, 30, 15, 123456, tzinfo=dt_timezone.utc),
+            "label": gettext_lazy("Paid"),
+            "note": "line break – ü",
+            7: [1, 2.5, None, True],
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+
+    def test_indented_output_falls_back(self):
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=2"
+        self.assertEqual(FastJSONRenderer().render(data, media_type), JSONRenderer().render(data, media_type))
+
+    def test_parser_round_trips_and_rejects_bad_json(self):
+        body = FastJSONRenderer().render({"items": [{"id": 1, "amount_paid": "10.00"}]})
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), {"items": [{"id": 1, "amount_paid": "10.00"}]})
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"items": ['))
+
+
+@unittest.skipUnless(MSGPACK_AVAILABLE, "msgpack is not installed")
+class MessagePackTests(SimpleTestCase):
+    def test_round_trip_sends_what_json_sends(self):
+        data = {"amount": Decimal("10.00"), "paid_at": datetime(2026, 3, 1, tzinfo=dt_timezone.utc), "ids": [1, 2]}
+        body = MessagePackRenderer().render(data)
+        parsed = MessagePackParser().parse(io.BytesIO(body))
+        self.assertEqual(parsed, FastJSONParser().parse(io.BytesIO(FastJSONRenderer().render(data))))
+        with self.assertRaises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+
+@override_settings(DASHBOARD_CACHE_TTL=0)
+class ApiRendererNegotiationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_renderers", password="pass12345")
+        Member.objects.create(
+            first_name="Render",
+            last_name="Member",
+            email="render@example.com",
+            phone="0700001600",
+            registration_number="223-063012-160",
+            member_type="student",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_json_is_the_default(self):
+        response = self.client.get(reverse("member-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertIn("Accept", response["Vary"])
+        self.assertEqual(response.json()["results"][0]["first_name"], "Render")
+        # DRF's own renderer unless orjson is installed.
+        self.assertIs(type(response.accepted_renderer), FastJSONRenderer if orjson else JSONRenderer)
+
+    @unittest.skipUnless(MSGPACK_AVAILABLE, "msgpack is not installed")
+    def test_msgpack_is_negotiated_and_has_its_own_etag(self):
+        url = reverse("member-list")
+        as_json = self.client.get(url)
+        response = self.client.get(url, HTTP_ACCEPT="application/msgpack")
+
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        self.assertNotEqual(response["ETag"], as_json["ETag"])
+        body = MessagePackParser().parse(io.BytesIO(response.content))
+        self.assertEqual(body["results"][0]["first_name"], "Render")
+
+    def test_benchmark_command_runs(self):
+        out = StringIO()
+        call_command("benchmark_api_renderers", rows=20, repeat=1, stdout=out)
+        self.assertIn("payments (20 rows)", out.getvalue())
+        self.assertIn("json (DRF)", out.getvalue())
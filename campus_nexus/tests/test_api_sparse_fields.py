@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Association, Charge, Member, Membership, Payment
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ApiSparseFieldsetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="api_sparse", password="pass12345")
+        association = Association.objects.create(name="Sparse Association")
+        for i in range(3):
+            member = Member.objects.create(
+                first_name=f"Sparse{i}",
+                last_name="Member",
+                email=f"sparse{i}@example.com",
+                phone=f"07000010{i:02d}",
+                registration_number=f"223-063012-10{i}",
+                member_type="student",
+            )
+            membership = Membership.objects.create(member=member, association=association)
+            charge = Charge.objects.create(
+                association=association,
+                membership=membership,
+                purpose="other",
+                title=f"Dues {i}",
+                amount_due=Decimal("100.00"),
+            )
+            Payment.objects.create(charge=charge, membership=membership, amount_paid=Decimal("40.00"), note="cash at desk")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_fields_restrict_output_and_selected_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("payment-list"), {"fields": "amount_paid,paid_at"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.data["results"][0]), {"amount_paid", "paid_at"})
+        sql = ctx.captured_queries[-1]["sql"]
+        self.assertIn('"amount_paid"', sql)
+        self.assertNotIn('"note"', sql)
+
+    def test_include_embeds_nested_objects_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                reverse("payment-list"),
+                {"fields": "amount_paid,paid_at", "include": "membership.member,charge"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        # The conditional-GET validator aggregate, then one joined SELECT for the page.
+        self.assertEqual(len(ctx.captured_queries), 2)
+        row = response.data["results"][0]
+        self.assertEqual(set(row), {"amount_paid", "paid_at", "membership", "charge"})
+        self.assertEqual(row["membership"]["member"]["full_name"], "Sparse2 Member")
+        self.assertEqual(row["charge"]["title"], "Dues 2")
+
+    def test_include_works_on_detail_view(self):
+        payment = Payment.objects.order_by("id").first()
+        response = self.client.get(reverse("payment-detail", args=[payment.pk]), {"include": "membership"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["membership"]["id"], payment.membership_id)
+        self.assertEqual(response.data["membership"]["member"], payment.membership.member_id)
+
+    def test_unknown_fields_and_includes_are_rejected(self):
+        response = self.client.get(reverse("payment-list"), {"fields": "amount_paid,secret"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.data)
+
+        response = self.client.get(reverse("payment-list"), {"include": "membership.association.faculty.courses"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("include", response.data)
+
+    def test_ordering_column_is_loaded_even_when_not_requested(self):
+        params = {"fields": "note", "ordering": "amount_paid", "page_size": 2}
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("payment-list"), params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(response.data["next"])
+        # The validator aggregate and the page; no per-row query for the deferred cursor column.
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertIn('"amount_paid"', ctx.captured_queries[-1]["sql"])
@@ -0,0 +1,184 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from campus_nexus.models import Association, AssociationAdmin, Charge, Member, Membership, Payment, SyncTombstone
+from campus_nexus.services.sync import SyncCursor
+
+
+@override_settings(
+    EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+    DASHBOARD_CACHE_TTL=0,
+    SYNC_SETTLE_SECONDS=0,
+)
+class ApiSyncTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.association = Association.objects.create(name="Sync Association")
+        cls.other = Association.objects.create(name="Other Sync Association")
+        cls.treasurer = User.objects.create_user(username="sync_treasurer", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=cls.treasurer, association=cls.association)
+
+        cls.charges = []
+        for i, association in enumerate([cls.association, cls.association, cls.other]):
+            member = Member.objects.create(
+                first_name=f"Sync{i}",
+                last_name="Member",
+                email=f"sync{i}@example.com",
+                phone=f"07000012{i:02d}",
+                registration_number=f"223-063012-12{i}",
+                member_type="student",
+            )
+            membership = Membership.objects.create(member=member, association=association)
+            charge = Charge.objects.create(
+                association=association,
+                membership=membership,
+                purpose="other",
+                amount_due=Decimal("100.00"),
+            )
+            Payment.objects.create(charge=charge, membership=membership, amount_paid=Decimal("40.00"))
+            cls.charges.append(charge)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.treasurer)
+
+    def _sync(self, cursor=None, **params):
+        if cursor:
+            params["cursor"] = cursor
+        changes = []
+        while True:
+            response = self.client.get(reverse("sync"), params)
+            self.assertEqual(response.status_code, 200, response.content)
+            changes.extend(response.data["changes"])
+            params["cursor"] = response.data["cursor"]
+            if not response.data["has_more"]:
+                return changes, params["cursor"]
+
+    def test_initial_sync_pages_through_the_callers_association_only(self):
+        changes, _ = self._sync(page_size=3)
+
+        seen = {(c["op"], c["type"], c["id"]) for c in changes}
+        self.assertEqual(len(changes), len(seen))
+        own = Membership.objects.filter(association=self.association)
+        expected = (
+            {("upsert", "member", m.member_id) for m in own}
+            | {("upsert", "membership", m.pk) for m in own}
+            | {("upsert", "charge", c.pk) for c in Charge.objects.filter(association=self.association)}
+            | {("upsert", "payment", p.pk) for p in Payment.objects.filter(membership__association=self.association)}
+        )
+        self.assertEqual(seen, expected)
+        member = next(c for c in changes if c["type"] == "member")
+        self.assertIn("registration_number", member["data"])
+
+    def test_next_sync_returns_only_changes_and_tombstones(self):
+        _, cursor = self._sync()
+
+        unchanged, cursor = self._sync(cursor)
+        self.assertEqual(unchanged, [])
+
+        payment = Payment.objects.filter(charge=self.charges[0]).get()
+        payment.note = "corrected"
+        payment.save(update_fields=["note"])
+        doomed = self.charges[1]
+        doomed_pk = doomed.pk
+        doomed_payment_ids = list(doomed.payments.values_list("pk", flat=True))
+        doomed.delete()
+        Payment.objects.filter(charge=self.charges[2]).update(note="other association")
+
+        changes, _ = self._sync(cursor)
+
+        ops = [(c["op"], c["type"], c["id"]) for c in changes]
+        self.assertIn(("upsert", "payment", payment.pk), ops)
+        self.assertIn(("delete", "charge", doomed_pk), ops)
+        for pk in doomed_payment_ids:
+            self.assertIn(("delete", "payment", pk), ops)
+        upserted = next(c for c in changes if c["type"] == "payment" and c["op"] == "upsert")
+        self.assertEqual(upserted["data"]["note"], "corrected")
+        payment_ids = {c["id"] for c in changes if c["type"] == "payment"}
+        self.assertEqual(payment_ids, {payment.pk, *doomed_payment_ids})
+
+    def test_removed_membership_tombstones_member_and_membership(self):
+        _, cursor = self._sync()
+        membership = Membership.objects.filter(association=self.association).first()
+        membership_pk, member_pk = membership.pk, membership.member_id
+
+        membership.delete()
+
+        changes, _ = self._sync(cursor)
+        ops = {(c["op"], c["type"], c["id"]) for c in changes}
+        self.assertIn(("delete", "membership", membership_pk), ops)
+        self.assertIn(("delete", "member", member_pk), ops)
+
+    def test_cascaded_payment_tombstones_are_written_in_one_insert(self):
+        def delete_with_payments(obj, charge, membership, extra):
+            for _ in range(extra):
+                Payment.objects.create(charge=charge, membership=membership, amount_paid=Decimal("1.00"))
+            payment_ids = set(obj.payments.values_list("pk", flat=True))
+            with CaptureQueriesContext(connection) as ctx:
+                obj.delete()
+            tombstoned = SyncTombstone.objects.filter(kind="payment", association=self.association)
+            self.assertTrue(payment_ids <= set(tombstoned.values_list("object_id", flat=True)))
+            return sum('INSERT INTO "campus_nexus_synctombstone"' in q["sql"] for q in ctx.captured_queries)
+
+        charge = self.charges[1]
+        self.assertEqual(delete_with_payments(charge, charge, charge.membership, 3), 2)  # charge, payments
+        membership = self.charges[0].membership
+        # its charge, then the membership, member and all five payments
+        self.assertEqual(delete_with_payments(membership, None, membership, 4), 4)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_purge_removes_tombstones_past_retention(self):
+        self.charges[1].delete()
+        old = SyncTombstone.objects.filter(kind="charge").get()
+        SyncTombstone.objects.filter(pk=old.pk).update(deleted_at=timezone.now() - timedelta(days=31))
+        kept = SyncTombstone.objects.exclude(pk=old.pk).count()
+
+        out = StringIO()
+        call_command("purge_sync_tombstones", batch_size=1, stdout=out)
+
+        self.assertIn("Purged 1 sync tombstone(s).", out.getvalue())
+        self.assertFalse(SyncTombstone.objects.filter(pk=old.pk).exists())
+        self.assertEqual(SyncTombstone.objects.count(), kept)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION_DAYS=30)
+    def test_cursor_past_retention_requires_a_full_resync(self):
+        _, cursor = self._sync()
+        decoded = SyncCursor.decode(cursor)
+        self.assertIsNotNone(decoded.seen_until)  # a quiet feed keeps the cursor fresh
+
+        long_ago = timezone.now() - timedelta(days=31)
+        stale = SyncCursor(since=long_ago, ts=long_ago, rank=decoded.rank, object_id=decoded.object_id)
+        response = self.client.get(reverse("sync"), {"cursor": stale.encode()})
+        self.assertEqual(response.status_code, 410)
+        self.assertTrue(response.data["resync_required"])
+
+        response = self.client.get(reverse("sync"), {"cursor": cursor})
+        self.assertEqual(response.status_code, 200)
+
+    def test_bad_cursor_and_unscoped_user_are_rejected(self):
+        response = self.client.get(reverse("sync"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("cursor", response.data)
+
+        outsider = get_user_model().objects.create_user(username="sync_outsider", password="pass12345")
+        self.client.force_authenticate(outsider)
+        self.assertEqual(self.client.get(reverse("sync")).status_code, 403)
+
+    def test_superuser_picks_the_association(self):
+        admin = get_user_model().objects.create_superuser(username="sync_root", password="pass12345")
+        self.client.force_authenticate(admin)
+        self.assertEqual(self.client.get(reverse("sync")).status_code, 400)
+
+        changes, _ = self._sync(association=self.other.pk)
+        self.assertIn(("upsert", "charge", self.charges[2].pk), {(c["op"], c["type"], c["id"]) for c in changes})
@@ -0,0 +1,113 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from campus_nexus.models import (
+    Association,
+    AssociationAdmin,
+    Bill,
+    BillableItem,
+    BillMembership,
+    Charge,
+    Member,
+    Membership,
+    Payment,
+)
+from campus_nexus.services.billing import (
+    annotate_bill_totals,
+    outstanding_bill_memberships,
+    parse_outstanding_cursor,
+)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class BillingDashboardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Billing Association")
+        item = BillableItem.objects.create(association=cls.association, name="Gala Ticket", amount=Decimal("100.00"))
+        cls.bill = Bill.objects.create(
+            association=cls.association, billable_item=item, amount=Decimal("100.00"), status="active"
+        )
+        cls.bill_memberships = []
+        cls.charges = []
+        for i in range(3):
+            member = Member.objects.create(
+                first_name=f"Bill{i}",
+                last_name="Member",
+                email=f"bill{i}@example.com",
+                phone=f"07000008{i:02d}",
+                registration_number=f"223-063012-8{i:02d}",
+                member_type="student",
+            )
+            membership = Membership.objects.create(member=member, association=cls.association)
+            bm = BillMembership.objects.create(bill=cls.bill, membership=membership, amount_due=Decimal("100.00"))
+            charge = Charge.objects.create(
+                association=cls.association,
+                membership=membership,
+                bill_membership=bm,
+                purpose="other",
+                title="Gala Ticket",
+                amount_due=Decimal("100.00"),
+            )
+            cls.bill_memberships.append(bm)
+            cls.charges.append(charge)
+
+        cls._pay(0, "50.00")
+        cls._pay(0, "50.00")
+        cls._pay(1, "30.00")
+
+        cls.user = get_user_model().objects.create_user(username="billing_admin", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=cls.user, association=cls.association)
+
+    @classmethod
+    def _pay(cls, index, amount):
+        charge = cls.charges[index]
+        Payment.objects.create(charge=charge, membership=charge.membership, amount_paid=Decimal(amount))
+
+    def test_bill_totals_are_not_inflated_by_payment_rows(self):
+        bill = annotate_bill_totals(Bill.objects.filter(pk=self.bill.pk)).get()
+        self.assertEqual(bill.members_count, 3)
+        self.assertEqual(bill.total_due, Decimal("300.00"))
+        self.assertEqual(bill.total_collected, Decimal("130.00"))
+        self.assertEqual(bill.total_waived, Decimal("0.00"))
+
+    def test_outstanding_members_are_keyset_paginated(self):
+        first, cursor = outstanding_bill_memberships(self.association.id, limit=1)
+        self.assertEqual([bm.pk for bm in first], [self.bill_memberships[2].pk])
+        self.assertEqual(first[0].outstanding, Decimal("100.00"))
+
+        second, cursor = outstanding_bill_memberships(
+            self.association.id, after=parse_outstanding_cursor(cursor), limit=1
+        )
+        self.assertEqual([bm.pk for bm in second], [self.bill_memberships[1].pk])
+        self.assertEqual(second[0].outstanding, Decimal("70.00"))
+        self.assertIsNone(cursor)
+
+    def test_cost_stays_flat_as_payment_history_grows(self):
+        def measure():
+            with CaptureQueriesContext(connection) as ctx:
+                list(annotate_bill_totals(Bill.objects.filter(association=self.association)))
+                outstanding_bill_memberships(self.association.id)
+            return [q["sql"] for q in ctx.captured_queries]
+
+        before = measure()
+        for _ in range(25):
+            self._pay(2, "1.00")
+        after = measure()
+
+        self.assertEqual(len(before), len(after))
+        self.assertFalse(any("campus_nexus_payment" in sql for sql in after))
+
+    def test_dashboard_view_renders_subquery_totals(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("billing_dashboard"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["total_billed"], Decimal("300.00"))
+        self.assertEqual(response.context["total_collected"], Decimal("130.00"))
+        self.assertEqual(len(response.context["outstanding_members"]), 2)
+        self.assertIsNone(response.context["outstanding_next_cursor"])
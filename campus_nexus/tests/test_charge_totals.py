@@ -0,0 +1,91 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from campus_nexus.models import Association, Charge, Faculty, Member, Membership, Payment
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class ChargeTotalsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = Faculty.objects.create(name="Faculty of Science")
+        cls.association = Association.objects.create(name="Totals Association", faculty=cls.faculty)
+        cls.member = Member.objects.create(
+            first_name="Totals",
+            last_name="Member",
+            email="totals.member@example.com",
+            phone="0700000301",
+            registration_number="223-063012-301",
+            member_type="student",
+            faculty=cls.faculty,
+        )
+        cls.membership = Membership.objects.create(member=cls.member, association=cls.association)
+
+    def _charge(self, amount="100.00"):
+        return Charge.objects.create(
+            association=self.association,
+            membership=self.membership,
+            purpose="other",
+            title="Hoodie",
+            amount_due=Decimal(amount),
+        )
+
+    def test_new_charge_balance_equals_amount_due(self):
+        charge = self._charge()
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("0.00"))
+        self.assertEqual(charge.balance, Decimal("100.00"))
+
+    def test_recorded_payments_update_stored_totals(self):
+        charge = self._charge()
+        Payment.objects.create(charge=charge, membership=self.membership, amount_paid=Decimal("30.00"))
+
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("30.00"))
+        self.assertEqual(charge.balance, Decimal("70.00"))
+        self.assertEqual(charge.status, "partial")
+
+        Payment.objects.create(charge=charge, membership=self.membership, amount_paid=Decimal("70.00"))
+        charge.refresh_from_db()
+        self.assertEqual(charge.balance, Decimal("0.00"))
+        self.assertEqual(charge.status, "paid")
+
+    def test_reversed_and_deleted_payments_are_excluded(self):
+        charge = self._charge()
+        payment = Payment.objects.create(charge=charge, membership=self.membership, amount_paid=Decimal("40.00"))
+        Payment.objects.create(
+            charge=charge,
+            membership=self.membership,
+            amount_paid=Decimal("25.00"),
+            status="reversed",
+        )
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("40.00"))
+
+        payment.delete()
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("0.00"))
+        self.assertEqual(charge.balance, Decimal("100.00"))
+        self.assertEqual(charge.status, "unpaid")
+
+    def test_rebuild_command_repairs_drifted_totals(self):
+        charge = self._charge()
+        Payment.objects.create(charge=charge, membership=self.membership, amount_paid=Decimal("60.00"))
+        Charge.objects.filter(pk=charge.pk).update(amount_paid=0, balance=0, status="paid")
+
+        stdout = StringIO()
+        with CaptureQueriesContext(connection) as ctx:
+            call_command("rebuild_charge_totals", association=self.association.id, stdout=stdout)
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 3)
+
+        charge.refresh_from_db()
+        self.assertEqual(charge.amount_paid, Decimal("60.00"))
+        self.assertEqual(charge.balance, Decimal("40.00"))
+        self.assertEqual(charge.status, "partial")
+        self.assertIn("1 charge(s)", stdout.getvalue())
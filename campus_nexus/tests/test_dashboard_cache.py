@@ -0,0 +1,64 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+
+from campus_nexus.models import Association, AssociationAdmin, Expense
+from campus_nexus.templatetags.dashboard_tags import association_dashboard_data, superuser_dashboard_data
+
+LOCMEM_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "dashboard-tests"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHE, DASHBOARD_CACHE_TTL=300, DASHBOARD_CACHE_STALE_SECONDS=600)
+class DashboardSnapshotTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Snapshot Association")
+        cls.user = get_user_model().objects.create_user(username="snap_admin", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=cls.user, association=cls.association)
+
+    def setUp(self):
+        cache.clear()
+
+    def _context(self, path="/admin/"):
+        request = RequestFactory().get(path)
+        request.user = self.user
+        return {"request": request}
+
+    def _spend(self, amount):
+        with self.captureOnCommitCallbacks(execute=True):
+            Expense.objects.create(association=self.association, title="Snacks", amount=Decimal(amount))
+
+    def test_second_render_is_served_from_cache(self):
+        association_dashboard_data(self._context())
+        with self.assertNumQueries(0):
+            data = association_dashboard_data(self._context())
+        self.assertEqual(data["association_name"], "Snapshot Association")
+
+    def test_expense_save_invalidates_association_snapshot(self):
+        self.assertEqual(association_dashboard_data(self._context())["finance"]["total_expenses"], Decimal("0.00"))
+        self._spend("12.00")
+        self.assertEqual(association_dashboard_data(self._context())["finance"]["total_expenses"], Decimal("12.00"))
+
+    def test_stale_snapshot_is_served_while_another_request_rebuilds(self):
+        superuser_dashboard_data(self._context())
+        self._spend("5.00")
+
+        with mock.patch("campus_nexus.services.dashboard_cache.cache.add", return_value=False):
+            with self.assertNumQueries(0):
+                stale = superuser_dashboard_data(self._context())
+        self.assertEqual(stale["total_expenses"], Decimal("0.00"))
+
+        fresh = superuser_dashboard_data(self._context())
+        self.assertEqual(fresh["total_expenses"], Decimal("5.00"))
+
+    def test_refresh_flag_forces_live_recompute(self):
+        superuser_dashboard_data(self._context())
+        Expense.objects.create(association=self.association, title="Uncommitted", amount=Decimal("7.00"))
+
+        self.assertEqual(superuser_dashboard_data(self._context())["total_expenses"], Decimal("0.00"))
+        live = superuser_dashboard_data(self._context("/admin/?refresh_dashboard=1"))
+        self.assertEqual(live["total_expenses"], Decimal("7.00"))
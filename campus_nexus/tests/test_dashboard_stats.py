@@ -0,0 +1,116 @@
+import re
+from collections import Counter
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from campus_nexus.models import (
+    Announcement,
+    Association,
+    AssociationAdmin,
+    Charge,
+    Event,
+    Expense,
+    Faculty,
+    Member,
+    Membership,
+    Payment,
+)
+from campus_nexus.services import stats
+from campus_nexus.templatetags.dashboard_tags import (
+    association_dashboard_data,
+    dean_dashboard_data,
+    guild_dashboard_data,
+    superuser_dashboard_data,
+)
+
+FROM_TABLE = re.compile(r'\bFROM [`"](\w+)[`"]')
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        faculty = Faculty.objects.create(name="Faculty of Stats")
+        cls.association = Association.objects.create(name="Stats Club", faculty=faculty)
+        cls.other = Association.objects.create(name="Open Club")
+        statuses = ["active", "active", "inactive", "suspended"]
+        for i, status in enumerate(statuses):
+            member = Member.objects.create(
+                first_name=f"Stat{i}",
+                last_name="Member",
+                email=f"stat{i}@example.com",
+                phone=f"07000007{i:02d}",
+                registration_number=f"223-063012-7{i:02d}",
+                member_type="alumni" if i == 3 else "student",
+            )
+            membership = Membership.objects.create(member=member, association=cls.association, status=status)
+        Membership.objects.create(member=member, association=cls.other, status="active")
+
+        charge = Charge.objects.create(
+            association=cls.association,
+            membership=membership,
+            purpose="other",
+            title="Hoodie",
+            amount_due=Decimal("100.00"),
+            is_overdue=True,
+        )
+        Payment.objects.create(charge=charge, membership=membership, amount_paid=Decimal("30.00"))
+        Expense.objects.create(association=cls.association, title="Chairs", amount=Decimal("12.00"))
+        Event.objects.create(
+            association=cls.association,
+            title="Hackathon",
+            description="Build things",
+            event_date=timezone.now(),
+            venue="Hall",
+        )
+
+        cls.user = get_user_model().objects.create_user(username="stats_admin", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=cls.user, association=cls.association)
+        Announcement.objects.create(title="Welcome", message="Hi", audience="all", is_published=True, posted_by=cls.user)
+        Announcement.objects.create(title="Draft", message="Soon", audience="all", is_published=False, posted_by=cls.user)
+
+    def _context(self):
+        request = RequestFactory().get("/admin/")
+        request.user = self.user
+        return {"request": request}
+
+    def assertOneQueryPerTable(self, tag):
+        with CaptureQueriesContext(connection) as ctx:
+            data = tag(self._context())
+        tables = Counter(
+            match.group(1)
+            for query in ctx.captured_queries
+            if (match := FROM_TABLE.search(query["sql"]))
+        )
+        self.assertTrue(tables)
+        repeated = {table: n for table, n in tables.items() if n > 1}
+        self.assertEqual(repeated, {}, f"{tag.__name__} queried tables more than once")
+        return data
+
+    def test_each_dashboard_reads_each_table_once(self):
+        dean = self.assertOneQueryPerTable(dean_dashboard_data)
+        guild = self.assertOneQueryPerTable(guild_dashboard_data)
+        assoc = self.assertOneQueryPerTable(association_dashboard_data)
+        su = self.assertOneQueryPerTable(superuser_dashboard_data)
+
+        self.assertEqual(dean["membership_status"], {"active": 3, "inactive": 1, "suspended": 1})
+        self.assertEqual(dean["faculty_based_associations"], 1)
+        self.assertEqual(dean["announcements"]["published_count"], 1)
+        self.assertEqual((guild["announcements"]["drafts"], guild["announcements"]["published"]), (1, 1))
+        self.assertEqual(assoc["finance"]["outstanding_balance"], Decimal("70.00"))
+        self.assertEqual(assoc["finance"]["overdue_charges_count"], 1)
+        self.assertEqual(su["total_collected"], Decimal("30.00"))
+        self.assertEqual(su["active_memberships"], 3)
+
+    def test_membership_stats_fold_statuses_and_associations(self):
+        result = stats.membership_stats()
+        self.assertEqual(result.total, 5)
+        self.assertEqual((result.active, result.inactive, result.suspended), (3, 1, 1))
+        top = result.top_associations(1, active_only=True)
+        self.assertEqual((top[0].name, top[0].active, top[0].total), ("Stats Club", 2, 4))
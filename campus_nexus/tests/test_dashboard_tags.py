@@ -1,7 +1,7 @@
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.test.client import RequestFactory
 from django.utils import timezone
 
@@ -9,6 +9,7 @@ from campus_nexus.models import Association, AssociationAdmin, Charge, Expense,
 from campus_nexus.templatetags.dashboard_tags import association_dashboard_data
 
 
+@override_settings(DASHBOARD_CACHE_TTL=0)
 class AssociationDashboardDataTests(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -0,0 +1,172 @@
+import socketserver
+import threading
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from campus_nexus.models import Association, EmailOutbox, Member, Membership
+from campus_nexus.services.outbox import deliver_pending, enqueue_email
+
+
+class _DebugSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for Django's backend: one line per reply, messages kept in memory."""
+
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self._reply("220 localhost debug SMTP")
+        rcpt = []
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            verb = line.split(" ", 1)[0].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 localhost")
+            elif verb == "MAIL":
+                rcpt = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                rcpt.append(line.split(":", 1)[1].strip("<> "))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b".\r\n", b""):
+                        break
+                    data.append(chunk.decode())
+                if any(r in server.reject for r in rcpt):
+                    self._reply("550 Mailbox unavailable")
+                else:
+                    server.messages.append((rcpt, "".join(data)))
+                    self._reply("250 Queued")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+class _DebugSMTPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _DebugSMTPHandler)
+        self.connections = 0
+        self.messages = []
+        self.reject = set()
+
+
+class EmailOutboxTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.smtp = _DebugSMTPServer()
+        threading.Thread(target=cls.smtp.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.smtp.shutdown()
+        cls.smtp.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.smtp.connections = 0
+        self.smtp.messages = []
+        self.smtp.reject = set()
+        settings = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=self.smtp.server_address[1],
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+        )
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_enqueue_ignores_duplicate_dedup_key(self):
+        self.assertTrue(enqueue_email(to="a@example.com", subject="Hi", body="x", dedup_key="k:1"))
+        self.assertFalse(enqueue_email(to="a@example.com", subject="Hi", body="x", dedup_key="k:1"))
+        self.assertFalse(enqueue_email(to="", subject="Hi", body="x"))
+        self.assertEqual(EmailOutbox.objects.count(), 1)
+
+    def test_membership_signal_only_enqueues(self):
+        association = Association.objects.create(name="Outbox Association")
+        member = Member.objects.create(
+            first_name="Out",
+            last_name="Box",
+            email="out.box@example.com",
+            phone="0700000951",
+            registration_number="223-063012-951",
+            member_type="student",
+        )
+        Membership.objects.create(member=member, association=association)
+
+        self.assertEqual(self.smtp.connections, 0)
+        entry = EmailOutbox.objects.get()
+        self.assertEqual(entry.to_email, "out.box@example.com")
+        self.assertEqual(entry.status, "pending")
+
+    def test_worker_sends_batch_over_one_connection(self):
+        for i in range(3):
+            enqueue_email(to=f"user{i}@example.com", subject=f"Hello {i}", body="Body")
+
+        result = deliver_pending()
+
+        self.assertEqual(result.sent, 3)
+        self.assertEqual(self.smtp.connections, 1)
+        self.assertEqual(len(self.smtp.messages), 3)
+        self.assertEqual(EmailOutbox.objects.filter(status="sent", sent_at__isnull=False).count(), 3)
+
+    def test_failed_delivery_backs_off_then_gives_up(self):
+        self.smtp.reject = {"bounce@example.com"}
+        enqueue_email(to="bounce@example.com", subject="Nope", body="Body")
+        enqueue_email(to="ok@example.com", subject="Yes", body="Body")
+
+        result = deliver_pending(max_attempts=2)
+        self.assertEqual((result.sent, result.retried, result.failed), (1, 1, 0))
+
+        entry = EmailOutbox.objects.get(to_email="bounce@example.com")
+        self.assertEqual(entry.status, "pending")
+        self.assertEqual(entry.attempts, 1)
+        self.assertGreater(entry.next_attempt_at, timezone.now())
+        self.assertIn("550", entry.last_error)
+
+        # Not due yet: nothing is claimed until the backoff expires.
+        self.assertEqual(deliver_pending().claimed, 0)
+
+        EmailOutbox.objects.filter(pk=entry.pk).update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        result = deliver_pending(max_attempts=2)
+        self.assertEqual(result.failed, 1)
+        entry.refresh_from_db()
+        self.assertEqual(entry.status, "failed")
+
+    def test_unreachable_server_keeps_emails_queued(self):
+        enqueue_email(to="later@example.com", subject="Later", body="Body")
+        with override_settings(EMAIL_PORT=1):
+            result = deliver_pending()
+
+        self.assertEqual(result.retried, 1)
+        self.assertEqual(EmailOutbox.objects.get().status, "pending")
+
+    def test_run_email_worker_command_drains_queue(self):
+        enqueue_email(to="cmd@example.com", subject="Command", body="Body")
+        stdout = StringIO()
+
+        call_command("run_email_worker", stdout=stdout)
+
+        self.assertIn("Sent: 1", stdout.getvalue())
+        self.assertEqual(len(self.smtp.messages), 1)
+        self.assertEqual(len(mail.outbox), 0)
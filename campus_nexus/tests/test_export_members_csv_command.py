@@ -0,0 +1,164 @@
+import csv
+import gzip
+import os
+import tempfile
+from datetime import datetime, timedelta
+from io import StringIO
+
+from django.contrib.admin import site
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from campus_nexus.models import Association, AssociationAdmin, Course, Faculty, Member, Membership
+from campus_nexus.services.member_export import EXPORT_COLUMNS, export_member_rows
+
+MEMBER_VALUES = (
+    "first_name", "last_name", "email", "phone", "registration_number", "national_id_number",
+    "member_type", "faculty__name", "course__name", "nationality",
+)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ExportMembersCsvCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = Faculty.objects.create(name="Faculty of Science")
+        cls.course = Course.objects.create(name="BSc Computer Science", faculty=cls.faculty, duration_years=3)
+        cls.chess = Association.objects.create(name="Chess Club")
+        cls.drama = Association.objects.create(name="Drama Club")
+        cls.members = [
+            Member.objects.create(
+                first_name=f"Export{i}",
+                last_name="Student, Jr." if i == 0 else "Student",
+                email=f"export{i}@example.com",
+                phone=f"+2567000018{i:02d}",
+                registration_number=f"223-063012-18{i}",
+                national_id_number=f"CM1800000{i}AA" if i else None,
+                member_type="student",
+                faculty=cls.faculty if i < 2 else None,
+                course=cls.course if i == 0 else None,
+                nationality="Uganda" if i == 0 else "",
+            )
+            for i in range(3)
+        ]
+        Membership.objects.create(member=cls.members[0], association=cls.drama)
+        Membership.objects.create(member=cls.members[0], association=cls.chess)
+        Membership.objects.create(member=cls.members[2], association=cls.chess)
+
+    def _output_path(self, suffix=".csv"):
+        handle = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+        handle.close()
+        self.addCleanup(lambda: os.path.exists(handle.name) and os.remove(handle.name))
+        return handle.name
+
+    def _export(self, path, **options):
+        out = StringIO()
+        call_command("export_members_csv", path, stdout=out, **options)
+        return out.getvalue()
+
+    def test_export_lists_members_with_relations_and_associations(self):
+        path = self._output_path()
+        output = self._export(path)
+
+        self.assertIn("Exported 3 member(s)", output)
+        with open(path, encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual(tuple(rows[0]), EXPORT_COLUMNS)
+        self.assertEqual(rows[0]["last_name"], "Student, Jr.")
+        self.assertEqual(rows[0]["course"], "BSc Computer Science")
+        self.assertEqual([r["associations"] for r in rows], ["Chess Club; Drama Club", "", "Chess Club"])
+        self.assertEqual(rows[2]["faculty"], "")
+
+    def test_gzip_export_round_trips_through_the_importer(self):
+        expected = list(Member.objects.order_by("email").values_list(*MEMBER_VALUES))
+        path = self._output_path(".csv.gz")
+        self._export(path)
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            self.assertEqual(handle.readline().strip(), ",".join(EXPORT_COLUMNS))
+
+        Member.objects.all().delete()
+        out = StringIO()
+        call_command("import_members_csv", path, batch_size=2, stdout=out)
+
+        self.assertIn("Created: 3", out.getvalue())
+        self.assertEqual(list(Member.objects.order_by("email").values_list(*MEMBER_VALUES)), expected)
+
+    def test_since_exports_members_changed_directly_or_through_memberships(self):
+        watermark = timezone.now()
+        Member.objects.update(updated_at=watermark - timedelta(days=1))
+        Membership.objects.update(updated_at=watermark - timedelta(days=1))
+        member = self.members[1]
+        member.phone = "+256700001899"
+        member.save()
+        Membership.objects.filter(member=self.members[2]).update(status="inactive", updated_at=watermark)
+
+        path = self._output_path()
+        output = self._export(path, since=watermark.isoformat())
+
+        self.assertIn("Exported 2 member(s)", output)
+        self.assertIn("Watermark (use as --since next time):", output)
+        with open(path, encoding="utf-8", newline="") as handle:
+            emails = [row["email"] for row in csv.DictReader(handle)]
+        self.assertEqual(emails, ["export1@example.com", "export2@example.com"])
+
+    def test_since_exports_members_who_left_an_association(self):
+        watermark = timezone.now()
+        Member.objects.update(updated_at=watermark - timedelta(days=1))
+        Membership.objects.update(updated_at=watermark - timedelta(days=1))
+        Membership.objects.get(member=self.members[0], association=self.drama).delete()
+
+        path = self._output_path()
+        self._export(path, since=watermark.isoformat())
+
+        with open(path, encoding="utf-8", newline="") as handle:
+            rows = list(csv.DictReader(handle))
+        self.assertEqual([(r["email"], r["associations"]) for r in rows], [("export0@example.com", "Chess Club")])
+
+    @override_settings(SYNC_SETTLE_SECONDS=30)
+    def test_watermark_leaves_room_for_late_commits(self):
+        before = timezone.now()
+        output = self._export(self._output_path())
+        after = timezone.now()
+
+        printed = output.split("Watermark (use as --since next time): ")[1].strip()
+        watermark = datetime.fromisoformat(printed)
+        self.assertLessEqual(before - timedelta(seconds=30), watermark)
+        self.assertLessEqual(watermark, after - timedelta(seconds=30))
+
+    def test_query_count_does_not_grow_with_members(self):
+        with CaptureQueriesContext(connection) as ctx:
+            rows = list(export_member_rows(chunk_size=1))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(len(ctx.captured_queries), 2)
+
+    def test_admin_action_streams_the_selected_members(self):
+        user = get_user_model().objects.create_superuser(
+            username="export_admin", email="export_admin@example.com", password="pass12345"
+        )
+        self.client.force_login(user)
+        response = self.client.post(
+            reverse("admin:campus_nexus_member_changelist"),
+            {"action": "export_selected_to_csv", "_selected_action": [self.members[0].pk, self.members[2].pk]},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        rows = list(csv.reader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual([row[2] for row in rows[1:]], ["export0@example.com", "export2@example.com"])
+
+    def test_admin_action_only_names_associations_the_user_can_see(self):
+        user = get_user_model().objects.create_user(username="chess_admin", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=user, association=self.chess)
+        request = RequestFactory().post("/")
+        request.user = user
+
+        member_admin = site._registry[Member]
+        response = member_admin.export_selected_to_csv(request, Member.objects.filter(pk=self.members[0].pk))
+
+        rows = list(csv.DictReader(b"".join(response.streaming_content).decode().splitlines()))
+        self.assertEqual([row["associations"] for row in rows], ["Chess Club"])
@@ -1,11 +1,16 @@
 import os
 import tempfile
+from io import StringIO
+from unittest import mock
 
 from django.contrib.auth import get_user_model
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, OperationalError, connection, transaction
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
-from campus_nexus.models import Course, Faculty, Member
+from campus_nexus.management.commands.import_members_csv import Command as ImportCommand
+from campus_nexus.models import Course, Faculty, Member, MemberImportRun
 
 
 class ImportMembersCsvCommandTests(TestCase):
@@ -54,3 +59,151 @@ class ImportMembersCsvCommandTests(TestCase):
         call_command("import_members_csv", csv_path, dry_run=True)
         self.assertFalse(Member.objects.filter(email="john@example.com").exists())
 
+
+    def _import(self, csv_path, **options):
+        out = StringIO()
+        with transaction.atomic():
+            call_command("import_members_csv", csv_path, stdout=out, **options)
+            members = list(
+                Member.objects.order_by("email").values(
+                    "first_name", "email", "phone", "registration_number", "national_id_number", "faculty", "course"
+                )
+            )
+            transaction.set_rollback(True)
+        return out.getvalue(), members
+
+    def test_batched_import_matches_row_by_row(self):
+        faculty = Faculty.objects.create(name="Faculty of Science")
+        Course.objects.create(name="BSc Computer Science", faculty=faculty, duration_years=3)
+        Member.objects.create(
+            first_name="Old",
+            last_name="Name",
+            email="existing@example.com",
+            phone="0700000300",
+            registration_number="223-063012-950",
+            member_type="student",
+        )
+        Member.objects.create(
+            first_name="Keeps",
+            last_name="Email",
+            email="taken@example.com",
+            phone="0700000301",
+            registration_number="223-063012-951",
+            member_type="student",
+        )
+        csv_path = self._write_csv(
+            "first_name,last_name,email,phone,registration_number,national_id_number,member_type,faculty,course,nationality\n"
+            "New,One,new1@example.com,0700000310,223-063012-960,,student,faculty of science,bsc computer science,Uganda\n"
+            "Updated,Name,Changed@example.com,0700000311,223-063012-950,,student,,,\n"
+            "Clash,Email,taken@example.com,0700000312,223-063012-961,,student,,,\n"
+            "Bad,Type,bad@example.com,0700000313,223-063012-962,,staff,,,\n"
+            "No,Faculty,nofac@example.com,0700000314,223-063012-963,,student,Faculty of Law,,\n"
+            "New,Again,new1b@example.com,0700000315,223-063012-960,,student,,,\n"
+            "Dup,Email,new1b@example.com,0700000316,223-063012-964,,student,,,\n"
+            "Bad,Phone,phone@example.com,12,223-063012-965,,student,,,\n"
+            "Email,Only,emailonly@example.com,0700000317,,CM33333333CC,external,,,\n"
+            "Email,Again,emailonly@example.com,0700000318,,CM33333333CC,external,,,\n"
+            "Takes,Old,existing@example.com,0700000319,223-063012-966,,student,,,\n"
+        )
+
+        expected_output, expected_members = self._import(csv_path)
+        self.assertIn("Created: 3", expected_output)
+        self.assertIn("Updated: 3", expected_output)
+        self.assertIn("Skipped: 5", expected_output)
+        for options in ({"batch_size": 1}, {"batch_size": 3}, {"batch_size": 100}, {"workers": 2, "chunk_size": 2}):
+            with self.subTest(**options):
+                output, members = self._import(csv_path, **options)
+                self.assertEqual(output, expected_output)
+                self.assertEqual(members, expected_members)
+
+    def test_batched_import_uses_a_fixed_number_of_queries_per_chunk(self):
+        faculty = Faculty.objects.create(name="Faculty of Science")
+        Course.objects.create(name="BSc Computer Science", faculty=faculty, duration_years=3)
+        header = "first_name,last_name,email,phone,registration_number,member_type,faculty,course\n"
+
+        counts = []
+        for start, size in [(0, 10), (100, 60)]:
+            rows = "".join(
+                f"Student,{i},student{i}@example.com,0700{i:06d},223-063012-{i:03d},student,"
+                "Faculty of Science,BSc Computer Science\n"
+                for i in range(start, start + size)
+            )
+            csv_path = self._write_csv(header + rows)
+            with CaptureQueriesContext(connection) as ctx:
+                call_command("import_members_csv", csv_path, batch_size=100, stdout=StringIO())
+            counts.append(len(ctx.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(Member.objects.filter(course__name="BSc Computer Science").count(), 70)
+
+    def _student_rows(self, count):
+        header = "first_name,last_name,email,phone,registration_number,member_type\n"
+        rows = "".join(f"Student,{i},chunk{i}@example.com,0711{i:06d},224-063012-{i:03d},student\n" for i in range(count))
+        return self._write_csv("\ufeff" + header + rows)
+
+    def test_an_integrity_error_only_skips_its_own_row(self):
+        csv_path = self._student_rows(4)
+        original_save = Member.save
+
+        def save(member, *args, **kwargs):
+            if member.email == "chunk1@example.com":
+                raise IntegrityError("simulated constraint failure")
+            return original_save(member, *args, **kwargs)
+
+        out = StringIO()
+        with mock.patch.object(Member, "save", save):
+            call_command("import_members_csv", csv_path, chunk_size=10, stdout=out)
+
+        self.assertIn("Line 3: simulated constraint failure", out.getvalue())
+        self.assertEqual(Member.objects.filter(email__startswith="chunk").count(), 3)
+
+    def test_batched_chunk_falls_back_to_rows_after_an_integrity_error(self):
+        csv_path = self._student_rows(4)
+        original_bulk_create = Member.objects.bulk_create
+        calls = []
+
+        def bulk_create(objs, *args, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 1:
+                raise IntegrityError("simulated race")
+            return original_bulk_create(objs, *args, **kwargs)
+
+        with mock.patch.object(Member.objects, "bulk_create", bulk_create):
+            call_command("import_members_csv", csv_path, batch_size=10, stdout=StringIO())
+
+        self.assertEqual(calls, [4])
+        self.assertEqual(Member.objects.filter(email__startswith="chunk").count(), 4)
+
+    def test_failed_import_resumes_from_its_checkpoint(self):
+        csv_path = self._student_rows(7)
+        original_import_chunk = ImportCommand._import_chunk
+        chunks = []
+
+        def crash_on_second_chunk(command, chunk, *args, **kwargs):
+            chunks.append([line for line, _ in chunk])
+            if len(chunks) == 2:
+                raise OperationalError("disk I/O error")
+            return original_import_chunk(command, chunk, *args, **kwargs)
+
+        with mock.patch.object(ImportCommand, "_import_chunk", crash_on_second_chunk):
+            with self.assertRaises(OperationalError):
+                call_command("import_members_csv", csv_path, chunk_size=3, stdout=StringIO(), stderr=StringIO())
+
+        run = MemberImportRun.objects.get()
+        self.assertEqual((run.status, run.last_line, run.created_count), ("failed", 4, 3))
+        self.assertEqual(Member.objects.filter(email__startswith="chunk").count(), 3)
+
+        chunks.clear()
+        out = StringIO()
+        with mock.patch.object(ImportCommand, "_import_chunk", crash_on_second_chunk):
+            call_command("import_members_csv", csv_path, chunk_size=4, resume=True, stdout=out)
+
+        self.assertEqual(chunks, [[5, 6, 7, 8]])
+        self.assertIn("Resuming from line 5.", out.getvalue())
+        self.assertIn("Created: 7", out.getvalue())
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.last_line, run.created_count), ("completed", 8, 7))
+        self.assertEqual(Member.objects.filter(email__startswith="chunk").count(), 7)
+
+        with self.assertRaises(CommandError):
+            call_command("import_members_csv", csv_path, resume=True, stdout=StringIO())
@@ -0,0 +1,127 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from campus_nexus.models import Association, EmailOutbox, Faculty, Member, Membership
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class ImportMembershipsCsvCommandTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.science = Faculty.objects.create(name="Faculty of Science")
+        cls.arts = Faculty.objects.create(name="Faculty of Arts")
+        cls.science_club = Association.objects.create(name="Science Students Association", faculty=cls.science)
+        cls.arts_club = Association.objects.create(name="Arts Students Association", faculty=cls.arts)
+        cls.chess = Association.objects.create(name="Chess Club")
+        cls.members = [
+            Member.objects.create(
+                first_name=f"Enrol{i}",
+                last_name="Student",
+                email=f"enrol{i}@example.com",
+                phone=f"07000017{i:02d}",
+                registration_number=f"223-063012-17{i}",
+                member_type="student",
+                faculty=cls.science,
+            )
+            for i in range(4)
+        ]
+
+    def _write_csv(self, content):
+        handle = tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False, encoding="utf-8")
+        handle.write(content)
+        handle.close()
+        self.addCleanup(lambda: os.path.exists(handle.name) and os.remove(handle.name))
+        return handle.name
+
+    def _import(self, content, **options):
+        out = StringIO()
+        with self.captureOnCommitCallbacks(execute=True):
+            call_command("import_memberships_csv", self._write_csv(content), stdout=out, **options)
+        return out.getvalue()
+
+    def test_enrolls_members_and_queues_welcome_emails(self):
+        output = self._import(
+            "reg_no,association_name,status\n"
+            "223-063012-170,Science Students Association,\n"
+            "223-063012-171,science students association,inactive\n"
+            "223-063012-172,Chess Club,active\n"
+        )
+
+        self.assertIn("Created: 3", output)
+        memberships = Membership.objects.order_by("member__registration_number")
+        self.assertEqual(
+            list(memberships.values_list("member_id", "association_id", "status")),
+            [
+                (self.members[0].pk, self.science_club.pk, "active"),
+                (self.members[1].pk, self.science_club.pk, "inactive"),
+                (self.members[2].pk, self.chess.pk, "active"),
+            ],
+        )
+        self.assertTrue(all(m.subscription_anchor_date for m in memberships))
+        self.assertEqual(
+            sorted(EmailOutbox.objects.values_list("to_email", flat=True)),
+            ["enrol0@example.com", "enrol1@example.com", "enrol2@example.com"],
+        )
+
+    def test_faculty_rule_and_lookups_are_checked_per_row(self):
+        Membership.objects.create(member=self.members[0], association=self.science_club)
+        output = self._import(
+            "registration_number,association\n"
+            "223-063012-170,Science Students Association\n"  # already enrolled
+            "223-063012-170,Chess Club\n"
+            "223-063012-171,Arts Students Association\n"  # member's faculty is Science
+            "223-063012-172,Science Students Association\n"
+            "223-063012-172,Science Students Association\n"  # repeated in the file
+            "223-063012-999,Chess Club\n"
+            "223-063012-173,Drama Club\n"
+            "223-063012-173,Chess Club,\n"
+        )
+
+        self.assertIn("Created: 3", output)
+        self.assertIn("Already enrolled: 2", output)
+        self.assertIn("Skipped: 3", output)
+        self.assertIn("Line 4: Member you are trying to add belongs to another faculty-based group.", output)
+        self.assertIn("Line 7: No member with registration number 223-063012-999.", output)
+        self.assertIn("Line 8: Association not found: Drama Club", output)
+        self.assertEqual(Membership.objects.count(), 4)
+
+    def test_membership_of_another_faculty_blocks_enrollment(self):
+        # Joined the Arts association before moving to the Faculty of Science.
+        Member.objects.filter(pk=self.members[3].pk).update(faculty=self.arts)
+        Membership.objects.create(member=self.members[3], association=self.arts_club)
+        Member.objects.filter(pk=self.members[3].pk).update(faculty=self.science)
+
+        output = self._import(
+            "registration_number,association\n"
+            "223-063012-173,Science Students Association\n"
+            "223-063012-172,Science Students Association\n"
+        )
+        self.assertIn(
+            "Line 2: Member you are trying to add belongs to a faculty-based association "
+            "(Arts Students Association - Faculty of Arts).",
+            output,
+        )
+        self.assertIn("Created: 1", output)
+        self.assertFalse(Membership.objects.filter(member=self.members[3], association=self.science_club).exists())
+
+    def test_dry_run_does_not_commit(self):
+        output = self._import("registration_number,association\n223-063012-170,Chess Club\n", dry_run=True)
+        self.assertIn("DRY-RUN enrollment summary", output)
+        self.assertFalse(Membership.objects.exists())
+        self.assertFalse(EmailOutbox.objects.exists())
+
+    def test_query_count_does_not_grow_with_rows(self):
+        rows = "".join(f"{m.registration_number},Chess Club\n" for m in self.members)
+        with CaptureQueriesContext(connection) as ctx:
+            self._import("registration_number,association\n" + rows)
+        # associations, members, their memberships, the insert and the outbox insert
+        # (plus savepoints), however many rows the chunk has.
+        writes = [q for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertLessEqual(len(writes), 5, [q["sql"] for q in writes])
+        self.assertEqual(Membership.objects.filter(association=self.chess).count(), 4)
@@ -0,0 +1,118 @@
+from datetime import date, datetime
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from campus_nexus.models import (
+    Association,
+    AssociationAdmin,
+    AssociationMonthlyLedger,
+    Expense,
+    Member,
+    Membership,
+    Payment,
+)
+from campus_nexus.templatetags.dashboard_tags import _monthly_trend, association_dashboard_data
+
+
+def _aware(year, month, day):
+    return timezone.make_aware(datetime(year, month, day, 12, 0))
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class MonthlyLedgerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Ledger Association")
+        member = Member.objects.create(
+            first_name="Led",
+            last_name="Ger",
+            email="led.ger@example.com",
+            phone="0700000601",
+            registration_number="223-063012-601",
+            member_type="student",
+        )
+        cls.membership = Membership.objects.create(member=member, association=cls.association)
+
+    def _row(self, month):
+        return AssociationMonthlyLedger.objects.get(association=self.association, month=month)
+
+    def _pay(self, amount, paid_at, **extra):
+        return Payment.objects.create(
+            membership=self.membership, amount_paid=Decimal(amount), paid_at=paid_at, **extra
+        )
+
+    def test_payment_and_expense_writes_update_month(self):
+        self._pay("30.00", _aware(2026, 3, 4))
+        self._pay("20.00", _aware(2026, 3, 20))
+        self._pay("99.00", _aware(2026, 3, 21), status="reversed")
+        Expense.objects.create(association=self.association, title="Chairs", amount=Decimal("15.00"), spent_at=_aware(2026, 3, 9))
+
+        row = self._row(date(2026, 3, 1))
+        self.assertEqual(row.income, Decimal("50.00"))
+        self.assertEqual(row.payment_count, 2)
+        self.assertEqual(row.expenses, Decimal("15.00"))
+        self.assertEqual(row.expense_count, 1)
+
+    def test_reverse_move_and_delete_refresh_old_and_new_month(self):
+        payment = self._pay("40.00", _aware(2026, 3, 4))
+
+        payment.paid_at = _aware(2026, 4, 2)
+        payment.save()
+        self.assertEqual(self._row(date(2026, 3, 1)).income, Decimal("0.00"))
+        self.assertEqual(self._row(date(2026, 4, 1)).income, Decimal("40.00"))
+
+        payment.status = "reversed"
+        payment.save()
+        self.assertEqual(self._row(date(2026, 4, 1)).payment_count, 0)
+
+        expense = Expense.objects.create(association=self.association, title="Tent", amount=Decimal("25.00"), spent_at=_aware(2026, 4, 9))
+        expense.delete()
+        self.assertEqual(self._row(date(2026, 4, 1)).expenses, Decimal("0.00"))
+
+    def test_rebuild_command_repairs_drift(self):
+        self._pay("40.00", _aware(2026, 3, 4))
+        Expense.objects.create(association=self.association, title="Tent", amount=Decimal("25.00"), spent_at=_aware(2026, 5, 9))
+        AssociationMonthlyLedger.objects.all().delete()
+
+        stdout = StringIO()
+        call_command("rebuild_monthly_ledger", association=self.association.id, stdout=stdout)
+
+        self.assertEqual(self._row(date(2026, 3, 1)).income, Decimal("40.00"))
+        self.assertEqual(self._row(date(2026, 5, 1)).expenses, Decimal("25.00"))
+        self.assertIn("2 ledger month(s)", stdout.getvalue())
+
+    def test_trend_cost_does_not_grow_with_months(self):
+        now = timezone.localtime()
+        self._pay("10.00", now)
+        request = RequestFactory().get("/admin/")
+        request.user = get_user_model().objects.create_user(username="ledger_admin", password="pass12345", is_staff=True)
+        AssociationAdmin.objects.create(user=request.user, association=self.association)
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = association_dashboard_data({"request": request})
+        ledger_queries = [q for q in ctx.captured_queries if "associationmonthlyledger" in q["sql"]]
+        self.assertEqual(len(ledger_queries), 1)
+        self.assertEqual(data["finance"]["this_month_collected"], Decimal("10.00"))
+
+        ledger = list(AssociationMonthlyLedger.objects.filter(association=self.association))
+        with self.assertNumQueries(0):
+            trend = _monthly_trend(ledger, months=36)
+        self.assertIn("10.0", trend["income"])
+
+    def test_deleting_association_with_payments_and_expenses(self):
+        self._pay("30.00", _aware(2026, 3, 4))
+        Expense.objects.create(association=self.association, title="Chairs", amount=Decimal("15.00"), spent_at=_aware(2026, 4, 9))
+
+        self.association.delete()
+
+        # Deferred foreign keys are only checked at commit; check them here as the commit would.
+        connection.check_constraints()
+        self.assertFalse(AssociationMonthlyLedger.objects.exists())
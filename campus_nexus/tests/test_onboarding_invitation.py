@@ -9,6 +9,7 @@ from django.test import TestCase, override_settings
 
 from campus_nexus.models import Association, AssociationAdmin
 from campus_nexus.services.onboarding import send_onboarding_invitation_email
+from campus_nexus.services.outbox import deliver_pending
 
 
 @override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
@@ -29,6 +30,7 @@ class OnboardingInvitationTests(TestCase):
             base_url="http://testserver",
         )
         self.assertTrue(sent)
+        deliver_pending()
         self.assertEqual(len(mail.outbox), 1)
 
         match = re.search(r"https?://testserver(?P<path>/reset/[^\s]+)", mail.outbox[0].body)
@@ -65,6 +67,7 @@ class CreateAssociationAdminCommandTests(TestCase):
             ],
         ):
             call_command("create_association_admin", stdout=stdout)
+        deliver_pending()
 
         user_model = get_user_model()
         user = user_model.objects.get(username="association.admin")
@@ -0,0 +1,102 @@
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from campus_nexus.models import Association, Charge, Fee, Member, Membership, Payment
+from campus_nexus.services.subscriptions import recompute_overdue_flags_for_association
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class RecomputeOverdueFlagsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Overdue Association")
+        cls.strict_fee = Fee.objects.create(
+            association=cls.association,
+            fee_type="subscription",
+            amount=Decimal("100.00"),
+            duration_months=4,
+            grace_days=0,
+        )
+        cls.lenient_fee = Fee.objects.create(
+            association=cls.association,
+            fee_type="subscription",
+            amount=Decimal("100.00"),
+            duration_months=12,
+            grace_days=10,
+        )
+        member = Member.objects.create(
+            first_name="Over",
+            last_name="Due",
+            email="over.due@example.com",
+            phone="0700000501",
+            registration_number="223-063012-501",
+            member_type="student",
+        )
+        cls.membership = Membership.objects.create(member=member, association=cls.association)
+
+    def _charge(self, fee, due_date, period_start):
+        return Charge.objects.create(
+            association=self.association,
+            membership=self.membership,
+            fee=fee,
+            purpose="subscription_fee",
+            amount_due=Decimal("100.00"),
+            due_date=due_date,
+            period_start=period_start,
+            period_end=due_date,
+        )
+
+    def test_grace_days_and_balance_drive_overdue_flag(self):
+        today = date(2026, 6, 10)
+        strict = self._charge(self.strict_fee, date(2026, 6, 5), date(2026, 2, 6))
+        lenient = self._charge(self.lenient_fee, date(2026, 6, 5), date(2025, 6, 6))
+        paid_off = self._charge(self.strict_fee, date(2026, 6, 1), date(2026, 2, 2))
+        Payment.objects.create(charge=paid_off, membership=self.membership, amount_paid=Decimal("100.00"))
+
+        changed = recompute_overdue_flags_for_association(self.association.id, today=today)
+        self.assertEqual(changed, 1)
+
+        strict.refresh_from_db()
+        lenient.refresh_from_db()
+        paid_off.refresh_from_db()
+        self.assertTrue(strict.is_overdue)
+        self.assertFalse(lenient.is_overdue)
+        self.assertFalse(paid_off.is_overdue)
+        self.assertEqual(paid_off.status, "paid")
+
+    def test_dry_run_reports_without_writing(self):
+        charge = self._charge(self.strict_fee, date(2026, 6, 5), date(2026, 2, 6))
+        Payment.objects.create(charge=charge, membership=self.membership, amount_paid=Decimal("40.00"))
+        Charge.objects.filter(pk=charge.pk).update(status="unpaid", amount_paid=0)
+
+        changed = recompute_overdue_flags_for_association(
+            self.association.id, today=date(2026, 6, 10), dry_run=True
+        )
+        self.assertEqual(changed, 1)
+        charge.refresh_from_db()
+        self.assertEqual(charge.status, "unpaid")
+        self.assertFalse(charge.is_overdue)
+
+    def test_only_written_changes_invalidate_dashboards(self):
+        self._charge(self.strict_fee, date(2026, 6, 5), date(2026, 2, 6))
+        today = date(2026, 6, 10)
+
+        with mock.patch("campus_nexus.services.subscriptions.invalidate_dashboards") as invalidate:
+            recompute_overdue_flags_for_association(self.association.id, today=today, dry_run=True)
+            invalidate.assert_not_called()
+            recompute_overdue_flags_for_association(self.association.id, today=today)
+            recompute_overdue_flags_for_association(self.association.id, today=today)
+        invalidate.assert_called_once_with(self.association.id)
+
+    def test_statement_count_is_independent_of_charge_count(self):
+        for i in range(5):
+            self._charge(self.strict_fee, date(2026, 1, 1 + i), date(2025, 9, 1 + i))
+
+        with CaptureQueriesContext(connection) as ctx:
+            recompute_overdue_flags_for_association(self.association.id, today=date(2026, 6, 10))
+        self.assertLessEqual(len(ctx.captured_queries), 8)
@@ -0,0 +1,131 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from campus_nexus.models import Association, Charge, EmailOutbox, Fee, Member, Membership, Payment, PaymentReminderLog
+from campus_nexus.services.reminders import send_payment_reminders
+
+TODAY = date(2026, 6, 10)
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SendPaymentRemindersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Reminder Association")
+        cls.fee = Fee.objects.create(
+            association=cls.association,
+            fee_type="subscription",
+            amount=Decimal("100.00"),
+            duration_months=4,
+            grace_days=2,
+            reminder_days_before_due=[7, 3],
+        )
+        cls.memberships = []
+        for i in range(4):
+            member = Member.objects.create(
+                first_name=f"Remind{i}",
+                last_name="Me",
+                email=f"remind{i}@example.com" if i else "",
+                phone=f"07000006{i:02d}",
+                registration_number=f"223-063012-6{i:02d}",
+                member_type="student",
+            )
+            cls.memberships.append(Membership.objects.create(member=member, association=cls.association))
+        EmailOutbox.objects.all().delete()  # membership welcome emails
+
+    def _charge(self, membership, due_date, cycle=0):
+        period_end = due_date + timedelta(days=120 * cycle)
+        return Charge.objects.create(
+            association=self.association,
+            membership=membership,
+            fee=self.fee,
+            purpose="subscription_fee",
+            amount_due=Decimal("100.00"),
+            due_date=due_date,
+            period_start=period_end - timedelta(days=120),
+            period_end=period_end,
+        )
+
+    def test_follows_fee_schedule_and_grace_days(self):
+        no_email = self._charge(self.memberships[0], TODAY + timedelta(days=3))
+        week_out = self._charge(self.memberships[1], TODAY + timedelta(days=7))
+        overdue = self._charge(self.memberships[2], TODAY - timedelta(days=3))  # due + 2 grace days passed yesterday
+        self._charge(self.memberships[3], TODAY + timedelta(days=5))  # not a reminder day
+        still_in_grace = self._charge(self.memberships[3], TODAY - timedelta(days=2))
+        paid_off = self._charge(self.memberships[1], TODAY + timedelta(days=3))
+        Payment.objects.create(charge=paid_off, membership=self.memberships[1], amount_paid=Decimal("100.00"))
+
+        result = send_payment_reminders(today=TODAY)
+
+        self.assertEqual(result.due["before_due"], 2)
+        self.assertEqual(result.due["overdue"], 1)
+        self.assertEqual(result.missing_email, 1)
+        self.assertEqual(result.queued, 2)
+        self.assertEqual(result.delivery.sent, 2)
+        self.assertEqual(
+            set(PaymentReminderLog.objects.values_list("charge_id", "reminder_type")),
+            {(week_out.pk, "before_due"), (overdue.pk, "overdue")},
+        )
+        self.assertFalse(PaymentReminderLog.objects.filter(charge__in=[no_email, still_in_grace]).exists())
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), ["remind1@example.com", "remind2@example.com"])
+
+    def test_dry_run_counts_separately(self):
+        self._charge(self.memberships[1], TODAY + timedelta(days=3))
+
+        result = send_payment_reminders(today=TODAY, dry_run=True)
+
+        self.assertEqual((result.would_queue, result.queued), (1, 0))
+        self.assertFalse(EmailOutbox.objects.exists())
+
+    def test_rerun_same_day_sends_nothing(self):
+        self._charge(self.memberships[1], TODAY + timedelta(days=3))
+        send_payment_reminders(today=TODAY)
+
+        again = send_payment_reminders(today=TODAY)
+
+        self.assertEqual(again.total_due, 0)
+        self.assertEqual(PaymentReminderLog.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_emails_queued_by_an_earlier_run_are_not_counted(self):
+        charge = self._charge(self.memberships[1], TODAY + timedelta(days=3))
+        send_payment_reminders(today=TODAY, deliver=False)
+        PaymentReminderLog.objects.filter(charge=charge).delete()  # e.g. an overlapping run's log not yet visible
+
+        again = send_payment_reminders(today=TODAY, deliver=False)
+
+        self.assertEqual(again.total_due, 1)
+        self.assertEqual(again.queued, 0)
+        self.assertEqual(EmailOutbox.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_charges(self):
+        def measure(n):
+            Charge.objects.all().delete()
+            for i in range(n):
+                self._charge(self.memberships[1 + i % 3], TODAY + timedelta(days=3), cycle=i)
+            with CaptureQueriesContext(connection) as ctx:
+                send_payment_reminders(today=TODAY, deliver=False, batch_size=100)
+            return len(ctx.captured_queries)
+
+        self.assertEqual(measure(2), measure(12))
+
+    def test_command_dry_run_writes_nothing(self):
+        self._charge(self.memberships[1], TODAY + timedelta(days=3))
+        stdout = StringIO()
+
+        call_command("send_payment_reminders", dry_run=True, stdout=stdout)
+
+        output = stdout.getvalue()
+        self.assertIn("DRY-RUN", output)
+        self.assertIn("charges/s", output)
+        self.assertIn("Would queue:", output)
+        self.assertNotIn("Queued:", output)
+        self.assertFalse(PaymentReminderLog.objects.exists())
+        self.assertFalse(EmailOutbox.objects.exists())
@@ -0,0 +1,116 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from campus_nexus.models import (
+    Association,
+    Bill,
+    BillableItem,
+    BillMembership,
+    Charge,
+    EmailOutbox,
+    Member,
+    Membership,
+    Payment,
+)
+from campus_nexus.services.outbox import deliver_pending
+from campus_nexus.services.payments import post_payment
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend", DASHBOARD_CACHE_TTL=0)
+class PostPaymentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Posting Association")
+        member = Member.objects.create(
+            first_name="Post",
+            last_name="Payment",
+            email="post.payment@example.com",
+            phone="0700000901",
+            registration_number="223-063012-901",
+            member_type="student",
+        )
+        cls.membership = Membership.objects.create(member=member, association=cls.association)
+        item = BillableItem.objects.create(association=cls.association, name="Dinner", amount=Decimal("100.00"))
+        bill = Bill.objects.create(association=cls.association, billable_item=item, amount=Decimal("100.00"), status="active")
+        cls.bill_membership = BillMembership.objects.create(
+            bill=bill, membership=cls.membership, amount_due=Decimal("100.00")
+        )
+        cls.charge = Charge.objects.create(
+            association=cls.association,
+            membership=cls.membership,
+            bill_membership=cls.bill_membership,
+            purpose="other",
+            title="Dinner",
+            amount_due=Decimal("100.00"),
+        )
+
+    def _payment(self, amount, charge=None):
+        return Payment(membership=self.membership, charge=charge or self.charge, amount_paid=Decimal(amount))
+
+    def test_updates_charge_and_bill_membership_and_sends_one_email(self):
+        post_payment(self._payment("100.00"))
+        deliver_pending()
+
+        self.charge.refresh_from_db()
+        self.bill_membership.refresh_from_db()
+        self.assertEqual(self.charge.amount_paid, Decimal("100.00"))
+        self.assertEqual(self.charge.status, "paid")
+        self.assertEqual(self.bill_membership.status, "paid")
+        receipts = [m for m in mail.outbox if m.subject.startswith("Payment received")]
+        self.assertEqual(len(receipts), 1)
+        self.assertIn("Remaining Balance: 0", receipts[0].body)
+
+    def test_query_count_is_independent_of_payment_history(self):
+        def measure():
+            with CaptureQueriesContext(connection) as ctx:
+                post_payment(self._payment("1.00"), notify=False)
+            return len(ctx.captured_queries)
+
+        post_payment(self._payment("1.00"), notify=False)  # creates this month's ledger row
+        first = measure()
+        for _ in range(10):
+            post_payment(self._payment("1.00"), notify=False)
+        self.assertEqual(measure(), first)
+        self.assertLessEqual(first, 16)
+
+    def test_moving_payment_refreshes_previous_charge(self):
+        other = Charge.objects.create(
+            association=self.association,
+            membership=self.membership,
+            purpose="other",
+            title="T-shirt",
+            amount_due=Decimal("50.00"),
+        )
+        payment = post_payment(self._payment("40.00"), notify=False)
+
+        payment.charge = other
+        post_payment(payment)
+
+        self.charge.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.charge.amount_paid, Decimal("0.00"))
+        self.assertEqual(self.charge.status, "unpaid")
+        self.assertEqual(other.amount_paid, Decimal("40.00"))
+        self.assertEqual(other.status, "partial")
+
+    def test_api_create_uses_posting_service(self):
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user(username="api_user", password="pass12345"))
+
+        response = client.post(
+            reverse("payment-list"),
+            {"membership": self.membership.pk, "charge": self.charge.pk, "amount_paid": "60.00"},
+        )
+        self.assertEqual(response.status_code, 201, response.content)
+
+        self.charge.refresh_from_db()
+        self.assertEqual(self.charge.status, "partial")
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(EmailOutbox.objects.filter(subject__startswith="Payment received").count(), 1)
@@ -0,0 +1,119 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from campus_nexus.models import Association, Charge, Fee, Member, Membership
+from campus_nexus.services.subscriptions import cycle_bounds, ensure_current_subscription_charge, roll_subscription_cycles
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class RollSubscriptionCyclesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.association = Association.objects.create(name="Coders Club")
+        cls.other_association = Association.objects.create(name="No Fee Club")
+        cls.fee = Fee.objects.create(
+            association=cls.association,
+            fee_type="subscription",
+            amount=Decimal("10000.00"),
+            duration_months=4,
+            grace_days=5,
+        )
+        cls.memberships = []
+        for i in range(3):
+            member = Member.objects.create(
+                first_name=f"Roll{i}",
+                last_name="Member",
+                email=f"roll{i}@example.com",
+                phone=f"07000004{i:02d}",
+                registration_number=f"223-063012-4{i:02d}",
+                member_type="student",
+            )
+            cls.memberships.append(
+                Membership.objects.create(
+                    member=member,
+                    association=cls.association,
+                    subscription_anchor_date=date(2026, 1, 1),
+                )
+            )
+        Membership.objects.create(member=member, association=cls.other_association)
+
+    def test_creates_missing_current_cycle_charges_once(self):
+        today = date(2026, 6, 10)
+        existing_start, existing_end = cycle_bounds(date(2026, 1, 1), 4, today)
+        Charge.objects.create(
+            association=self.association,
+            membership=self.memberships[0],
+            fee=self.fee,
+            purpose="subscription_fee",
+            amount_due=self.fee.amount,
+            period_start=existing_start,
+            period_end=existing_end,
+        )
+
+        result = roll_subscription_cycles(today=today)
+        self.assertEqual(result.associations, 1)
+        self.assertEqual(result.memberships, 3)
+        self.assertEqual(result.created, 2)
+
+        charge = Charge.objects.get(membership=self.memberships[1], fee=self.fee)
+        self.assertEqual(charge.period_start, date(2026, 5, 1))
+        self.assertEqual(charge.period_end, date(2026, 8, 31))
+        self.assertEqual(charge.due_date, date(2026, 9, 5))
+        self.assertEqual(charge.balance, Decimal("10000.00"))
+
+        again = roll_subscription_cycles(today=today)
+        self.assertEqual(again.created, 0)
+        self.assertEqual(Charge.objects.filter(fee=self.fee).count(), 3)
+
+    def test_rows_skipped_as_conflicts_are_not_counted(self):
+        today = date(2026, 6, 10)
+        start, end = cycle_bounds(date(2026, 1, 1), 4, today)
+
+        def concurrent_insert(*args):
+            # Another run creates the first membership's cycle charge after the read.
+            if not Charge.objects.exists():
+                Charge.objects.create(
+                    association=self.association, membership=self.memberships[0], fee=self.fee,
+                    purpose="subscription_fee", amount_due=self.fee.amount, period_start=start, period_end=end,
+                )
+            return cycle_bounds(*args)
+
+        with mock.patch("campus_nexus.services.subscriptions.cycle_bounds", side_effect=concurrent_insert):
+            result = roll_subscription_cycles(today=today)
+
+        self.assertEqual(result.created, 2)
+        self.assertEqual(Charge.objects.filter(fee=self.fee, period_start=start, period_end=end).count(), 3)
+
+    def test_invalidates_dashboards_of_associations_with_new_charges(self):
+        with mock.patch("campus_nexus.services.subscriptions.invalidate_dashboards") as invalidate:
+            roll_subscription_cycles(today=date(2026, 6, 10))
+            invalidate.assert_called_with(self.association.id)
+            self.assertEqual({c.args for c in invalidate.call_args_list}, {(self.association.id,)})
+
+            invalidate.reset_mock()
+            roll_subscription_cycles(today=date(2026, 6, 10))
+        invalidate.assert_not_called()
+
+    def test_matches_ensure_current_subscription_charge(self):
+        roll_subscription_cycles()
+        charge = ensure_current_subscription_charge(self.memberships[2])
+        self.assertEqual(Charge.objects.filter(membership=self.memberships[2]).count(), 1)
+        self.assertEqual(charge.purpose, "subscription_fee")
+
+    def test_insert_count_does_not_grow_with_memberships(self):
+        with CaptureQueriesContext(connection) as ctx:
+            roll_subscription_cycles(association_id=self.association.id)
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 1)
+
+    def test_command_reports_summary(self):
+        stdout = StringIO()
+        call_command("roll_subscription_cycles", stdout=stdout)
+        self.assertIn("Charges created: 3", stdout.getvalue())
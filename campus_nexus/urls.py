@@ -11,7 +11,8 @@ from .views import (
     CabinetListView, CabinetDetailView,
     PaymentListView, PaymentDetailView,
     MembershipListView, MembershipDetailView,
-    FeeListView, FeeDetailView, CabinetMemberListView, CabinetMemberDetailView, FeedbackListView, FeedbackDetailView
+    FeeListView, FeeDetailView, CabinetMemberListView, CabinetMemberDetailView, FeedbackListView, FeedbackDetailView,
+    SyncView, MemberBulkView, MembershipBulkView, PaymentBulkView,
 )
 
 urlpatterns = [
@@ -30,6 +31,7 @@ urlpatterns = [
 
     # Members
     path('members/', MemberListView.as_view(), name='member-list'),
+    path('members/bulk/', MemberBulkView.as_view(), name='member-bulk'),
     path('members/<int:pk>/', MemberDetailView.as_view(), name='member-detail'),
 
     # Events
@@ -46,10 +48,12 @@ urlpatterns = [
 
     # Payments
     path('payments/', PaymentListView.as_view(), name='payment-list'),
+    path('payments/bulk/', PaymentBulkView.as_view(), name='payment-bulk'),
     path('payments/<int:pk>/', PaymentDetailView.as_view(), name='payment-detail'),
 
     # Memberships
     path('memberships/', MembershipListView.as_view(), name='membership-list'),
+    path('memberships/bulk/', MembershipBulkView.as_view(), name='membership-bulk'),
     path('memberships/<int:pk>/', MembershipDetailView.as_view(), name='membership-detail'),
 
     # Fees
@@ -59,6 +63,9 @@ urlpatterns = [
     # Feedback
     path('feedbacks/', FeedbackListView.as_view(), name='feedback-list'),
     path('feedbacks/<int:pk>/', FeedbackDetailView.as_view(), name='feedback-detail'),
+
+    # Offline sync
+    path('sync/', SyncView.as_view(), name='sync'),
 ]
 
 # serve media files in dev (images like logos/receipts)
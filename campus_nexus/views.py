@@ -1,22 +1,38 @@
 from rest_framework import generics, status
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from campus_nexus.authentication import CachedJWTAuthentication
 from rest_framework.parsers import MultiPartParser, FormParser
 
 from campus_nexus.models import (
     Faculty, Course, Association, Member,
-    Cabinet, Payment, Event, Membership, Fee, Feedback
+    Cabinet, CabinetMember, Payment, Event, Membership, Fee, Feedback
 )
+from campus_nexus import filters
+from campus_nexus.bulk import BulkWriteView
+from campus_nexus.conditional import ConditionalGetMixin
+from campus_nexus.idempotency import IdempotentPostMixin
+from campus_nexus.pagination import IdCursorPagination
+from campus_nexus.query_optimizer import SerializerQueryOptimizerMixin, optimize_for_serializer
 from campus_nexus.serializers import ( CabinetMemberSerializer,
     FacultySerializer, CourseSerializer, AssociationSerializer, MemberSerializer,
-    CabinetSerializer, PaymentSerializer, EventSerializer, MembershipSerializer, FeeSerializer, FeedbackSerializer
+    CabinetSerializer, PaymentSerializer, EventSerializer, MembershipSerializer, FeeSerializer, FeedbackSerializer,
+    ChargeSerializer,
 )
+from campus_nexus.services.dashboard_cache import invalidate_dashboards
+from campus_nexus.services.membership_emails import queue_membership_assigned_emails
+from campus_nexus.services.payments import payment_scope, post_payments
+from campus_nexus.services.sync import SYNC_MODELS, SyncCursor, SyncCursorExpired, record_tombstones, sync_changes
 
 import hmac
+from collections import defaultdict
 import hashlib
 import subprocess
 import os
 from django.http import HttpResponse, HttpResponseForbidden
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 
 # This secret MUST match your GitHub webhook secret
@@ -46,9 +62,10 @@ def github_deploy(request):
     return HttpResponse(" Deployment started", status=200)
 
 
-# Base view with JWT + IsAuthenticated
-class BaseAuthenticatedView:
-    authentication_classes = (JWTAuthentication,)
+# Base view with JWT + IsAuthenticated; reads are shaped by the serializer (see query_optimizer)
+# and answer conditional GETs with 304 when nothing changed (see conditional)
+class BaseAuthenticatedView(ConditionalGetMixin, SerializerQueryOptimizerMixin):
+    authentication_classes = (CachedJWTAuthentication,)
     permission_classes = (IsAuthenticated,)
 
 
@@ -56,6 +73,7 @@ class BaseAuthenticatedView:
 class FacultyListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Faculty.objects.all()
     serializer_class = FacultySerializer
+    filterset_class = filters.FacultyFilterSet
 
 
 class FacultyDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -67,6 +85,7 @@ class FacultyDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPI
 class CourseListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
+    filterset_class = filters.CourseFilterSet
 
 
 class CourseDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -78,6 +97,7 @@ class CourseDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIV
 class AssociationListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Association.objects.all()
     serializer_class = AssociationSerializer
+    filterset_class = filters.AssociationFilterSet
     parser_classes = (MultiPartParser, FormParser)  # handle logo upload
 
 
@@ -91,6 +111,7 @@ class AssociationDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestro
 class MemberListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Member.objects.all()
     serializer_class = MemberSerializer
+    filterset_class = filters.MemberFilterSet
 
 
 class MemberDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -102,6 +123,7 @@ class MemberDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIV
 class CabinetListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Cabinet.objects.all()
     serializer_class = CabinetSerializer
+    filterset_class = filters.CabinetFilterSet
 
 
 class CabinetDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -110,17 +132,20 @@ class CabinetDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPI
 
 # -Cabinet Member
 class CabinetMemberListView(BaseAuthenticatedView, generics.ListCreateAPIView):
-    queryset = Cabinet.objects.all()
+    queryset = CabinetMember.objects.all()
     serializer_class = CabinetMemberSerializer
+    filterset_class = filters.CabinetMemberFilterSet
 
 class CabinetMemberDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
-    queryset = Cabinet.objects.all()
+    queryset = CabinetMember.objects.all()
     serializer_class = CabinetMemberSerializer
 
 #  Payment
-class PaymentListView(BaseAuthenticatedView, generics.ListCreateAPIView):
+# Retried POSTs with the same Idempotency-Key replay the first response (see idempotency)
+class PaymentListView(IdempotentPostMixin, BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Payment.objects.all()
     serializer_class = PaymentSerializer
+    filterset_class = filters.PaymentFilterSet
     parser_classes = (MultiPartParser, FormParser)  # handle receipt upload
 
 
@@ -134,6 +159,7 @@ class PaymentDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPI
 class EventListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
+    filterset_class = filters.EventFilterSet
 
 
 class EventDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -145,6 +171,7 @@ class EventDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIVi
 class MembershipListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Membership.objects.all()
     serializer_class = MembershipSerializer
+    filterset_class = filters.MembershipFilterSet
 
 
 class MembershipDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -156,6 +183,7 @@ class MembershipDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroy
 class FeeListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Fee.objects.all()
     serializer_class = FeeSerializer
+    filterset_class = filters.FeeFilterSet
 
 
 class FeeDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
@@ -167,7 +195,134 @@ class FeeDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView
 class FeedbackListView(BaseAuthenticatedView, generics.ListCreateAPIView):
     queryset = Feedback.objects.all()
     serializer_class = FeedbackSerializer
+    filterset_class = filters.FeedbackFilterSet
 
 class FeedbackDetailView(BaseAuthenticatedView, generics.RetrieveUpdateDestroyAPIView):
     queryset = Feedback.objects.all()
-    serializer_class = FeedbackSerializer
\ No newline at end of file
+    serializer_class = FeedbackSerializer
+
+
+# Bulk writes (see campus_nexus.bulk)
+class BaseBulkView(BulkWriteView):
+    authentication_classes = (CachedJWTAuthentication,)
+    permission_classes = (IsAuthenticated,)
+
+
+class MemberBulkView(BaseBulkView):
+    queryset = Member.objects.all()
+    serializer_class = MemberSerializer
+
+
+class MembershipBulkView(BaseBulkView):
+    queryset = Membership.objects.all()
+    serializer_class = MembershipSerializer
+
+    def before_create(self, objs):
+        today = timezone.localdate()
+        for membership in objs:
+            if not membership.subscription_anchor_date:
+                membership.subscription_anchor_date = today
+
+    def previous_state(self, instances):
+        return {m.pk: (m.association_id, m.member_id) for m in instances}
+
+    def after_write(self, created, updated, previous):
+        queue_membership_assigned_emails(created)
+        associations = {m.association_id for m in (*created, *updated)}
+        # A membership moved to another association (or member) leaves the old association's
+        # dashboards and sync scope, as a delete there would.
+        left_memberships, left_members = defaultdict(list), defaultdict(list)
+        for membership in updated:
+            old_association_id, old_member_id = previous[membership.pk]
+            if old_association_id != membership.association_id:
+                associations.add(old_association_id)
+                left_memberships[old_association_id].append(membership.pk)
+            if (old_association_id, old_member_id) != (membership.association_id, membership.member_id):
+                left_members[old_association_id].append(old_member_id)
+        for association_id, ids in left_memberships.items():
+            record_tombstones(association_id, "membership", *ids)
+        for association_id, ids in left_members.items():
+            record_tombstones(association_id, "member", *ids)
+        for association_id in associations:
+            invalidate_dashboards(association_id)
+
+
+class PaymentBulkView(IdempotentPostMixin, BaseBulkView):
+    # Writes skip post_payment(); post_payments() does the same work once for the batch.
+    queryset = Payment.objects.select_related("membership")
+    serializer_class = PaymentSerializer
+
+    def previous_state(self, instances):
+        return payment_scope(instances)
+
+    def after_write(self, created, updated, previous):
+        post_payments(created, updated, previous_scope=previous)
+
+
+# Sync
+class SyncView(APIView):
+    """
+    Delta feed for offline clients: `GET /sync/?cursor=<opaque>` returns the members,
+    memberships, charges and payments of the caller's association that were created,
+    updated or deleted after the cursor, in change order. Start without a cursor, keep
+    calling with the returned one while `has_more`, and store it for the next sync.
+    A cursor older than the tombstone retention gets 410: drop the local copy and start over.
+    Superusers pick the association with `?association=`.
+    """
+    authentication_classes = (CachedJWTAuthentication,)
+    permission_classes = (IsAuthenticated,)
+    serializer_classes = {
+        "member": MemberSerializer,
+        "membership": MembershipSerializer,
+        "charge": ChargeSerializer,
+        "payment": PaymentSerializer,
+    }
+
+    def get_association_id(self, request):
+        assoc_admin = getattr(request.user, "association_admin", None)
+        if assoc_admin is not None:
+            return assoc_admin.association_id
+        if request.user.is_superuser:
+            association_id = request.query_params.get("association", "")
+            if not association_id.isdigit():
+                raise ValidationError({"association": "Pass the association id to sync."})
+            return int(association_id)
+        raise PermissionDenied("Only association admins can sync association data.")
+
+    def get(self, request):
+        association_id = self.get_association_id(request)
+        cursor = None
+        token = request.query_params.get("cursor")
+        if token:
+            try:
+                cursor = SyncCursor.decode(token)
+            except ValueError as exc:
+                raise ValidationError({"cursor": str(exc)})
+
+        try:
+            page = sync_changes(association_id, cursor, limit=IdCursorPagination().get_page_size(request))
+        except SyncCursorExpired as exc:
+            return Response({"detail": str(exc), "resync_required": True}, status=status.HTTP_410_GONE)
+
+        wanted = {}
+        for op, kind, object_id in page.changes:
+            if op == "upsert":
+                wanted.setdefault(kind, []).append(object_id)
+        rows = {}
+        context = {"request": request}
+        for kind, ids in wanted.items():
+            serializer_class = self.serializer_classes[kind]
+            queryset = optimize_for_serializer(SYNC_MODELS[kind].objects.filter(pk__in=ids), serializer_class)
+            rows[kind] = {row["id"]: row for row in serializer_class(queryset, many=True, context=context).data}
+
+        changes = []
+        for op, kind, object_id in page.changes:
+            change = {"op": op, "type": kind, "id": object_id}
+            if op == "upsert":
+                if object_id not in rows[kind]:
+                    continue  # deleted since the feed was read; its tombstone follows
+                change["data"] = rows[kind][object_id]
+            changes.append(change)
+
+        return Response({"changes": changes, "cursor": page.cursor.encode(), "has_more": page.has_more})
+
@@ -1,3 +1,4 @@
+from importlib.util import find_spec
 from pathlib import Path
 import os
 
@@ -62,6 +63,15 @@ CACHES = {
     }
 }
 
+# Admin index dashboard snapshots: served from cache for DASHBOARD_CACHE_TTL seconds (0 disables),
+# then served stale for up to DASHBOARD_CACHE_STALE_SECONDS while one request rebuilds them.
+DASHBOARD_CACHE_TTL = int(os.getenv("DASHBOARD_CACHE_TTL", "300"))
+DASHBOARD_CACHE_STALE_SECONDS = int(os.getenv("DASHBOARD_CACHE_STALE_SECONDS", "600"))
+
+# API authentication reads the JWT's user (with their association admin / guild / dean rows)
+# from cache for AUTH_USER_CACHE_TTL seconds (0 disables); changes to those rows drop the entry.
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "60"))
+
 ROOT_URLCONF = "core.urls"
 
 TEMPLATES = [
@@ -108,13 +118,56 @@ MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# JSON goes through orjson when it is installed; application/msgpack is offered when msgpack is.
+API_RENDERER_CLASSES = ["rest_framework.renderers.JSONRenderer", "rest_framework.renderers.BrowsableAPIRenderer"]
+API_PARSER_CLASSES = [
+    "rest_framework.parsers.JSONParser",
+    "rest_framework.parsers.FormParser",
+    "rest_framework.parsers.MultiPartParser",
+]
+if find_spec("orjson") is not None:
+    API_RENDERER_CLASSES[0] = "campus_nexus.renderers.FastJSONRenderer"
+    API_PARSER_CLASSES[0] = "campus_nexus.renderers.FastJSONParser"
+if find_spec("msgpack") is not None:
+    API_RENDERER_CLASSES.append("campus_nexus.renderers.MessagePackRenderer")
+    API_PARSER_CLASSES.append("campus_nexus.renderers.MessagePackParser")
+
 REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": API_RENDERER_CLASSES,
+    "DEFAULT_PARSER_CLASSES": API_PARSER_CLASSES,
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "campus_nexus.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_PAGINATION_CLASS": "campus_nexus.pagination.IdCursorPagination",
+    "DEFAULT_FILTER_BACKENDS": (
+        "campus_nexus.filters.FilterSetBackend",
+        "campus_nexus.filters.FilterSetOrderingFilter",
+    ),
 }
 
+# API list endpoints use cursor pagination: API_PAGE_SIZE rows per page by default,
+# clients may ask for up to API_MAX_PAGE_SIZE with ?page_size=.
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "500"))
+
+# <resource>/bulk/ endpoints accept up to API_BULK_MAX_ITEMS items per request and
+# write them API_BULK_BATCH_SIZE rows per INSERT / UPDATE.
+API_BULK_MAX_ITEMS = int(os.getenv("API_BULK_MAX_ITEMS", "5000"))
+API_BULK_BATCH_SIZE = int(os.getenv("API_BULK_BATCH_SIZE", "500"))
+
+# POSTs sent with an Idempotency-Key header replay their stored response for this long;
+# `purge_idempotency_keys` deletes expired keys.
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+
+# /sync/ leaves changes younger than this for the next call, so rows written by a
+# transaction that commits late never land behind a cursor already handed out.
+SYNC_SETTLE_SECONDS = int(os.getenv("SYNC_SETTLE_SECONDS", "5"))
+
+# `purge_sync_tombstones` deletes sync tombstones older than this; /sync/ answers cursors
+# that have not caught up within it with 410 so the client starts a full resync.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
 
 
 # Jazzmin Settings